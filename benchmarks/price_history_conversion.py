@@ -0,0 +1,97 @@
+"""Benchmark of the conversion of price bars into an asset price history.
+
+Compares the row-by-row conversion the tool used to do with the column-wise
+conversion of `build_asset_price_history`, e.g.:
+
+    uv run python -m benchmarks.price_history_conversion
+"""
+
+import sys
+import timeit
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from technical_analysis_mcp.models import AssetPriceHistory, Price
+from technical_analysis_mcp.tools.fetch_asset_price_history import build_asset_price_history
+
+_ROWS = [10_000, 100_000]
+_REPEATS = 5
+
+
+def make_bars(rows: int) -> pd.DataFrame:
+    """Build random five-minute bars.
+
+    Args:
+        rows: The number of bars.
+
+    Returns:
+        The bars indexed by timestamp.
+
+    """
+    generator = np.random.default_rng(seed=0)
+    closes = 100.0 + generator.standard_normal(rows).cumsum()
+
+    return pd.DataFrame(
+        {
+            "Open": closes,
+            "High": closes + 1.0,
+            "Low": closes - 1.0,
+            "Close": closes,
+            "Volume": generator.integers(1_000, 1_000_000, rows),
+            "Dividends": np.zeros(rows),
+            "Stock Splits": np.zeros(rows),
+        },
+        index=pd.date_range("2020-01-02 09:30", periods=rows, freq="5min", tz="America/New_York", name="Date"),
+    )
+
+
+def build_row_by_row(data: pd.DataFrame) -> AssetPriceHistory:
+    """Convert price bars one validated row at a time, as the tool used to do.
+
+    Args:
+        data: The bars indexed by timestamp.
+
+    Returns:
+        The historical asset prices.
+
+    """
+    prices = [
+        Price(
+            date=datetime.fromisoformat(str(index)),
+            open=float(row["Open"]),
+            high=float(row["High"]),
+            low=float(row["Low"]),
+            close=float(row["Close"]),
+            volume=int(row["Volume"]),
+            dividends=float(row["Dividends"]),
+            stock_splits=float(row["Stock Splits"]),
+        )
+        for index, row in data.iterrows()
+    ]
+
+    return AssetPriceHistory(ticker="BENCH", period="max", interval="5m", prices=prices)
+
+
+def main() -> None:
+    """Time both conversions and write the best time of each."""
+    for rows in _ROWS:
+        data = make_bars(rows)
+        row_by_row = min(timeit.repeat(lambda data=data: build_row_by_row(data), number=1, repeat=_REPEATS))
+        column_wise = min(
+            timeit.repeat(
+                lambda data=data: build_asset_price_history("BENCH", "max", "5m", data),
+                number=1,
+                repeat=_REPEATS,
+            ),
+        )
+
+        sys.stdout.write(
+            f"{rows:>7} rows: row by row {row_by_row:.3f}s, column-wise {column_wise:.3f}s, "
+            f"speedup {row_by_row / column_wise:.1f}x\n",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark of the rolling highest high and lowest low.
+
+Compares the naive extrema, which scan every window, with the van
+Herk/Gil-Werman extrema of `rolling_max` and `rolling_min` that the stochastic
+oscillator, the Williams %R and the Donchian channels share, e.g.:
+
+    uv run python -m benchmarks.rolling_extrema
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import numpy.typing as npt
+
+from technical_analysis_mcp.indicators import rolling_max, rolling_min
+
+_ROWS = 100_000
+_WINDOWS = [14, 50, 200]
+_REPEATS = 5
+
+
+def make_prices(rows: int) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Build random highest and lowest prices.
+
+    Args:
+        rows: The number of bars.
+
+    Returns:
+        The highest and the lowest prices.
+
+    """
+    generator = np.random.default_rng(seed=0)
+    closes = 100.0 + generator.standard_normal(rows).cumsum()
+
+    return closes + 1.0, closes - 1.0
+
+
+def extrema_naive(
+    high: npt.NDArray[np.float64],
+    low: npt.NDArray[np.float64],
+    window: int,
+) -> tuple[list[float], list[float]]:
+    """Find the extrema of every window by scanning it, as a per-window loop does.
+
+    Args:
+        high: The highest prices.
+        low: The lowest prices.
+        window: The number of bars of each window.
+
+    Returns:
+        The highest high and the lowest low of each window.
+
+    """
+    highs = high.tolist()
+    lows = low.tolist()
+    count = len(highs) - window + 1
+
+    return (
+        [max(highs[i : i + window]) for i in range(count)],
+        [min(lows[i : i + window]) for i in range(count)],
+    )
+
+
+def extrema_linear(
+    high: npt.NDArray[np.float64],
+    low: npt.NDArray[np.float64],
+    window: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Find the extrema of every window in linear time.
+
+    Args:
+        high: The highest prices.
+        low: The lowest prices.
+        window: The number of bars of each window.
+
+    Returns:
+        The highest high and the lowest low of each window.
+
+    """
+    return rolling_max(high, window), rolling_min(low, window)
+
+
+def main() -> None:
+    """Time both extrema at every window and write the best time of each."""
+    high, low = make_prices(_ROWS)
+
+    for window in _WINDOWS:
+        naive = min(
+            timeit.repeat(lambda window=window: extrema_naive(high, low, window), number=1, repeat=_REPEATS),
+        )
+        linear = min(
+            timeit.repeat(lambda window=window: extrema_linear(high, low, window), number=1, repeat=_REPEATS),
+        )
+
+        sys.stdout.write(
+            f"{_ROWS} rows, window {window:>3}: naive {naive:.3f}s, linear {linear:.4f}s, "
+            f"speedup {naive / linear:.0f}x\n",
+        )
+
+
+if __name__ == "__main__":
+    main()
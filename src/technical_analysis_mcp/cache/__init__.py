@@ -0,0 +1,67 @@
+"""Caching and local storage module."""
+
+from .indicator_cache import (
+    IndicatorCacheKey,
+    find_indicator_result,
+    get_indicator_result_cache,
+    get_indicator_state_cache,
+    history_fingerprint,
+    remember_indicator_result,
+    stream_indicator,
+)
+from .information_cache import (
+    MARKET_INFORMATION_FIELDS,
+    get_market_information_cache,
+    get_static_information_cache,
+    split_information,
+)
+from .negative_cache import NegativeCacheKey, find_error, get_negative_cache, remember_error
+from .periods import period_covers, period_start_position, range_positions
+from .price_cache import (
+    PriceCacheKey,
+    find_price_bars,
+    find_price_range,
+    get_price_cache,
+    price_expiry,
+    remember_price_bars,
+)
+from .price_store import PRICE_COLUMNS, PriceStore, StoredSeries, get_price_store
+from .resampling import RESAMPLING_SOURCES, downsample_bars, resample_bars
+from .single_flight import SingleFlight
+from .ttl_cache import TtlCache
+
+__all__ = [
+    "MARKET_INFORMATION_FIELDS",
+    "PRICE_COLUMNS",
+    "RESAMPLING_SOURCES",
+    "IndicatorCacheKey",
+    "NegativeCacheKey",
+    "PriceCacheKey",
+    "PriceStore",
+    "SingleFlight",
+    "StoredSeries",
+    "TtlCache",
+    "downsample_bars",
+    "find_error",
+    "find_indicator_result",
+    "find_price_bars",
+    "find_price_range",
+    "get_indicator_result_cache",
+    "get_indicator_state_cache",
+    "get_market_information_cache",
+    "get_negative_cache",
+    "get_price_cache",
+    "get_price_store",
+    "get_static_information_cache",
+    "history_fingerprint",
+    "period_covers",
+    "period_start_position",
+    "price_expiry",
+    "range_positions",
+    "remember_error",
+    "remember_indicator_result",
+    "remember_price_bars",
+    "resample_bars",
+    "split_information",
+    "stream_indicator",
+]
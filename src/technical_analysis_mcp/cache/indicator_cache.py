@@ -0,0 +1,121 @@
+"""In-memory caches of indicator states and results."""
+
+import time
+from functools import cache
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from technical_analysis_mcp.indicators import IndicatorStart, StreamingSeries, stream_series
+from technical_analysis_mcp.models import CompactTimeSeries, TimeSeries
+from technical_analysis_mcp.settings import get_settings
+
+from .ttl_cache import TtlCache
+
+type IndicatorCacheKey = tuple[str, ...]
+
+_FINGERPRINT_FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+@cache
+def get_indicator_state_cache() -> TtlCache[IndicatorCacheKey, StreamingSeries]:
+    """Get the process-wide cache of indicator states.
+
+    Returns:
+        The cache, bounded by the configured number of entries.
+
+    """
+    return TtlCache(get_settings().indicator_cache_entries)
+
+
+@cache
+def get_indicator_result_cache() -> TtlCache[IndicatorCacheKey, TimeSeries | CompactTimeSeries]:
+    """Get the process-wide cache of indicator results.
+
+    Returns:
+        The cache, bounded by the configured number of entries.
+
+    """
+    return TtlCache(get_settings().indicator_cache_entries)
+
+
+def history_fingerprint(bars: pd.DataFrame) -> IndicatorCacheKey:
+    """Identify price bars without reading all of them.
+
+    The fingerprint changes when a bar is added or dropped, when the last bar
+    changes, e.g. the current intraday bar, and when the history is adjusted
+    for a dividend or split, which changes the first bar.
+
+    Args:
+        bars: The bars indexed by timestamp, with the columns of the upstream provider.
+
+    Returns:
+        The number of bars and the timestamps and prices of the first and last ones.
+
+    """
+    if bars.empty:
+        return ("0",)
+
+    ends = bars.iloc[[0, -1]]
+    first_timestamp, last_timestamp = pd.DatetimeIndex(ends.index).asi8.tolist()
+    first, last = ends[_FINGERPRINT_FIELDS].to_numpy(dtype=np.float64).tolist()
+
+    return (
+        str(len(bars)),
+        str(first_timestamp),
+        repr(first),
+        str(last_timestamp),
+        repr(last),
+    )
+
+
+def find_indicator_result(key: IndicatorCacheKey) -> TimeSeries | CompactTimeSeries | None:
+    """Find the result of an identical indicator request over the same bars.
+
+    Args:
+        key: The indicator, its parameters and the fingerprint of the bars.
+
+    Returns:
+        The result, or None if it is not in memory.
+
+    """
+    return get_indicator_result_cache().get(key)
+
+
+def remember_indicator_result(key: IndicatorCacheKey, result: TimeSeries | CompactTimeSeries) -> None:
+    """Keep the result of an indicator request in memory.
+
+    Args:
+        key: The indicator, its parameters and the fingerprint of the bars.
+        result: The result to return for identical requests.
+
+    """
+    get_indicator_result_cache().put(key, result, time.time() + get_settings().indicator_cache_ttl)
+
+
+def stream_indicator(
+    key: IndicatorCacheKey,
+    timestamps: npt.NDArray[np.int64],
+    prices: npt.NDArray[np.float64],
+    start: IndicatorStart,
+) -> npt.NDArray[np.float64]:
+    """Compute an indicator over a series, adding only the bars after the cached state.
+
+    Args:
+        key: The ticker, period, interval, source and parameters of the indicator.
+        timestamps: The timestamps of the bars in nanoseconds since the epoch, in chronological order.
+        prices: The prices of the bars, one per timestamp.
+        start: The computation of the indicator and its state from scratch.
+
+    Returns:
+        The indicator at every bar it is defined for.
+
+    """
+    state_cache = get_indicator_state_cache()
+    streamed, values = stream_series(state_cache.get(key), timestamps, prices, start)
+
+    if streamed is not None:
+        state_cache.put(key, streamed, time.time() + get_settings().indicator_cache_ttl)
+
+    return values
@@ -0,0 +1,64 @@
+"""In-memory caches of ticker information."""
+
+from functools import cache
+from typing import Any
+
+from technical_analysis_mcp.settings import get_settings
+
+from .ttl_cache import TtlCache
+
+# Fields of the provider information payload that move with trading. Every
+# other field, e.g. names, sector, industry or shares outstanding, is static.
+MARKET_INFORMATION_FIELDS = frozenset(
+    {
+        "previousClose",
+        "regularMarketOpen",
+        "regularMarketPrice",
+        "regularMarketVolume",
+        "marketCap",
+        "trailingPE",
+        "forwardPE",
+        "dividendYield",
+        "fiftyTwoWeekHigh",
+        "fiftyTwoWeekLow",
+        "averageVolume",
+    },
+)
+
+
+def split_information(info: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split a provider information payload into its static and market fields.
+
+    Args:
+        info: The provider information payload.
+
+    Returns:
+        The static fields and the market fields.
+
+    """
+    static = {key: value for key, value in info.items() if key not in MARKET_INFORMATION_FIELDS}
+    market = {key: value for key, value in info.items() if key in MARKET_INFORMATION_FIELDS}
+
+    return static, market
+
+
+@cache
+def get_static_information_cache() -> TtlCache[str, dict[str, Any]]:
+    """Get the process-wide cache of static ticker information fields.
+
+    Returns:
+        The cache, bounded by the configured number of entries.
+
+    """
+    return TtlCache(get_settings().information_cache_entries)
+
+
+@cache
+def get_market_information_cache() -> TtlCache[str, dict[str, Any]]:
+    """Get the process-wide cache of market ticker information fields.
+
+    Returns:
+        The cache, bounded by the configured number of entries.
+
+    """
+    return TtlCache(get_settings().information_cache_entries)
@@ -0,0 +1,50 @@
+"""In-memory cache of requests known to fail."""
+
+import time
+from functools import cache
+
+from technical_analysis_mcp.models import Error
+from technical_analysis_mcp.settings import get_settings
+
+from .ttl_cache import TtlCache
+
+type NegativeCacheKey = tuple[str, ...]
+
+
+@cache
+def get_negative_cache() -> TtlCache[NegativeCacheKey, Error]:
+    """Get the process-wide cache of errors for unknown tickers and empty histories.
+
+    Returns:
+        The cache, bounded by the configured number of entries.
+
+    """
+    return TtlCache(get_settings().negative_cache_entries)
+
+
+def find_error(symbol: str, *scope: str) -> Error | None:
+    """Find a recent error for a request for a ticker.
+
+    Args:
+        symbol: The normalized ticker symbol.
+        *scope: The tool and request parameters, e.g. period and interval, the
+            error is specific to.
+
+    Returns:
+        The error of the same request, or None.
+
+    """
+    return get_negative_cache().get((symbol, *scope))
+
+
+def remember_error(error: Error, symbol: str, *scope: str) -> None:
+    """Remember that a request for a ticker failed, for the configured time.
+
+    Args:
+        error: The error to return for the same request.
+        symbol: The normalized ticker symbol.
+        *scope: The tool and request parameters the error is specific to, e.g.
+            period and interval, so it is only returned for the same request.
+
+    """
+    get_negative_cache().put((symbol, *scope), error, time.time() + get_settings().negative_cache_ttl)
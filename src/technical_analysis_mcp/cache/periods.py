@@ -0,0 +1,125 @@
+"""Resolution of time periods over price bars."""
+
+import calendar
+from datetime import UTC, date, datetime
+
+import numpy as np
+import pandas as pd
+
+from technical_analysis_mcp.models import Period
+
+_NANOSECONDS_PER_DAY = 86_400_000_000_000
+
+_PERIOD_SESSIONS = {
+    "1d": 1,
+    "5d": 5,
+}
+
+_PERIOD_MONTHS = {
+    "1mo": 1,
+    "3mo": 3,
+    "6mo": 6,
+    "1y": 12,
+    "2y": 24,
+    "5y": 60,
+    "10y": 120,
+}
+
+_PERIOD_RANKS = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "max"]
+
+
+def period_covers(covering: Period, covered: Period) -> bool:
+    """Check whether the bars of a period always include the bars of another one.
+
+    Periods are anchored at the present, so a fetch of the covering period kept
+    up to date with the newest bars contains every bar of the covered period.
+    The year-to-date period is only comparable with periods of a year or more.
+
+    Args:
+        covering: The period that was fetched.
+        covered: The period that is requested.
+
+    Returns:
+        True if the covering period contains the covered one.
+
+    """
+    if covering == "ytd":
+        return covered == "ytd"
+
+    if covered == "ytd":
+        return _PERIOD_RANKS.index(covering) >= _PERIOD_RANKS.index("1y")
+
+    return _PERIOD_RANKS.index(covering) >= _PERIOD_RANKS.index(covered)
+
+
+def period_start_position(index: pd.DatetimeIndex, period: Period, reference: datetime) -> int:
+    """Find the position of the first bar of a period.
+
+    Day periods count trading sessions, like the upstream provider does, while
+    longer periods are calendar offsets from the start of the reference day. Days
+    are taken in the timezone of the bars.
+
+    Args:
+        index: The sorted timestamps of the bars.
+        period: The period to resolve.
+        reference: The time the period is counted back from, timezone-aware.
+
+    Returns:
+        The position of the first bar in the period, found by binary search.
+
+    """
+    if period == "max" or index.empty:
+        return 0
+
+    timestamps = (index.tz_localize(None) if index.tz is not None else index).asi8
+
+    if period in _PERIOD_SESSIONS:
+        sessions = np.unique(timestamps // _NANOSECONDS_PER_DAY)
+        count = _PERIOD_SESSIONS[period]
+
+        if len(sessions) <= count:
+            return 0
+
+        return int(np.searchsorted(timestamps, sessions[-count] * _NANOSECONDS_PER_DAY))
+
+    today = reference.astimezone(index.tz or UTC).date()
+    start = date(today.year, 1, 1) if period == "ytd" else _months_before(today, _PERIOD_MONTHS[period])
+
+    return int(np.searchsorted(timestamps, (start - date(1970, 1, 1)).days * _NANOSECONDS_PER_DAY))
+
+
+def range_positions(index: pd.DatetimeIndex, start: datetime | None, end: datetime | None) -> tuple[int, int]:
+    """Find the positions of the bars of a time range.
+
+    Args:
+        index: The sorted timezone-aware timestamps of the bars.
+        start: The timestamp of the first bar, timezone-aware, or None from the first bar.
+        end: The timestamp the bars end before, timezone-aware, or None up to the last bar.
+
+    Returns:
+        The position of the first bar in the range and the position after the
+        last one, found by binary search.
+
+    """
+    timestamps = index.asi8
+    first = 0 if start is None else int(np.searchsorted(timestamps, pd.Timestamp(start).value))
+    last = len(timestamps) if end is None else int(np.searchsorted(timestamps, pd.Timestamp(end).value))
+
+    return first, max(first, last)
+
+
+def _months_before(day: date, months: int) -> date:
+    """Move a date back a number of calendar months, clamping to the end of the month.
+
+    Args:
+        day: The date to move.
+        months: The number of months.
+
+    Returns:
+        The same day of the month, or the last one if the target month is shorter.
+
+    """
+    year, month = divmod(day.year * 12 + day.month - 1 - months, 12)
+    last_day = calendar.monthrange(year, month + 1)[1]
+
+    return date(year, month + 1, min(day.day, last_day))
@@ -0,0 +1,196 @@
+"""In-memory cache of price bars."""
+
+from datetime import UTC, datetime, time, timedelta
+from functools import cache
+
+import pandas as pd
+
+from technical_analysis_mcp.models import Interval, Period
+from technical_analysis_mcp.settings import get_settings
+
+from .periods import period_covers, period_start_position, range_positions
+from .price_store import StoredSeries
+from .resampling import RESAMPLING_SOURCES, resample_bars
+from .ttl_cache import TtlCache
+
+type PriceCacheKey = tuple[str, Interval]
+
+# Intraday bars keep changing, so they live for a fraction of the interval.
+_INTRADAY_TIME_TO_LIVE = {
+    "1m": timedelta(seconds=5),
+    "2m": timedelta(seconds=10),
+    "5m": timedelta(seconds=30),
+    "15m": timedelta(minutes=1),
+    "30m": timedelta(minutes=2),
+    "60m": timedelta(minutes=5),
+    "90m": timedelta(minutes=5),
+    "1h": timedelta(minutes=5),
+}
+
+# Daily and coarser bars only change once a session closes. The close of the US
+# equity session (16:00 in New York) is 20:00 or 21:00 UTC depending on DST.
+_SESSION_CLOSE = time(21, 0, tzinfo=UTC)
+_SATURDAY = 5
+
+
+def price_expiry(interval: Interval, now: datetime) -> datetime:
+    """Get the time cached bars stop being fresh.
+
+    Args:
+        interval: The interval between bars.
+        now: The time the bars were fetched, timezone-aware.
+
+    Returns:
+        The expiry time: a fraction of the interval for intraday bars, or the
+        next session close for daily and coarser bars.
+
+    """
+    time_to_live = _INTRADAY_TIME_TO_LIVE.get(interval)
+
+    if time_to_live is not None:
+        return now + time_to_live
+
+    close = datetime.combine(now.astimezone(UTC).date(), _SESSION_CLOSE)
+
+    while close <= now or close.weekday() >= _SATURDAY:
+        close += timedelta(days=1)
+
+    return close
+
+
+@cache
+def get_price_cache() -> TtlCache[PriceCacheKey, StoredSeries]:
+    """Get the process-wide cache of price bars.
+
+    There is a single entry per ticker and interval, holding the bars of the
+    last period fetched.
+
+    Returns:
+        The cache, bounded by the configured number of entries.
+
+    """
+    return TtlCache(get_settings().price_cache_entries)
+
+
+def find_price_bars(symbol: str, period: Period, interval: Interval, reference: datetime) -> pd.DataFrame | None:
+    """Find fresh bars of a period in memory.
+
+    Shorter periods are sliced out of the cached bars, e.g. a month out of five
+    years, with a binary search over their timestamps. Coarser intervals are
+    aggregated from cached finer bars if there are no cached bars of their own,
+    e.g. weekly bars from daily ones. The whole search counts as a single hit
+    or miss of the cache.
+
+    Args:
+        symbol: The normalized ticker symbol.
+        period: The time period requested.
+        interval: The interval between bars.
+        reference: The time periods are counted back from, timezone-aware.
+
+    Returns:
+        The bars indexed by timestamp, or None if the cached bars do not cover
+        the period.
+
+    """
+    bars = _slice_cached_bars(symbol, period, interval, reference)
+
+    if bars is None:
+        bars = _resample_cached_bars(symbol, period, interval, reference)
+
+    get_price_cache().record(hit=bars is not None)
+
+    return bars
+
+
+def find_price_range(symbol: str, interval: Interval, start: datetime, end: datetime | None) -> pd.DataFrame | None:
+    """Find fresh bars of a time range in memory.
+
+    The cached bars cover a range if they reach back to its start, since they
+    are kept up to date with the newest bars.
+
+    Args:
+        symbol: The normalized ticker symbol.
+        interval: The interval between bars.
+        start: The timestamp of the first bar, timezone-aware.
+        end: The timestamp the bars end before, timezone-aware, or None up to the last bar.
+
+    Returns:
+        The bars indexed by timestamp, or None if the cached bars do not cover
+        the range.
+
+    """
+    cached = get_price_cache().get((symbol, interval))
+
+    if cached is None or cached.bars.empty:
+        return None
+
+    index = pd.DatetimeIndex(cached.bars.index)
+
+    if cached.period != "max" and index[0] > start:
+        return None
+
+    first, last = range_positions(index, start, end)
+
+    return cached.bars.iloc[first:last]
+
+
+def remember_price_bars(symbol: str, period: Period, interval: Interval, bars: pd.DataFrame, now: datetime) -> None:
+    """Keep the bars of a period in memory until they stop being fresh.
+
+    Args:
+        symbol: The normalized ticker symbol.
+        period: The time period of the bars.
+        interval: The interval between bars.
+        bars: The bars indexed by timestamp.
+        now: The time the bars were fetched, timezone-aware.
+
+    """
+    get_price_cache().put((symbol, interval), StoredSeries(period, bars), price_expiry(interval, now).timestamp())
+
+
+def _slice_cached_bars(symbol: str, period: Period, interval: Interval, reference: datetime) -> pd.DataFrame | None:
+    """Slice the bars of a period out of the cached bars of an interval.
+
+    Args:
+        symbol: The normalized ticker symbol.
+        period: The time period requested.
+        interval: The interval between bars.
+        reference: The time periods are counted back from, timezone-aware.
+
+    Returns:
+        The bars indexed by timestamp, or None if the cached bars do not cover
+        the period.
+
+    """
+    cached = get_price_cache().get((symbol, interval), count=False)
+
+    if cached is None or not period_covers(cached.period, period):
+        return None
+
+    if cached.period == period:
+        return cached.bars
+
+    return cached.bars.iloc[period_start_position(pd.DatetimeIndex(cached.bars.index), period, reference) :]
+
+
+def _resample_cached_bars(symbol: str, period: Period, interval: Interval, reference: datetime) -> pd.DataFrame | None:
+    """Aggregate the bars of a period out of the cached bars of a finer interval.
+
+    Args:
+        symbol: The normalized ticker symbol.
+        period: The time period requested.
+        interval: The interval between bars.
+        reference: The time periods are counted back from, timezone-aware.
+
+    Returns:
+        The bars indexed by timestamp, or None if no cached finer bars cover
+        the period.
+
+    """
+    for source in RESAMPLING_SOURCES.get(interval, ()):
+        bars = _slice_cached_bars(symbol, period, source, reference)
+
+        if bars is not None:
+            return resample_bars(bars, interval)
+
+    return None
@@ -0,0 +1,197 @@
+"""Persistent local store of price bars."""
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from functools import cache
+from itertools import repeat
+from pathlib import Path
+from typing import NamedTuple
+
+import pandas as pd
+
+from technical_analysis_mcp.models import Interval, Period
+from technical_analysis_mcp.settings import get_settings
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+
+_DATABASE_NAME = "prices.sqlite3"
+_LOCK_TIMEOUT_SECONDS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    ticker TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    period TEXT NOT NULL,
+    timezone TEXT NOT NULL,
+    PRIMARY KEY (ticker, interval)
+);
+
+CREATE TABLE IF NOT EXISTS bars (
+    ticker TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume INTEGER NOT NULL,
+    dividends REAL NOT NULL,
+    stock_splits REAL NOT NULL,
+    PRIMARY KEY (ticker, interval, timestamp)
+) WITHOUT ROWID;
+"""
+
+_INSERT_BARS = "INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+class StoredSeries(NamedTuple):
+    """The bars kept for a ticker and interval."""
+
+    period: Period
+    """The longest period fetched, i.e. the bars are complete from its start up to the last bar."""
+
+    bars: pd.DataFrame
+    """The bars indexed by timestamp, with the columns of the upstream provider."""
+
+
+class PriceStore:
+    """SQLite database holding every price bar fetched, keyed by ticker and interval."""
+
+    def __init__(self, path: Path) -> None:
+        """Open the store, creating the database if needed.
+
+        Args:
+            path: The database file.
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+
+        with self._transaction() as connection:
+            connection.executescript(_SCHEMA)
+
+    def load(self, ticker: str, interval: Interval) -> StoredSeries | None:
+        """Load the stored bars of a ticker.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The interval between bars.
+
+        Returns:
+            The stored series, or None if the ticker was never stored at this interval.
+
+        """
+        with self._transaction() as connection:
+            series = connection.execute(
+                "SELECT period, timezone FROM series WHERE ticker = ? AND interval = ?",
+                (ticker, interval),
+            ).fetchone()
+
+            if series is None:
+                return None
+
+            rows = connection.execute(
+                "SELECT timestamp, open, high, low, close, volume, dividends, stock_splits "
+                "FROM bars WHERE ticker = ? AND interval = ? ORDER BY timestamp",
+                (ticker, interval),
+            ).fetchall()
+
+        period, timezone = series
+        bars = pd.DataFrame.from_records(rows, columns=["Timestamp", *PRICE_COLUMNS])
+        index = pd.DatetimeIndex(pd.to_datetime(bars.pop("Timestamp"), unit="ns", utc=True), name="Date")
+        bars.index = index.tz_convert(timezone) if timezone else index.tz_localize(None)
+
+        return StoredSeries(period=period, bars=bars)
+
+    def save(self, ticker: str, interval: Interval, period: Period, bars: pd.DataFrame) -> None:
+        """Replace the stored bars of a ticker with a complete fetch of a period.
+
+        The period should cover the stored one, since the bars stored before
+        the start of the fetch are dropped.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The interval between bars.
+            period: The period fetched.
+            bars: The bars fetched, indexed by timestamp.
+
+        """
+        index = pd.DatetimeIndex(bars.index)
+        timezone = str(index.tz) if index.tz is not None else ""
+
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM bars WHERE ticker = ? AND interval = ?", (ticker, interval))
+            connection.execute(
+                "INSERT OR REPLACE INTO series VALUES (?, ?, ?, ?)",
+                (ticker, interval, period, timezone),
+            )
+            connection.executemany(_INSERT_BARS, _records(ticker, interval, bars))
+
+    def update(self, ticker: str, interval: Interval, bars: pd.DataFrame) -> None:
+        """Replace the newest stored bars of a ticker with a fetch of the tail of the series.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The interval between bars.
+            bars: The bars fetched, starting at or before the last stored bar.
+
+        """
+        if bars.empty:
+            return
+
+        with self._transaction() as connection:
+            connection.execute(
+                "DELETE FROM bars WHERE ticker = ? AND interval = ? AND timestamp >= ?",
+                (ticker, interval, int(pd.DatetimeIndex(bars.index).asi8[0])),
+            )
+            connection.executemany(_INSERT_BARS, _records(ticker, interval, bars))
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection and run a single transaction on it.
+
+        Yields:
+            The connection, committed on success and rolled back on error.
+
+        """
+        with closing(sqlite3.connect(self._path, timeout=_LOCK_TIMEOUT_SECONDS)) as connection, connection:
+            yield connection
+
+
+def _records(ticker: str, interval: Interval, bars: pd.DataFrame) -> Iterator[tuple]:
+    """Convert bars into database rows.
+
+    Args:
+        ticker: The ticker symbol.
+        interval: The interval between bars.
+        bars: The bars indexed by timestamp.
+
+    Returns:
+        The rows to insert into the bars table.
+
+    """
+    return zip(
+        repeat(ticker, len(bars)),
+        repeat(interval, len(bars)),
+        pd.DatetimeIndex(bars.index).asi8.tolist(),
+        bars["Open"].astype(float).tolist(),
+        bars["High"].astype(float).tolist(),
+        bars["Low"].astype(float).tolist(),
+        bars["Close"].astype(float).tolist(),
+        bars["Volume"].astype("int64").tolist(),
+        bars["Dividends"].astype(float).tolist(),
+        bars["Stock Splits"].astype(float).tolist(),
+        strict=True,
+    )
+
+
+@cache
+def get_price_store() -> PriceStore:
+    """Get the process-wide price store.
+
+    Returns:
+        The store located in the configured data directory.
+
+    """
+    return PriceStore(get_settings().data_directory / _DATABASE_NAME)
@@ -0,0 +1,156 @@
+"""Aggregation of price bars into coarser intervals."""
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from technical_analysis_mcp.models import Interval
+
+_NANOSECONDS_PER_MINUTE = 60_000_000_000
+_NANOSECONDS_PER_DAY = 86_400_000_000_000
+_MINUTES_PER_DAY = 1440
+
+# The epoch, 1970-01-01, was a Thursday.
+_EPOCH_WEEKDAY = 3
+
+# Finer intervals each coarser interval can be aggregated from, most preferred first.
+RESAMPLING_SOURCES: dict[Interval, tuple[Interval, ...]] = {
+    "15m": ("5m", "1m"),
+    "30m": ("5m", "1m"),
+    "60m": ("5m", "1m"),
+    "90m": ("5m", "1m"),
+    "1h": ("5m", "1m"),
+    "5d": ("1d",),
+    "1wk": ("1d",),
+    "1mo": ("1d",),
+    "3mo": ("1d",),
+}
+
+_INTRADAY_MINUTES = {
+    "15m": 15,
+    "30m": 30,
+    "60m": 60,
+    "90m": 90,
+    "1h": 60,
+}
+
+_SESSIONS_PER_BAR = {
+    "5d": 5,
+}
+
+
+def resample_bars(bars: pd.DataFrame, interval: Interval) -> pd.DataFrame:
+    """Aggregate price bars into bars of a coarser interval.
+
+    Each bar takes the first open, the highest high, the lowest low, the last
+    close, the summed volume and dividends, and the combined stock splits of
+    the bars it spans, and the timestamp of the first of them. Intraday bars
+    are aligned to the first bar of each session, and weekly, monthly and
+    quarterly bars to calendar boundaries in the timezone of the bars.
+
+    Args:
+        bars: The sorted bars indexed by timestamp.
+        interval: The coarser interval, one of `RESAMPLING_SOURCES`.
+
+    Returns:
+        The aggregated bars indexed by timestamp.
+
+    Raises:
+        ValueError: If the interval cannot be aggregated from finer bars.
+
+    """
+    if interval not in RESAMPLING_SOURCES:
+        message = f"Interval {interval} cannot be aggregated from finer bars."
+        raise ValueError(message)
+
+    if bars.empty:
+        return bars
+
+    index = pd.DatetimeIndex(bars.index)
+    labels = _bucket_labels((index.tz_localize(None) if index.tz is not None else index).asi8, interval)
+
+    return _aggregate_buckets(bars, np.flatnonzero(np.diff(labels, prepend=labels[0] - 1)))
+
+
+def downsample_bars(bars: pd.DataFrame, max_points: int) -> pd.DataFrame:
+    """Aggregate price bars into at most a given number of bars.
+
+    The bars are split into buckets of nearly the same number of bars, which
+    are aggregated like in `resample_bars`, so the highest high and the lowest
+    low of the whole series are kept.
+
+    Args:
+        bars: The sorted bars indexed by timestamp.
+        max_points: The maximum number of bars, at least one.
+
+    Returns:
+        The aggregated bars indexed by timestamp, or the same bars if there are
+        not more than the maximum.
+
+    """
+    if len(bars) <= max_points:
+        return bars
+
+    labels = np.arange(len(bars), dtype=np.int64) * max_points // len(bars)
+
+    return _aggregate_buckets(bars, np.flatnonzero(np.diff(labels, prepend=-1)))
+
+
+def _aggregate_buckets(bars: pd.DataFrame, starts: npt.NDArray[np.intp]) -> pd.DataFrame:
+    """Aggregate contiguous buckets of price bars.
+
+    Args:
+        bars: The sorted bars indexed by timestamp.
+        starts: The position of the first bar of each bucket, in increasing order.
+
+    Returns:
+        The aggregated bars indexed by the timestamp of the first bar of each bucket.
+
+    """
+    ends = np.append(starts[1:], len(bars)) - 1
+    splits = bars["Stock Splits"].to_numpy(dtype=np.float64)
+    combined_splits = np.multiply.reduceat(np.where(splits == 0, 1.0, splits), starts)
+    has_splits = np.logical_or.reduceat(splits != 0, starts)
+
+    return pd.DataFrame(
+        {
+            "Open": bars["Open"].to_numpy()[starts],
+            "High": np.maximum.reduceat(bars["High"].to_numpy(), starts),
+            "Low": np.minimum.reduceat(bars["Low"].to_numpy(), starts),
+            "Close": bars["Close"].to_numpy()[ends],
+            "Volume": np.add.reduceat(bars["Volume"].to_numpy(), starts),
+            "Dividends": np.add.reduceat(bars["Dividends"].to_numpy(), starts),
+            "Stock Splits": np.where(has_splits, combined_splits, 0.0),
+        },
+        index=pd.DatetimeIndex(bars.index)[starts],
+    )
+
+
+def _bucket_labels(timestamps: npt.NDArray[np.int64], interval: Interval) -> npt.NDArray[np.int64]:
+    """Label each bar with the coarser bar it belongs to.
+
+    Args:
+        timestamps: The sorted wall-clock timestamps of the bars, in nanoseconds.
+        interval: The coarser interval.
+
+    Returns:
+        The labels, equal for the bars of the same coarser bar.
+
+    """
+    days = timestamps // _NANOSECONDS_PER_DAY
+
+    if interval in _INTRADAY_MINUTES:
+        session_starts = np.flatnonzero(np.diff(days, prepend=days[0] - 1))
+        session_opens = np.repeat(timestamps[session_starts], np.diff(np.append(session_starts, len(days))))
+        buckets = (timestamps - session_opens) // (_INTRADAY_MINUTES[interval] * _NANOSECONDS_PER_MINUTE)
+        return days * _MINUTES_PER_DAY + buckets
+
+    if interval in _SESSIONS_PER_BAR:
+        return np.arange(len(timestamps), dtype=np.int64) // _SESSIONS_PER_BAR[interval]
+
+    if interval == "1wk":
+        return days - (days + _EPOCH_WEEKDAY) % 7
+
+    months = timestamps.astype("datetime64[ns]").astype("datetime64[M]").astype(np.int64)
+
+    return months if interval == "1mo" else months // 3
@@ -0,0 +1,47 @@
+"""Coalescing of concurrent identical requests."""
+
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from typing import Any
+
+
+class SingleFlight[K: Hashable, V]:
+    """Runs at most one call per key at a time, sharing its result with every concurrent caller."""
+
+    def __init__(self) -> None:
+        """Initialize without calls in flight."""
+        self._calls: dict[K, asyncio.Task[V]] = {}
+
+    async def run(self, key: K, function: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        """Run a call, or wait for the one already in flight with the same key.
+
+        Cancelling a caller does not cancel the shared call, which keeps running
+        for the other callers.
+
+        Args:
+            key: The key identifying the call.
+            function: The function starting the call.
+
+        Returns:
+            The result of the call.
+
+        """
+        task = self._calls.get(key)
+
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(function())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task[V]) -> None:
+        """Remove a finished call.
+
+        Args:
+            key: The key identifying the call.
+            task: The finished call.
+
+        """
+        if self._calls.get(key) is task:
+            del self._calls[key]
@@ -0,0 +1,116 @@
+"""In-memory cache with expiring entries and least-recently-used eviction."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+
+class TtlCache[K: Hashable, V]:
+    """Bounded in-memory cache whose entries expire at a given time.
+
+    When the cache is full, the least recently used entry is evicted. The cache
+    is safe to use from several threads, and counts its hits and misses.
+    """
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.time) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: The maximum number of entries kept.
+            clock: The source of the current time, in seconds since the epoch.
+
+        """
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of entries, including expired ones not evicted yet.
+
+        Returns:
+            The number of entries.
+
+        """
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        """The maximum number of entries kept."""
+        return self._max_entries
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups that found a fresh entry since the cache was created or cleared."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups that found no fresh entry since the cache was created or cleared."""
+        return self._misses
+
+    def get(self, key: K, *, count: bool = True) -> V | None:
+        """Get the value of an entry and mark it as the most recently used.
+
+        Args:
+            key: The key of the entry.
+            count: Whether to count the lookup as a hit or miss. Lookups probing
+                several keys count themselves once with `record`.
+
+        Returns:
+            The value, or None if there is no entry or it expired.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[1] <= self._clock():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self._misses += count
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += count
+            return entry[0]
+
+    def record(self, *, hit: bool) -> None:
+        """Count a lookup made of several uncounted gets.
+
+        Args:
+            hit: Whether the lookup found a usable entry.
+
+        """
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def put(self, key: K, value: V, expires_at: float) -> None:
+        """Add or replace an entry, evicting the least recently used ones if full.
+
+        Args:
+            key: The key of the entry.
+            value: The value to cache.
+            expires_at: The time the entry expires, in seconds since the epoch.
+
+        """
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counts of hits and misses."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
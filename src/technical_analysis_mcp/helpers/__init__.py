@@ -1,5 +1,8 @@
 """Helpers module."""
 
+from .concurrency import get_io_executor, run_blocking
+from .conversion import to_datetimes
+from .downsampling import downsample_series, lttb_indices
 from .parsing import (
     get_dictionary_float,
     get_dictionary_optional_float,
@@ -8,8 +11,13 @@ from .parsing import (
 )
 
 __all__ = [
+    "downsample_series",
     "get_dictionary_float",
     "get_dictionary_optional_float",
     "get_dictionary_optional_string",
     "get_dictionary_string",
+    "get_io_executor",
+    "lttb_indices",
+    "run_blocking",
+    "to_datetimes",
 ]
@@ -0,0 +1,40 @@
+"""Utilities for running blocking work off the event loop."""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, partial
+
+from technical_analysis_mcp.settings import get_settings
+
+IO_THREAD_NAME_PREFIX = "technical-analysis-io"
+
+
+@cache
+def get_io_executor() -> ThreadPoolExecutor:
+    """Get the process-wide pool of threads for blocking I/O.
+
+    Returns:
+        The pool, bounded by the configured number of workers.
+
+    """
+    return ThreadPoolExecutor(max_workers=get_settings().io_workers, thread_name_prefix=IO_THREAD_NAME_PREFIX)
+
+
+async def run_blocking[**P, T](function: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run a blocking function in the I/O thread pool.
+
+    At most the configured number of workers run at once, and the rest wait
+    in the pool queue without blocking the event loop.
+
+    Args:
+        function: The blocking function.
+        *args: The positional arguments of the function.
+        **kwargs: The keyword arguments of the function.
+
+    Returns:
+        The result of the function.
+
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_executor(), partial(function, *args, **kwargs))
@@ -0,0 +1,31 @@
+"""Bulk conversion of data frame columns into Python values."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+
+def to_datetimes(index: pd.DatetimeIndex) -> list[datetime]:
+    """Convert timestamps into datetimes in a single pass.
+
+    Timezone-aware timestamps become datetimes with the fixed UTC offset they
+    had, e.g. `-04:00` or `-05:00` across daylight saving time, like parsing
+    their ISO 8601 representation does.
+
+    Args:
+        index: The timestamps.
+
+    Returns:
+        The datetimes, in the same order.
+
+    """
+    if index.tz is None:
+        return index.asi8.astype("datetime64[ns]").astype("datetime64[us]").tolist()
+
+    local = index.tz_localize(None).asi8
+    naive = local.astype("datetime64[ns]").astype("datetime64[us]").tolist()
+    offsets = (local - index.asi8) // 1_000
+    zones = {offset: timezone(timedelta(microseconds=offset)) for offset in np.unique(offsets).tolist()}
+
+    return [moment.replace(tzinfo=zones[offset]) for moment, offset in zip(naive, offsets.tolist(), strict=True)]
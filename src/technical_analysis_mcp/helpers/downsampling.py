@@ -0,0 +1,87 @@
+"""Reduction of long series to a few representative points."""
+
+from datetime import datetime
+
+import numpy as np
+import numpy.typing as npt
+
+_MIN_TRIANGLE_POINTS = 3
+
+
+def lttb_indices(x: npt.ArrayLike, y: npt.ArrayLike, max_points: int) -> npt.NDArray[np.intp]:
+    """Select the points of a series that best keep its shape.
+
+    Uses Largest-Triangle-Three-Buckets: the first and last points are kept,
+    the rest are split into buckets, and each bucket keeps the point forming
+    the largest triangle with the point kept in the previous bucket and the
+    average of the next bucket, so peaks and troughs survive. Each bucket is
+    processed with vectorized operations.
+
+    Args:
+        x: The sorted positions of the points, e.g. epoch seconds.
+        y: The values of the points.
+        max_points: The maximum number of points to keep, at least one.
+
+    Returns:
+        The sorted positions of the points to keep.
+
+    """
+    xs = np.asarray(x, dtype=np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+    n = len(xs)
+
+    if max_points >= n:
+        return np.arange(n, dtype=np.intp)
+
+    if max_points < _MIN_TRIANGLE_POINTS:
+        return np.linspace(0, n - 1, max_points).astype(np.intp)
+
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.intp)
+    next_starts = np.append(edges[1:-1], n - 1)
+    next_ends = np.append(edges[2:], n)
+    sum_x = np.concatenate(([0.0], np.cumsum(xs)))
+    sum_y = np.concatenate(([0.0], np.cumsum(ys)))
+    average_x = (sum_x[next_ends] - sum_x[next_starts]) / (next_ends - next_starts)
+    average_y = (sum_y[next_ends] - sum_y[next_starts]) / (next_ends - next_starts)
+
+    selected = np.empty(max_points, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    anchor = 0
+
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        areas = np.abs(
+            (xs[anchor] - average_x[bucket]) * (ys[start:end] - ys[anchor])
+            - (xs[anchor] - xs[start:end]) * (average_y[bucket] - ys[anchor]),
+        )
+        anchor = start + int(np.argmax(areas))
+        selected[bucket + 1] = anchor
+
+    return selected
+
+
+def downsample_series(
+    dates: list[datetime],
+    values: npt.ArrayLike,
+    max_points: int | None,
+) -> tuple[list[datetime], list[float]]:
+    """Reduce a time series to the points that best keep its shape.
+
+    Args:
+        dates: The timezone-aware timestamps, in chronological order.
+        values: The values, one per timestamp.
+        max_points: The maximum number of points to keep, or None to keep them all.
+
+    Returns:
+        The timestamps and values of the kept points.
+
+    """
+    ys = np.asarray(values, dtype=np.float64)
+
+    if max_points is None or max_points >= len(dates):
+        return dates, ys.tolist()
+
+    keep = lttb_indices([date.timestamp() for date in dates], ys, max_points)
+
+    return [dates[i] for i in keep], ys[keep].tolist()
@@ -0,0 +1,63 @@
+"""Vectorized technical indicators."""
+
+from .bollinger import bollinger_bands
+from .donchian import donchian_channels
+from .ema import ema_weight, exponential_moving_average
+from .macd import moving_average_convergence_divergence
+from .price_columns import PriceColumns
+from .rolling import rolling_max, rolling_min, rolling_moments, rolling_sums
+from .rsi import gains_and_losses, relative_strength_index, strength_index, wilder_averages
+from .sma import simple_moving_average
+from .smoothing import exponential_smoothing
+from .stochastic import stochastic_k, stochastic_oscillator, williams_r
+from .streaming import (
+    EmaState,
+    IndicatorStart,
+    IndicatorState,
+    RsiState,
+    SmaState,
+    StreamingSeries,
+    start_ema,
+    start_rsi,
+    start_sma,
+    stream_series,
+)
+from .sweep import relative_strength_indices, simple_moving_averages
+from .volatility import average_true_range, range_volatilities, true_range
+
+__all__ = [
+    "EmaState",
+    "IndicatorStart",
+    "IndicatorState",
+    "PriceColumns",
+    "RsiState",
+    "SmaState",
+    "StreamingSeries",
+    "average_true_range",
+    "bollinger_bands",
+    "donchian_channels",
+    "ema_weight",
+    "exponential_moving_average",
+    "exponential_smoothing",
+    "gains_and_losses",
+    "moving_average_convergence_divergence",
+    "range_volatilities",
+    "relative_strength_index",
+    "relative_strength_indices",
+    "rolling_max",
+    "rolling_min",
+    "rolling_moments",
+    "rolling_sums",
+    "simple_moving_average",
+    "simple_moving_averages",
+    "start_ema",
+    "start_rsi",
+    "start_sma",
+    "stochastic_k",
+    "stochastic_oscillator",
+    "stream_series",
+    "strength_index",
+    "true_range",
+    "wilder_averages",
+    "williams_r",
+]
@@ -0,0 +1,50 @@
+"""Bollinger Bands."""
+
+import numpy as np
+import numpy.typing as npt
+
+from .rolling import rolling_moments
+
+
+def bollinger_bands(
+    values: npt.ArrayLike,
+    window: int,
+    deviations: float,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Compute the Bollinger Bands of a series and where each value lies within them.
+
+    The middle band is the Simple Moving Average of each window, and the upper
+    and lower bands are a number of population standard deviations of the
+    window above and below it. The means and variances of every window come
+    from running sums offset by values next to the window, so the cost does not
+    depend on the window and the precision does not depend on how far the
+    values drifted.
+
+    Args:
+        values: The values, in chronological order.
+        window: The number of values of each window.
+        deviations: The number of standard deviations between the middle band and the others.
+
+    Returns:
+        The middle, upper and lower bands and the %B, the position of the value
+        between the lower band, at 0, and the upper band, at 1, or 0.5 where the
+        bands have no width, for each value from the one at position
+        `window - 1` on, all empty if there are fewer values than the window or
+        the window is not positive.
+
+    """
+    xs = np.asarray(values, dtype=np.float64)
+
+    if window <= 0 or len(xs) < window:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, empty, empty
+
+    middle, variances = rolling_moments(xs, window)
+    widths = deviations * np.sqrt(variances)
+    upper = middle + widths
+    lower = middle - widths
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent_b = np.where(widths > 0, (xs[window - 1 :] - lower) / (upper - lower), 0.5)
+
+    return middle, upper, lower, percent_b
@@ -0,0 +1,30 @@
+"""Donchian channels."""
+
+import numpy as np
+import numpy.typing as npt
+
+from .rolling import rolling_max, rolling_min
+
+
+def donchian_channels(
+    high: npt.NDArray[np.float64],
+    low: npt.NDArray[np.float64],
+    window: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Compute the Donchian channels.
+
+    Args:
+        high: The highest prices.
+        low: The lowest prices, one per highest price.
+        window: The number of bars of each channel.
+
+    Returns:
+        The highest high, the midpoint and the lowest low of the window ending
+        at each bar from the one at position `window - 1` on, all empty if
+        there are fewer bars than the window.
+
+    """
+    upper = rolling_max(high, window)
+    lower = rolling_min(low, window)
+
+    return upper, (upper + lower) / 2, lower
@@ -0,0 +1,46 @@
+"""Exponential Moving Average (EMA)."""
+
+import numpy as np
+import numpy.typing as npt
+
+from .smoothing import exponential_smoothing
+
+
+def ema_weight(window: int) -> float:
+    """Get the weight of each new value of an Exponential Moving Average.
+
+    Args:
+        window: The number of values of the average.
+
+    Returns:
+        Two over the window plus one.
+
+    """
+    return 2.0 / (window + 1)
+
+
+def exponential_moving_average(values: npt.ArrayLike, window: int) -> npt.NDArray[np.float64]:
+    """Compute the Exponential Moving Average of a series.
+
+    The first average is the mean of the first window, and each later one
+    weighs the new value by two over the window plus one. Every average is
+    computed in a single vectorized pass, with no loop over the values.
+
+    Args:
+        values: The values, in chronological order.
+        window: The number of values of the average.
+
+    Returns:
+        The average at each value from the one at position `window - 1` on,
+        empty if there are fewer values than the window or the window is not
+        positive.
+
+    """
+    xs = np.asarray(values, dtype=np.float64)
+
+    if window <= 0 or len(xs) < window:
+        return np.empty(0, dtype=np.float64)
+
+    first = float(xs[:window].mean())
+
+    return np.concatenate(([first], exponential_smoothing(xs[window:], ema_weight(window), first)))
@@ -0,0 +1,43 @@
+"""Moving Average Convergence Divergence (MACD)."""
+
+import numpy as np
+import numpy.typing as npt
+
+from .ema import exponential_moving_average
+
+
+def moving_average_convergence_divergence(
+    values: npt.ArrayLike,
+    fast: int,
+    slow: int,
+    signal: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Compute the MACD line, its signal line and their difference.
+
+    The line is the fast EMA minus the slow EMA of the values, the signal line
+    is the EMA of the line, and the histogram is the line minus the signal
+    line. The three EMAs are computed over arrays, with no loop over the values.
+
+    Args:
+        values: The values, in chronological order.
+        fast: The window of the fast EMA, at most the slow one.
+        slow: The window of the slow EMA.
+        signal: The window of the EMA of the line.
+
+    Returns:
+        The line, the signal line and the histogram at each value from the one
+        at position `slow - 1` on, the last two NaN until the signal window
+        fills, all empty if there are fewer values than the slow window.
+
+    """
+    xs = np.asarray(values, dtype=np.float64)
+    slow_averages = exponential_moving_average(xs, slow)
+
+    if len(slow_averages) == 0:
+        return slow_averages, slow_averages, slow_averages
+
+    line = exponential_moving_average(xs, fast)[slow - fast :] - slow_averages
+    signal_line = np.full(len(line), np.nan)
+    signal_line[signal - 1 :] = exponential_moving_average(line, signal)
+
+    return line, signal_line, line - signal_line
@@ -0,0 +1,66 @@
+"""Columnar view of price histories."""
+
+from datetime import datetime
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from technical_analysis_mcp.helpers import to_datetimes
+from technical_analysis_mcp.models import PriceSource
+
+_BAR_FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+class PriceColumns(NamedTuple):
+    """The prices of a history as one array per field, shared by every indicator."""
+
+    dates: list[datetime]
+    """The date and time of each price entry."""
+
+    timestamps: npt.NDArray[np.int64]
+    """The timestamp of each price entry, in nanoseconds since the epoch."""
+
+    open: npt.NDArray[np.float64]
+    """The opening prices."""
+
+    high: npt.NDArray[np.float64]
+    """The highest prices."""
+
+    low: npt.NDArray[np.float64]
+    """The lowest prices."""
+
+    close: npt.NDArray[np.float64]
+    """The closing prices."""
+
+    volume: npt.NDArray[np.float64]
+    """The trading volumes."""
+
+    @classmethod
+    def from_bars(cls, bars: pd.DataFrame) -> "PriceColumns":
+        """Split price bars into columns, converting every field in bulk.
+
+        Args:
+            bars: The bars indexed by timestamp, with the columns of the upstream provider.
+
+        Returns:
+            The columns of the prices, in chronological order.
+
+        """
+        index = pd.DatetimeIndex(bars.index)
+        open_, high, low, close, volume = np.ascontiguousarray(bars[_BAR_FIELDS].to_numpy(dtype=np.float64).T)
+
+        return cls(to_datetimes(index), index.asi8, open_, high, low, close, volume)
+
+    def price(self, source: PriceSource) -> npt.NDArray[np.float64]:
+        """Get the prices of a source.
+
+        Args:
+            source: Which price field to get (open, high, low, close).
+
+        Returns:
+            The prices, one per entry.
+
+        """
+        return {"open": self.open, "high": self.high, "low": self.low, "close": self.close}[source]
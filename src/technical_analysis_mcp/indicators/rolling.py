@@ -0,0 +1,167 @@
+"""Rolling window aggregates computed in linear time."""
+
+import numpy as np
+import numpy.typing as npt
+
+# Values per block of the running sums, which restart at every block so that
+# their rounding errors do not grow with the length of the series.
+_BLOCK_SIZE = 256
+
+
+def rolling_sums(values: npt.NDArray[np.float64], window: int) -> npt.NDArray[np.float64]:
+    """Sum every window of a series in linear time.
+
+    The running sums restart at every block of at least a window of values,
+    so each window spans at most two blocks: the end of the first one, the
+    difference of two running sums, and the start of the second one. Unlike
+    the differences of two cumulative sums over the whole series, the error
+    does not grow with its length.
+
+    Args:
+        values: The values, at least a window of them.
+        window: The positive number of values of each window.
+
+    Returns:
+        The sum of each window, ending at each value from the one at position
+        `window - 1` on.
+
+    """
+    block = max(window, _BLOCK_SIZE)
+    blocks = -(-len(values) // block)
+    padded = np.zeros(blocks * block)
+    padded[: len(values)] = values
+    running = np.cumsum(padded.reshape(blocks, block), axis=1).ravel()
+
+    ends = np.arange(window - 1, len(values))
+    starts = ends - window
+    before = np.where(starts >= 0, running[np.maximum(starts, 0)], 0.0)
+    last_of_start_block = (np.maximum(starts, 0) // block + 1) * block - 1
+    spans_blocks = (starts >= 0) & (starts // block != ends // block)
+
+    return np.where(spans_blocks, running[last_of_start_block] - before + running[ends], running[ends] - before)
+
+
+def rolling_moments(
+    values: npt.NDArray[np.float64],
+    window: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Compute the mean and population variance of every window of a series in linear time.
+
+    The series is split into blocks of a window, like for the rolling extrema,
+    so every window is the suffix of one block followed by the prefix of the
+    next one. Suffix sums are offset by the last value of their block and
+    prefix sums by the first one, two adjacent values of the series, so every
+    sum only covers values of the window, offset by a value next to them. The
+    variance is the mean square minus the squared mean of the offset values,
+    so its rounding error scales with how much the values move within the
+    window, not with how far they drifted since the start of the series, and
+    windows of a single repeated value have exactly that mean and no variance.
+
+    Args:
+        values: The values, at least a window of them.
+        window: The positive number of values of each window.
+
+    Returns:
+        The mean and the variance of each window, ending at each value from the
+        one at position `window - 1` on.
+
+    """
+    blocks = -(-len(values) // window)
+    padded = np.zeros(blocks * window)
+    padded[: len(values)] = values
+    grid = padded.reshape(blocks, window)
+    firsts = grid[:, 0]
+    lasts = grid[:, -1]
+    heads = grid - firsts[:, np.newaxis]
+    tails = (grid - lasts[:, np.newaxis])[:, ::-1]
+    prefix_sums = np.cumsum(heads, axis=1).ravel()
+    prefix_squares = np.cumsum(heads * heads, axis=1).ravel()
+    suffix_sums = np.cumsum(tails, axis=1)[:, ::-1].ravel()
+    suffix_squares = np.cumsum(tails * tails, axis=1)[:, ::-1].ravel()
+
+    starts = np.arange(len(values) - window + 1)
+    ends = starts + window - 1
+    references = firsts[ends // window]
+
+    # The suffix of the first block, moved from its last value to the first value of the next block.
+    aligned = starts % window == 0
+    count = np.where(aligned, 0, window - starts % window)
+    shift = references - lasts[starts // window]
+    suffix_sums = np.where(aligned, 0.0, suffix_sums[starts])
+    suffix_squares = np.where(aligned, 0.0, suffix_squares[starts])
+    moved_sums = suffix_sums - count * shift
+    moved_squares = suffix_squares - 2.0 * shift * suffix_sums + count * shift * shift
+
+    means = (moved_sums + prefix_sums[ends]) / window
+    squares = (moved_squares + prefix_squares[ends]) / window
+
+    return references + means, np.maximum(squares - means * means, 0.0)
+
+
+def rolling_max(values: npt.ArrayLike, window: int) -> npt.NDArray[np.float64]:
+    """Find the highest value of every window of a series in linear time.
+
+    Args:
+        values: The values, in chronological order.
+        window: The positive number of values of each window.
+
+    Returns:
+        The highest value of each window, ending at each value from the one at
+        position `window - 1` on, empty if there are fewer values than the window.
+
+    """
+    return _rolling_extrema(np.asarray(values, dtype=np.float64), window, np.maximum, -np.inf)
+
+
+def rolling_min(values: npt.ArrayLike, window: int) -> npt.NDArray[np.float64]:
+    """Find the lowest value of every window of a series in linear time.
+
+    Args:
+        values: The values, in chronological order.
+        window: The positive number of values of each window.
+
+    Returns:
+        The lowest value of each window, ending at each value from the one at
+        position `window - 1` on, empty if there are fewer values than the window.
+
+    """
+    return _rolling_extrema(np.asarray(values, dtype=np.float64), window, np.minimum, np.inf)
+
+
+def _rolling_extrema(
+    values: npt.NDArray[np.float64],
+    window: int,
+    extremum: np.ufunc,
+    padding: float,
+) -> npt.NDArray[np.float64]:
+    """Find the extremum of every window of a series with the van Herk/Gil-Werman algorithm.
+
+    The series is split into blocks of a window. Every window spans the end of
+    one block and the start of the next, so its extremum combines the extremum
+    of the suffix of the first block from where the window starts with the
+    extremum of the prefix of the next one up to where it ends. The prefix and
+    suffix extrema of every block are accumulated over the blocks at once, so
+    each value costs about three comparisons whatever the window.
+
+    Args:
+        values: The values, in chronological order.
+        window: The positive number of values of each window.
+        extremum: The element-wise extremum of two arrays, `np.maximum` or `np.minimum`.
+        padding: The value ignored by the extremum, to fill the last block.
+
+    Returns:
+        The extremum of each window, ending at each value from the one at
+        position `window - 1` on, empty if there are fewer values than the window.
+
+    """
+    if window <= 0 or len(values) < window:
+        return np.empty(0, dtype=np.float64)
+
+    blocks = -(-len(values) // window)
+    padded = np.full(blocks * window, padding)
+    padded[: len(values)] = values
+    grid = padded.reshape(blocks, window)
+    prefixes = extremum.accumulate(grid, axis=1).ravel()
+    suffixes = extremum.accumulate(grid[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    return extremum(suffixes[: len(values) - window + 1], prefixes[window - 1 : len(values)])
@@ -0,0 +1,91 @@
+"""Relative Strength Index (RSI)."""
+
+import numpy as np
+import numpy.typing as npt
+
+from .smoothing import exponential_smoothing
+
+_MAX_RSI = 100.0
+
+
+def gains_and_losses(values: npt.ArrayLike) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Split the changes between consecutive values into gains and losses.
+
+    Args:
+        values: The values, in chronological order.
+
+    Returns:
+        The gains and the losses, both positive, one per value after the first.
+
+    """
+    changes = np.diff(np.asarray(values, dtype=np.float64))
+
+    return np.clip(changes, 0.0, None), np.clip(-changes, 0.0, None)
+
+
+def wilder_averages(
+    gains: npt.NDArray[np.float64],
+    losses: npt.NDArray[np.float64],
+    period: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Average gains and losses with Wilder's smoothing.
+
+    The first averages are the means of the first `period` gains and losses,
+    and each later one weighs the new gain or loss by one over the period.
+
+    Args:
+        gains: The gains, one per change.
+        losses: The losses, one per change.
+        period: The number of changes of the first averages.
+
+    Returns:
+        The average gains and losses, one per change from the `period`-th on,
+        empty if there are fewer changes than the period.
+
+    """
+    if period <= 0 or len(gains) < period:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+
+    first_gain = float(gains[:period].mean())
+    first_loss = float(losses[:period].mean())
+
+    return (
+        np.concatenate(([first_gain], exponential_smoothing(gains[period:], 1.0 / period, first_gain))),
+        np.concatenate(([first_loss], exponential_smoothing(losses[period:], 1.0 / period, first_loss))),
+    )
+
+
+def relative_strength_index(values: npt.ArrayLike, period: int) -> npt.NDArray[np.float64]:
+    """Compute the Relative Strength Index of a series.
+
+    Args:
+        values: The values, in chronological order.
+        period: The number of changes averaged.
+
+    Returns:
+        The index for each value from the one at position `period` on, 100
+        where there are no losses, empty if there are not more values than the
+        period.
+
+    """
+    return strength_index(*wilder_averages(*gains_and_losses(values), period))
+
+
+def strength_index(
+    average_gains: npt.NDArray[np.float64],
+    average_losses: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Compute the Relative Strength Index from average gains and losses.
+
+    Args:
+        average_gains: The average gains.
+        average_losses: The average losses, one per average gain.
+
+    Returns:
+        The index for each pair of averages, 100 where there are no losses.
+
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = _MAX_RSI - _MAX_RSI / (1.0 + average_gains / average_losses)
+
+    return np.where(average_losses == 0, _MAX_RSI, rsi)
@@ -0,0 +1,30 @@
+"""Simple Moving Average (SMA)."""
+
+import numpy as np
+import numpy.typing as npt
+
+from .rolling import rolling_sums
+
+
+def simple_moving_average(values: npt.ArrayLike, window: int) -> npt.NDArray[np.float64]:
+    """Compute the Simple Moving Average of a series.
+
+    Every window is summed from running sums restarted at every block, so the
+    cost does not depend on the window and the error not on the length.
+
+    Args:
+        values: The values, in chronological order.
+        window: The number of values averaged.
+
+    Returns:
+        The average of each window ending at the value at the same position
+        plus the window minus one, empty if there are fewer values than the
+        window or the window is not positive.
+
+    """
+    xs = np.asarray(values, dtype=np.float64)
+
+    if window <= 0 or len(xs) < window:
+        return np.empty(0, dtype=np.float64)
+
+    return rolling_sums(xs, window) / window
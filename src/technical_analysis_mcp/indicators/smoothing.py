@@ -0,0 +1,62 @@
+"""Exponential smoothing of series."""
+
+import numpy as np
+import numpy.typing as npt
+
+# Values combined with a single matrix product. Larger blocks mean fewer
+# levels of recursion but more multiplications per value.
+_BLOCK_SIZE = 32
+
+
+def exponential_smoothing(values: npt.ArrayLike, alpha: float, initial: float) -> npt.NDArray[np.float64]:
+    """Smooth a series exponentially.
+
+    Computes `smoothed[i] = (1 - alpha) * smoothed[i - 1] + alpha * values[i]`,
+    starting from `initial`, without a loop over the values.
+
+    Args:
+        values: The values to smooth.
+        alpha: The weight of each new value, between zero and one.
+        initial: The smoothed value before the first one.
+
+    Returns:
+        The smoothed values, one per value.
+
+    """
+    return _decaying_sums(alpha * np.asarray(values, dtype=np.float64), 1.0 - alpha, initial)
+
+
+def _decaying_sums(inputs: npt.NDArray[np.float64], decay: float, initial: float) -> npt.NDArray[np.float64]:
+    """Solve the recurrence `sums[i] = decay * sums[i - 1] + inputs[i]`.
+
+    The inputs are split into blocks, and the sums within every block are
+    computed from zero with a single matrix product. The sum carried into each
+    block follows the same recurrence over the last sums of the blocks, with
+    the decay of a whole block, so it is solved recursively.
+
+    Args:
+        inputs: The inputs of the recurrence.
+        decay: The weight of the previous sum.
+        initial: The sum before the first input.
+
+    Returns:
+        The sums, one per input.
+
+    """
+    n = len(inputs)
+
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+
+    size = min(_BLOCK_SIZE, n)
+    decays = decay ** np.arange(size + 1, dtype=np.float64)
+    lags = np.subtract.outer(np.arange(size), np.arange(size))
+    kernel = np.where(lags >= 0, decays[np.maximum(lags, 0)], 0.0)
+
+    blocks = np.zeros(-(-n // size) * size, dtype=np.float64)
+    blocks[:n] = inputs
+    sums = blocks.reshape(-1, size) @ kernel.T
+    carries = np.concatenate(([initial], _decaying_sums(sums[:-1, -1], float(decays[-1]), initial)))
+    sums += np.outer(carries, decays[1:])
+
+    return sums.ravel()[:n]
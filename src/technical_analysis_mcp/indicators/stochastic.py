@@ -0,0 +1,99 @@
+"""Stochastic oscillator and Williams %R."""
+
+import numpy as np
+import numpy.typing as npt
+
+from .rolling import rolling_max, rolling_min
+from .sma import simple_moving_average
+
+_MAX_PERCENT = 100.0
+
+
+def stochastic_oscillator(
+    high: npt.NDArray[np.float64],
+    low: npt.NDArray[np.float64],
+    close: npt.NDArray[np.float64],
+    window: int,
+    smoothing: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Compute the %K and %D lines of the stochastic oscillator.
+
+    %K is where the close lies between the lowest low, at 0, and the highest
+    high, at 100, of the window ending at it, and %D is the Simple Moving
+    Average of %K.
+
+    Args:
+        high: The highest prices.
+        low: The lowest prices, one per highest price.
+        close: The closing prices, one per highest price.
+        window: The number of bars of the highest high and lowest low.
+        smoothing: The number of %K values averaged by %D.
+
+    Returns:
+        %K, 50 where the window has no range, and %D, NaN until its window
+        fills, at each bar from the one at position `window - 1` on, both
+        empty if there are fewer bars than the window.
+
+    """
+    k = stochastic_k(high, low, close, window)
+    d = np.full(len(k), np.nan)
+
+    if len(k) >= smoothing:
+        d[smoothing - 1 :] = simple_moving_average(k, smoothing)
+
+    return k, d
+
+
+def williams_r(
+    high: npt.NDArray[np.float64],
+    low: npt.NDArray[np.float64],
+    close: npt.NDArray[np.float64],
+    window: int,
+) -> npt.NDArray[np.float64]:
+    """Compute the Williams %R.
+
+    Args:
+        high: The highest prices.
+        low: The lowest prices, one per highest price.
+        close: The closing prices, one per highest price.
+        window: The number of bars of the highest high and lowest low.
+
+    Returns:
+        Where the close lies between the highest high, at 0, and the lowest
+        low, at -100, of the window ending at each bar from the one at position
+        `window - 1` on, -50 where the window has no range, empty if there are
+        fewer bars than the window.
+
+    """
+    return stochastic_k(high, low, close, window) - _MAX_PERCENT
+
+
+def stochastic_k(
+    high: npt.NDArray[np.float64],
+    low: npt.NDArray[np.float64],
+    close: npt.NDArray[np.float64],
+    window: int,
+) -> npt.NDArray[np.float64]:
+    """Compute the %K line of the stochastic oscillator.
+
+    Args:
+        high: The highest prices.
+        low: The lowest prices, one per highest price.
+        close: The closing prices, one per highest price.
+        window: The number of bars of the highest high and lowest low.
+
+    Returns:
+        Where the close lies between the lowest low, at 0, and the highest
+        high, at 100, of the window ending at each bar from the one at position
+        `window - 1` on, 50 where the window has no range, empty if there are
+        fewer bars than the window.
+
+    """
+    highest = rolling_max(high, window)
+    lowest = rolling_min(low, window)
+    ranges = highest - lowest
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = _MAX_PERCENT * (close[window - 1 :] - lowest) / ranges
+
+    return np.where(ranges > 0, k, _MAX_PERCENT / 2)
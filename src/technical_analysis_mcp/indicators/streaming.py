@@ -0,0 +1,373 @@
+"""Indicator states updated one value at a time."""
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import NamedTuple, Protocol, Self
+
+import numpy as np
+import numpy.typing as npt
+
+from .ema import ema_weight, exponential_moving_average
+from .rsi import gains_and_losses, strength_index, wilder_averages
+from .sma import simple_moving_average
+
+_MAX_RSI = 100.0
+
+
+class IndicatorState(Protocol):
+    """State of an indicator after a number of values."""
+
+    window_local: bool
+    """Whether the state depends only on the last window of values, not on where the series started."""
+
+    def update(self, value: float) -> float:
+        """Add the next value.
+
+        Args:
+            value: The next value of the series.
+
+        Returns:
+            The indicator at the new value.
+
+        """
+        ...
+
+    def copy(self) -> Self:
+        """Copy the state, so it can be updated without changing this one.
+
+        Returns:
+            The copy.
+
+        """
+        ...
+
+
+class RsiState:
+    """Wilder's Relative Strength Index, carrying the average gain and loss and the last price."""
+
+    window_local = False
+
+    def __init__(self, period: int, average_gain: float, average_loss: float, last_price: float) -> None:
+        """Initialize the state.
+
+        Args:
+            period: The number of changes averaged.
+            average_gain: The average gain up to the last price.
+            average_loss: The average loss up to the last price.
+            last_price: The last price added.
+
+        """
+        self.period = period
+        self.average_gain = average_gain
+        self.average_loss = average_loss
+        self.last_price = last_price
+
+    @property
+    def value(self) -> float:
+        """The index at the last price, 100 if there are no losses."""
+        if self.average_loss == 0:
+            return _MAX_RSI
+
+        return _MAX_RSI - _MAX_RSI / (1 + self.average_gain / self.average_loss)
+
+    def update(self, value: float) -> float:
+        """Add the next price in constant time.
+
+        Args:
+            value: The next price.
+
+        Returns:
+            The index at the new price.
+
+        """
+        change = value - self.last_price
+        self.average_gain = (self.average_gain * (self.period - 1) + max(change, 0.0)) / self.period
+        self.average_loss = (self.average_loss * (self.period - 1) + max(-change, 0.0)) / self.period
+        self.last_price = value
+
+        return self.value
+
+    def copy(self) -> "RsiState":
+        """Copy the state, so it can be updated without changing this one.
+
+        Returns:
+            The copy.
+
+        """
+        return RsiState(self.period, self.average_gain, self.average_loss, self.last_price)
+
+
+class SmaState:
+    """Simple Moving Average, carrying the values of the window in a ring buffer and their running sum."""
+
+    window_local = True
+
+    def __init__(self, window: int, values: Iterable[float]) -> None:
+        """Initialize the state with the values of a full window.
+
+        Args:
+            window: The number of values averaged.
+            values: The last values of the series, at least a window of them.
+
+        """
+        self.window = window
+        self.values: deque[float] = deque(values, maxlen=window)
+        self.total = float(sum(self.values))
+
+    @property
+    def value(self) -> float:
+        """The average of the last window."""
+        return self.total / self.window
+
+    def update(self, value: float) -> float:
+        """Add the next value in constant time.
+
+        Args:
+            value: The next value.
+
+        Returns:
+            The average of the window ending at the new value.
+
+        """
+        self.total += value - self.values[0]
+        self.values.append(value)
+
+        return self.value
+
+    def copy(self) -> "SmaState":
+        """Copy the state, so it can be updated without changing this one.
+
+        Returns:
+            The copy.
+
+        """
+        state = SmaState(self.window, self.values)
+        state.total = self.total
+
+        return state
+
+
+class EmaState:
+    """Exponential Moving Average, carrying the last average."""
+
+    window_local = False
+
+    def __init__(self, window: int, value: float) -> None:
+        """Initialize the state.
+
+        Args:
+            window: The number of values of the average.
+            value: The average at the last value added.
+
+        """
+        self.window = window
+        self.value = value
+
+    def update(self, value: float) -> float:
+        """Add the next value in constant time.
+
+        Args:
+            value: The next value.
+
+        Returns:
+            The average at the new value.
+
+        """
+        weight = ema_weight(self.window)
+        self.value = (1.0 - weight) * self.value + weight * value
+
+        return self.value
+
+    def copy(self) -> "EmaState":
+        """Copy the state, so it can be updated without changing this one.
+
+        Returns:
+            The copy.
+
+        """
+        return EmaState(self.window, self.value)
+
+
+class StreamingSeries(NamedTuple):
+    """The values of an indicator over the complete bars of a series, with its state after them."""
+
+    state: IndicatorState
+    """The state after the last complete bar."""
+
+    first_timestamp: int
+    """The timestamp of the first bar, in nanoseconds since the epoch."""
+
+    last_timestamp: int
+    """The timestamp of the last complete bar added, in nanoseconds since the epoch."""
+
+    last_price: float
+    """The price of the last complete bar added, to detect re-adjusted histories."""
+
+    bar_count: int
+    """The number of complete bars added."""
+
+    values: npt.NDArray[np.float64]
+    """The indicator at each complete bar it is defined for."""
+
+
+type IndicatorStart = Callable[[npt.NDArray[np.float64]], tuple[IndicatorState, npt.NDArray[np.float64]] | None]
+
+
+def start_ema(prices: npt.NDArray[np.float64], window: int) -> tuple[IndicatorState, npt.NDArray[np.float64]] | None:
+    """Compute the Exponential Moving Average of a series and its state after the last value.
+
+    Args:
+        prices: The values, in chronological order.
+        window: The number of values of the average.
+
+    Returns:
+        The state and the average at each value from the one at position
+        `window - 1` on, or None if there are fewer values than the window.
+
+    """
+    averages = exponential_moving_average(prices, window)
+
+    if len(averages) == 0:
+        return None
+
+    return EmaState(window, float(averages[-1])), averages
+
+
+def start_rsi(prices: npt.NDArray[np.float64], period: int) -> tuple[IndicatorState, npt.NDArray[np.float64]] | None:
+    """Compute the Relative Strength Index of a series and its state after the last price.
+
+    Args:
+        prices: The prices, in chronological order.
+        period: The number of changes averaged.
+
+    Returns:
+        The state and the index of each price from the one at position `period`
+        on, or None if there are not more prices than the period.
+
+    """
+    average_gains, average_losses = wilder_averages(*gains_and_losses(prices), period)
+
+    if len(average_gains) == 0:
+        return None
+
+    state = RsiState(period, float(average_gains[-1]), float(average_losses[-1]), float(prices[-1]))
+
+    return state, strength_index(average_gains, average_losses)
+
+
+def start_sma(prices: npt.NDArray[np.float64], window: int) -> tuple[IndicatorState, npt.NDArray[np.float64]] | None:
+    """Compute the Simple Moving Average of a series and its state after the last value.
+
+    Args:
+        prices: The values, in chronological order.
+        window: The number of values averaged.
+
+    Returns:
+        The state and the average of each complete window, or None if there are
+        fewer values than the window.
+
+    """
+    averages = simple_moving_average(prices, window)
+
+    if len(averages) == 0:
+        return None
+
+    return SmaState(window, prices[-window:].tolist()), averages
+
+
+def stream_series(
+    streamed: StreamingSeries | None,
+    timestamps: npt.NDArray[np.int64],
+    prices: npt.NDArray[np.float64],
+    start: IndicatorStart,
+) -> tuple[StreamingSeries | None, npt.NDArray[np.float64]]:
+    """Compute an indicator over a series, continuing from a previous state if it still applies.
+
+    The last bar may still change, e.g. the current intraday bar, so it is
+    never added to the state. Its value is computed on a copy of the state.
+    The previous state applies if the series overlaps the bars it was computed
+    over, up to the last bar added, which is unchanged. If the state only depends
+    on the last window, like the SMA, the oldest bars may have been dropped, e.g.
+    by a rolling period like `1mo`, and their values are dropped too. States
+    seeded from the first bar, like the EMA and RSI, only apply to a series
+    starting at the same bar. Then only the bars after the last one added are
+    added, each in constant time. Otherwise the indicator is computed from scratch.
+
+    Args:
+        streamed: The indicator over an earlier version of the series, if any.
+        timestamps: The timestamps of the bars in nanoseconds since the epoch, in chronological order.
+        prices: The prices of the bars, one per timestamp.
+        start: The computation of the indicator and its state from scratch.
+
+    Returns:
+        The indicator over the complete bars to keep for the next version of the
+        series, or None if there are too few bars, and the indicator at every
+        bar it is defined for, including the last one.
+
+    """
+    complete = len(prices) - 1
+    dropped = _dropped_bars(streamed, timestamps, prices) if streamed is not None else None
+
+    if streamed is not None and dropped is not None:
+        state = streamed.state.copy()
+        kept = streamed.bar_count - dropped
+        added = [state.update(price) for price in prices[kept:complete].tolist()]
+        values = np.concatenate((streamed.values[dropped:], added))
+    else:
+        started = start(prices[:complete]) if complete > 0 else None
+
+        if started is None:
+            result = start(prices)
+            return None, result[1] if result is not None else np.empty(0, dtype=np.float64)
+
+        state, values = started
+
+    streamed = StreamingSeries(
+        state,
+        int(timestamps[0]),
+        int(timestamps[complete - 1]),
+        float(prices[complete - 1]),
+        complete,
+        values,
+    )
+
+    return streamed, np.append(values, state.copy().update(float(prices[-1])))
+
+
+def _dropped_bars(
+    streamed: StreamingSeries,
+    timestamps: npt.NDArray[np.int64],
+    prices: npt.NDArray[np.float64],
+) -> int | None:
+    """Find how many of the oldest bars of an earlier version of a series the current one dropped.
+
+    The last bar added to the indicator is found by binary search on the
+    timestamps, so the current version may start later than the earlier one.
+
+    Args:
+        streamed: The indicator over the earlier version.
+        timestamps: The timestamps of the bars of the current version.
+        prices: The prices of the bars of the current version.
+
+    Returns:
+        The number of bars dropped from the start of the earlier version, or
+        None if the indicator does not apply to the current version: it starts
+        before the earlier one, or after it for a state seeded from the first
+        bar, does not have the last bar added unchanged and followed by at least
+        one bar, or dropped more bars than there are values.
+
+    """
+    last = int(np.searchsorted(timestamps, streamed.last_timestamp))
+    dropped = streamed.bar_count - 1 - last
+
+    if (
+        last >= len(prices) - 1
+        or int(timestamps[last]) != streamed.last_timestamp
+        or float(prices[last]) != streamed.last_price
+        or int(timestamps[0]) < streamed.first_timestamp
+        or (int(timestamps[0]) != streamed.first_timestamp and not streamed.state.window_local)
+        or not 0 <= dropped <= len(streamed.values)
+    ):
+        return None
+
+    return dropped
@@ -0,0 +1,59 @@
+"""Indicators computed for many lengths at once."""
+
+import numpy as np
+import numpy.typing as npt
+
+from .rolling import rolling_sums
+from .rsi import gains_and_losses, strength_index, wilder_averages
+
+
+def simple_moving_averages(values: npt.ArrayLike, windows: list[int]) -> npt.NDArray[np.float64]:
+    """Compute the Simple Moving Average of a series for several windows.
+
+    Every window is summed like in `simple_moving_average`, from running sums
+    restarted at every block, and written straight into its row.
+
+    Args:
+        values: The values, in chronological order.
+        windows: The positive numbers of values averaged.
+
+    Returns:
+        A row per window with the average of the window ending at each value,
+        NaN where there are fewer values than the window so far.
+
+    """
+    xs = np.asarray(values, dtype=np.float64)
+    averages = np.full((len(windows), len(xs)), np.nan)
+
+    for row, window in enumerate(windows):
+        if window <= len(xs):
+            cells = averages[row, window - 1 :]
+            cells[:] = rolling_sums(xs, window)
+            cells /= window
+
+    return averages
+
+
+def relative_strength_indices(values: npt.ArrayLike, periods: list[int]) -> npt.NDArray[np.float64]:
+    """Compute the Relative Strength Index of a series for several periods.
+
+    The gains and losses are computed once and shared by every period.
+
+    Args:
+        values: The values, in chronological order.
+        periods: The positive numbers of changes averaged.
+
+    Returns:
+        A row per period with the index at each value, NaN where there are not
+        more values than the period so far.
+
+    """
+    xs = np.asarray(values, dtype=np.float64)
+    indices = np.full((len(periods), len(xs)), np.nan)
+    gains, losses = gains_and_losses(xs)
+
+    for row, period in enumerate(periods):
+        rsi = strength_index(*wilder_averages(gains, losses, period))
+        indices[row, len(xs) - len(rsi) :] = rsi
+
+    return indices
@@ -0,0 +1,142 @@
+"""True range and volatility estimators over full price bars."""
+
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+from .rolling import rolling_sums
+from .smoothing import exponential_smoothing
+
+# Scale of the squared high-low range of Parkinson's estimator, 1 / (4 ln 2).
+_PARKINSON_SCALE = 1.0 / (4.0 * math.log(2.0))
+
+# Weight of the squared open-close return of Garman and Klass' estimator, 2 ln 2 - 1.
+_GARMAN_KLASS_WEIGHT = 2.0 * math.log(2.0) - 1.0
+
+
+def true_range(
+    high: npt.NDArray[np.float64],
+    low: npt.NDArray[np.float64],
+    close: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Compute the true range of each bar after the first.
+
+    Args:
+        high: The highest prices.
+        low: The lowest prices, one per highest price.
+        close: The closing prices, one per highest price.
+
+    Returns:
+        The greatest of the high-low range and the distances from the previous
+        close to the high and to the low, one per bar after the first.
+
+    """
+    previous = close[:-1]
+
+    return np.maximum(high[1:], previous) - np.minimum(low[1:], previous)
+
+
+def average_true_range(
+    high: npt.NDArray[np.float64],
+    low: npt.NDArray[np.float64],
+    close: npt.NDArray[np.float64],
+    period: int,
+) -> npt.NDArray[np.float64]:
+    """Compute Wilder's Average True Range.
+
+    The first average is the mean of the first `period` true ranges, and each
+    later one weighs the new true range by one over the period.
+
+    Args:
+        high: The highest prices.
+        low: The lowest prices, one per highest price.
+        close: The closing prices, one per highest price.
+        period: The number of true ranges of the first average.
+
+    Returns:
+        The average at each bar from the one at position `period` on, empty if
+        there are not more bars than the period or the period is not positive.
+
+    """
+    ranges = true_range(high, low, close)
+
+    if period <= 0 or len(ranges) < period:
+        return np.empty(0, dtype=np.float64)
+
+    first = float(ranges[:period].mean())
+
+    return np.concatenate(([first], exponential_smoothing(ranges[period:], 1.0 / period, first)))
+
+
+def range_volatilities(
+    open_: npt.NDArray[np.float64],
+    high: npt.NDArray[np.float64],
+    low: npt.NDArray[np.float64],
+    close: npt.NDArray[np.float64],
+    window: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Estimate the volatility of each window of bars from their open, high, low and close.
+
+    Parkinson's estimator uses the high-low range of each bar, Garman and
+    Klass' adds its open-close return, and Yang and Zhang's adds the return
+    from the previous close to the open, so it also captures overnight gaps.
+    The logarithmic returns of every bar are computed once over the arrays,
+    and their sums over each window are taken from running sums.
+
+    Args:
+        open_: The opening prices.
+        high: The highest prices, one per opening price.
+        low: The lowest prices, one per opening price.
+        close: The closing prices, one per opening price.
+        window: The number of bars of each window, at least two.
+
+    Returns:
+        Parkinson's, Garman and Klass' and Yang and Zhang's estimates of the
+        standard deviation of the logarithmic returns per bar, for each bar
+        from the one at position `window - 1` on, the last NaN at the first
+        one as it needs the close before the window, all empty if there are
+        fewer bars than the window or the window is below two.
+
+    """
+    if window < 2 or len(close) < window:  # noqa: PLR2004
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, empty
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        high_low = np.log(high / low)
+        close_open = np.log(close / open_)
+        high_close, high_open = np.log(high / close), np.log(high / open_)
+        low_close, low_open = np.log(low / close), np.log(low / open_)
+        overnight = np.log(open_[1:] / close[:-1])
+
+    squared_ranges = high_low * high_low
+    parkinson = _PARKINSON_SCALE * rolling_sums(squared_ranges, window) / window
+    garman_klass = rolling_sums(0.5 * squared_ranges - _GARMAN_KLASS_WEIGHT * close_open * close_open, window) / window
+
+    weight = 0.34 / (1.34 + (window + 1) / (window - 1))
+    rogers_satchell = rolling_sums(high_close * high_open + low_close * low_open, window)[1:] / window
+    yang_zhang = np.full(len(parkinson), np.nan)
+    yang_zhang[1:] = (
+        _sample_variances(overnight, window)
+        + weight * _sample_variances(close_open[1:], window)
+        + (1.0 - weight) * rogers_satchell
+    )
+
+    return np.sqrt(parkinson), np.sqrt(np.maximum(garman_klass, 0.0)), np.sqrt(np.maximum(yang_zhang, 0.0))
+
+
+def _sample_variances(values: npt.NDArray[np.float64], window: int) -> npt.NDArray[np.float64]:
+    """Compute the sample variance of each window of a series.
+
+    Args:
+        values: The values, at least a window of them.
+        window: The number of values of each window, at least two.
+
+    Returns:
+        The variance of each window, ending at each value from the one at position `window - 1` on.
+
+    """
+    sums = rolling_sums(values, window)
+
+    return (rolling_sums(values * values, window) - sums * sums / window) / (window - 1)
@@ -1,24 +1,48 @@
 """Data models module."""
 
+from .asset_price_histories import AssetPriceHistories
 from .asset_price_history import AssetPriceHistory
+from .cache_statistics import CacheStatistics, CacheUsage
+from .columnar_asset_price_history import ColumnarAssetPriceHistory
+from .compact_time_series import CompactTimeSeries, build_compact_time_series
 from .data_point import DataPoint
 from .error import Error
+from .indicator_name import IndicatorName
+from .indicator_results import IndicatorResult, IndicatorResults
+from .indicator_spec import IndicatorSpec
 from .interval import Interval
 from .period import Period
 from .price import Price
+from .price_format import PriceFormat
 from .price_source import PriceSource
+from .series_format import SeriesFormat
 from .ticker_information import TickerInformation, parse_yfinance_ticker_information
 from .time_series import TimeSeries
+from .time_series_table import TimeSeriesTable, build_time_series_table
 
 __all__ = [
+    "AssetPriceHistories",
     "AssetPriceHistory",
+    "CacheStatistics",
+    "CacheUsage",
+    "ColumnarAssetPriceHistory",
+    "CompactTimeSeries",
     "DataPoint",
     "Error",
+    "IndicatorName",
+    "IndicatorResult",
+    "IndicatorResults",
+    "IndicatorSpec",
     "Interval",
     "Period",
     "Price",
+    "PriceFormat",
     "PriceSource",
+    "SeriesFormat",
     "TickerInformation",
     "TimeSeries",
+    "TimeSeriesTable",
+    "build_compact_time_series",
+    "build_time_series_table",
     "parse_yfinance_ticker_information",
 ]
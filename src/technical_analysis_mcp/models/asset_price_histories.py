@@ -0,0 +1,14 @@
+"""Model for the price histories of several assets."""
+
+from pydantic import BaseModel, Field
+
+from .asset_price_history import AssetPriceHistory
+from .error import Error
+
+
+class AssetPriceHistories(BaseModel):
+    """Represents the price histories of several assets fetched together."""
+
+    histories: dict[str, AssetPriceHistory | Error] = Field(
+        description="The price history of each ticker, or the error that prevented fetching it.",
+    )
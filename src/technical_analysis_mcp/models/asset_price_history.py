@@ -14,3 +14,7 @@ class AssetPriceHistory(BaseModel):
     period: Period = Field(description="The time period for which the historical data was fetched.")
     interval: Interval = Field(description="The interval between data points.")
     prices: list[Price] = Field(description="A list of price entries.")
+    next_cursor: str | None = Field(
+        default=None,
+        description="The cursor to continue from the first price entry not returned, or null if there are no more.",
+    )
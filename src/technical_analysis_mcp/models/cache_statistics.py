@@ -0,0 +1,28 @@
+"""Model for the usage of the in-memory caches."""
+
+from pydantic import BaseModel, Field
+
+_DESCRIPTIONS = {
+    "entries": "The number of entries, including expired ones not evicted yet.",
+    "max_entries": "The maximum number of entries kept.",
+    "hits": "The number of lookups that found a fresh entry.",
+    "misses": "The number of lookups that found no fresh entry.",
+    "hit_rate": "The fraction of lookups that found a fresh entry, or null if there were none.",
+    "caches": "The usage of each cache, by name.",
+}
+
+
+class CacheUsage(BaseModel):
+    """The size and hit rate of an in-memory cache."""
+
+    entries: int = Field(description=_DESCRIPTIONS["entries"])
+    max_entries: int = Field(description=_DESCRIPTIONS["max_entries"])
+    hits: int = Field(description=_DESCRIPTIONS["hits"])
+    misses: int = Field(description=_DESCRIPTIONS["misses"])
+    hit_rate: float | None = Field(description=_DESCRIPTIONS["hit_rate"])
+
+
+class CacheStatistics(BaseModel):
+    """The usage of every in-memory cache of the server since it started."""
+
+    caches: dict[str, CacheUsage] = Field(description=_DESCRIPTIONS["caches"])
@@ -0,0 +1,28 @@
+"""Model for columnar asset price history."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from .interval import Interval
+from .period import Period
+
+
+class ColumnarAssetPriceHistory(BaseModel):
+    """Represents an asset price history as parallel arrays, one per price field."""
+
+    ticker: str = Field(description="The ticker symbol of the asset.")
+    period: Period = Field(description="The time period for which the historical data was fetched.")
+    interval: Interval = Field(description="The interval between data points.")
+    timestamps: list[datetime] = Field(description="The date and time of each price entry.")
+    open: list[float] = Field(description="The opening price of each price entry.")
+    high: list[float] = Field(description="The highest price of each price entry.")
+    low: list[float] = Field(description="The lowest price of each price entry.")
+    close: list[float] = Field(description="The closing price of each price entry.")
+    volume: list[int] = Field(description="The trading volume of each price entry.")
+    dividends: list[float] = Field(description="The dividends paid during each price entry.")
+    stock_splits: list[float] = Field(description="The stock splits that occurred during each price entry.")
+    next_cursor: str | None = Field(
+        default=None,
+        description="The cursor to continue from the first price entry not returned, or null if there are no more.",
+    )
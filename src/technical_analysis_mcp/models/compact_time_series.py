@@ -0,0 +1,83 @@
+"""Model for compact time series."""
+
+from datetime import datetime
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel, Field
+
+_DESCRIPTIONS = {
+    "ticker": "The ticker symbol for this time series.",
+    "start": "The timestamp of the first value, in seconds since the Unix epoch.",
+    "step": "The seconds between consecutive values if they are evenly spaced, otherwise null.",
+    "timestamps": "The timestamp of each value in seconds since the Unix epoch, or null if they are evenly spaced.",
+    "values": "The values in chronological order.",
+    "decimals": "The number of decimal places the values are rounded to.",
+}
+
+
+class CompactTimeSeries(BaseModel):
+    """A time series encoded as epoch timestamps and an array of rounded values."""
+
+    ticker: str = Field(description=_DESCRIPTIONS["ticker"])
+    start: int | None = Field(description=_DESCRIPTIONS["start"])
+    step: int | None = Field(default=None, description=_DESCRIPTIONS["step"])
+    timestamps: list[int] | None = Field(default=None, description=_DESCRIPTIONS["timestamps"])
+    values: list[float] = Field(description=_DESCRIPTIONS["values"])
+    decimals: int = Field(description=_DESCRIPTIONS["decimals"])
+
+
+def build_compact_time_series(
+    ticker: str,
+    dates: list[datetime],
+    values: npt.ArrayLike,
+    decimals: int,
+) -> CompactTimeSeries:
+    """Encode a time series compactly.
+
+    Evenly spaced timestamps are encoded as a start and a step, and the rest as
+    an array of epoch seconds.
+
+    Args:
+        ticker: The ticker symbol.
+        dates: The timezone-aware timestamps, in chronological order.
+        values: The values, one per timestamp.
+        decimals: The number of decimal places to round the values to.
+
+    Returns:
+        The compact time series.
+
+    """
+    start, step, timestamps = encode_timestamps(dates)
+
+    return CompactTimeSeries(
+        ticker=ticker,
+        start=start,
+        step=step,
+        timestamps=timestamps,
+        values=np.round(np.asarray(values, dtype=np.float64), decimals).tolist(),
+        decimals=decimals,
+    )
+
+
+def encode_timestamps(dates: list[datetime]) -> tuple[int | None, int | None, list[int] | None]:
+    """Encode timestamps as a start and a step, or as epoch seconds if not evenly spaced.
+
+    Args:
+        dates: The timezone-aware timestamps, in chronological order.
+
+    Returns:
+        The epoch seconds of the first timestamp, or None if there are none,
+        the seconds between timestamps if evenly spaced, otherwise None, and
+        the epoch seconds of every timestamp if not evenly spaced, otherwise None.
+
+    """
+    epochs = [int(date.timestamp()) for date in dates]
+    steps = np.diff(epochs)
+    evenly_spaced = len(steps) > 0 and bool((steps == steps[0]).all())
+
+    return (
+        epochs[0] if epochs else None,
+        int(steps[0]) if evenly_spaced else None,
+        None if evenly_spaced else epochs,
+    )
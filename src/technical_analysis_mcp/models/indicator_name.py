@@ -0,0 +1,15 @@
+"""Model for indicator name."""
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+IndicatorName = Annotated[
+    Literal["ema", "rsi", "sma"],
+    Field(
+        description=(
+            "The indicator to compute: 'ema' for the Exponential Moving Average, 'rsi' for the Relative Strength "
+            "Index, or 'sma' for the Simple Moving Average."
+        ),
+    ),
+]
@@ -0,0 +1,35 @@
+"""Model for the results of several indicators."""
+
+from pydantic import BaseModel, Field
+
+from .compact_time_series import CompactTimeSeries
+from .error import Error
+from .indicator_spec import IndicatorSpec
+from .interval import Interval
+from .period import Period
+from .time_series import TimeSeries
+
+_DESCRIPTIONS = {
+    "spec": "The indicator and its parameters.",
+    "series": "The indicator series, or the error that prevented computing it.",
+    "ticker": "The ticker symbol the indicators are computed for.",
+    "period": "The time period of the price history the indicators are computed over.",
+    "interval": "The interval between data points.",
+    "results": "The result of each indicator, in the order they were requested.",
+}
+
+
+class IndicatorResult(BaseModel):
+    """The series of an indicator, or the error that prevented computing it."""
+
+    spec: IndicatorSpec = Field(description=_DESCRIPTIONS["spec"])
+    series: TimeSeries | CompactTimeSeries | Error = Field(description=_DESCRIPTIONS["series"])
+
+
+class IndicatorResults(BaseModel):
+    """The results of several indicators computed over the same price history."""
+
+    ticker: str = Field(description=_DESCRIPTIONS["ticker"])
+    period: Period = Field(description=_DESCRIPTIONS["period"])
+    interval: Interval = Field(description=_DESCRIPTIONS["interval"])
+    results: list[IndicatorResult] = Field(description=_DESCRIPTIONS["results"])
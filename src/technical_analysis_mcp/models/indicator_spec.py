@@ -0,0 +1,18 @@
+"""Model for indicator specification."""
+
+from pydantic import BaseModel, Field
+
+from .indicator_name import IndicatorName
+from .price_source import PriceSource
+
+_DESCRIPTIONS = {
+    "length": "The number of candles of the indicator, i.e. the RSI candles or the EMA or SMA window.",
+}
+
+
+class IndicatorSpec(BaseModel):
+    """An indicator to compute, with its parameters."""
+
+    indicator: IndicatorName
+    length: int = Field(gt=0, description=_DESCRIPTIONS["length"])
+    source: PriceSource = "close"
@@ -0,0 +1,15 @@
+"""Model for price format."""
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+PriceFormat = Annotated[
+    Literal["rows", "columnar"],
+    Field(
+        description=(
+            "The layout of the prices: 'rows' for a list of price entries, or 'columnar' for parallel arrays, "
+            "which are several times smaller for long histories."
+        ),
+    ),
+]
@@ -0,0 +1,15 @@
+"""Model for series format."""
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+SeriesFormat = Annotated[
+    Literal["points", "compact"],
+    Field(
+        description=(
+            "The layout of the series: 'points' for a list of dated values, or 'compact' for epoch timestamps "
+            "and a values array rounded to a number of decimals, which is much smaller for long series."
+        ),
+    ),
+]
@@ -0,0 +1,79 @@
+"""Model for time series table."""
+
+from datetime import datetime
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel, Field
+
+from .compact_time_series import encode_timestamps
+
+_DESCRIPTIONS = {
+    "ticker": "The ticker symbol for this table.",
+    "start": "The timestamp of the first row, in seconds since the Unix epoch.",
+    "step": "The seconds between consecutive rows if they are evenly spaced, otherwise null.",
+    "timestamps": "The timestamp of each row in seconds since the Unix epoch, or null if they are evenly spaced.",
+    "columns": "The name of each column, e.g. 'sma_20' for the SMA over 20 candles.",
+    "values": "The values of each column in chronological order, null where the column has no value yet.",
+    "decimals": "The number of decimal places the values are rounded to.",
+}
+
+
+class TimeSeriesTable(BaseModel):
+    """Several time series over the same timestamps, encoded as epoch timestamps and a column per series."""
+
+    ticker: str = Field(description=_DESCRIPTIONS["ticker"])
+    start: int | None = Field(description=_DESCRIPTIONS["start"])
+    step: int | None = Field(default=None, description=_DESCRIPTIONS["step"])
+    timestamps: list[int] | None = Field(default=None, description=_DESCRIPTIONS["timestamps"])
+    columns: list[str] = Field(description=_DESCRIPTIONS["columns"])
+    values: list[list[float | None]] = Field(description=_DESCRIPTIONS["values"])
+    decimals: int = Field(description=_DESCRIPTIONS["decimals"])
+
+
+def build_time_series_table(
+    ticker: str,
+    dates: list[datetime],
+    columns: dict[str, npt.ArrayLike],
+    decimals: int,
+) -> TimeSeriesTable:
+    """Encode several time series over the same timestamps compactly.
+
+    Args:
+        ticker: The ticker symbol.
+        dates: The timezone-aware timestamps, in chronological order.
+        columns: The values of each column by name, one per timestamp, NaN where there is no value.
+        decimals: The number of decimal places to round the values to.
+
+    Returns:
+        The time series table.
+
+    """
+    start, step, timestamps = encode_timestamps(dates)
+    values = [np.round(np.asarray(column, dtype=np.float64), decimals) for column in columns.values()]
+
+    return TimeSeriesTable(
+        ticker=ticker,
+        start=start,
+        step=step,
+        timestamps=timestamps,
+        columns=list(columns),
+        values=[_cells(column) for column in values],
+        decimals=decimals,
+    )
+
+
+def _cells(column: npt.NDArray[np.float64]) -> list[float | None]:
+    """Convert a column to a list, with None in place of NaN.
+
+    Args:
+        column: The values of the column.
+
+    Returns:
+        The values, None where there is no value.
+
+    """
+    cells = column.astype(object)
+    cells[np.isnan(column)] = None
+
+    return cells.tolist()
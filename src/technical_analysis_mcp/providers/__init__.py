@@ -0,0 +1,13 @@
+"""Market data providers module."""
+
+from .factory import get_provider
+from .file_provider import FileProvider
+from .provider import PriceProvider
+from .yahoo_finance_provider import YahooFinanceProvider
+
+__all__ = [
+    "FileProvider",
+    "PriceProvider",
+    "YahooFinanceProvider",
+    "get_provider",
+]
@@ -0,0 +1,27 @@
+"""Selection of the source of market data."""
+
+from functools import cache
+
+from technical_analysis_mcp.settings import get_settings
+
+from .file_provider import FileProvider
+from .provider import PriceProvider
+from .yahoo_finance_provider import YahooFinanceProvider
+
+_FILES_DIRECTORY_NAME = "files"
+
+
+@cache
+def get_provider() -> PriceProvider:
+    """Get the process-wide source of market data.
+
+    Returns:
+        The configured provider.
+
+    """
+    settings = get_settings()
+
+    if settings.provider == "files":
+        return FileProvider(settings.provider_directory or settings.data_directory / _FILES_DIRECTORY_NAME)
+
+    return YahooFinanceProvider()
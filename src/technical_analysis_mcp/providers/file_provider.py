@@ -0,0 +1,292 @@
+"""Market data from a local directory of files."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from technical_analysis_mcp.cache import PRICE_COLUMNS, period_start_position, range_positions
+from technical_analysis_mcp.models import Interval, Period
+
+_INFORMATION_FILE = "info.json"
+_TIMEZONE_FIELD = "exchangeTimezoneName"
+_ACTION_FIELDS = ["Dividends", "Stock Splits"]
+
+
+class FileProvider:
+    """Provider serving prepared files, with no network access.
+
+    Every ticker has its own subdirectory named after its upper case symbol,
+    holding one file of bars per interval and its information payload, e.g.:
+
+        AAPL/1d.csv
+        AAPL/5m.npz
+        AAPL/info.json
+
+    CSV files have a `Date` column of ISO 8601 timestamps followed by the bar
+    columns. NPZ files have a `Date` array of nanoseconds since the epoch in
+    UTC and an array per bar column. The `Dividends` and `Stock Splits` columns
+    are optional. Timestamps are converted to the `exchangeTimezoneName` of the
+    information payload, if any.
+
+    Periods are counted back from the last bar of the file, so a fixed data set
+    keeps serving the same bars as time goes by. Each file is read once and
+    kept parsed in memory.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Serve the files of a directory.
+
+        Args:
+            directory: The directory holding a subdirectory per ticker.
+
+        """
+        self._directory = directory
+        self._bars: dict[tuple[str, Interval], pd.DataFrame] = {}
+        self._information: dict[str, dict[str, Any]] = {}
+
+    def history(self, ticker: str, period: Period, interval: Interval) -> pd.DataFrame:
+        """Read the bars of a period.
+
+        Args:
+            ticker: The ticker symbol.
+            period: The time period to read.
+            interval: The interval between bars.
+
+        Returns:
+            The bars indexed by timestamp, empty if the ticker has no file.
+
+        """
+        bars = self._bars_of(ticker, interval)
+
+        if bars.empty:
+            return bars
+
+        index = pd.DatetimeIndex(bars.index)
+
+        return bars.iloc[period_start_position(index, period, index[-1:].to_list()[0]) :]
+
+    def history_since(self, ticker: str, start: datetime, interval: Interval) -> pd.DataFrame:
+        """Read the bars from a point in time onwards.
+
+        Args:
+            ticker: The ticker symbol.
+            start: The timestamp of the first bar.
+            interval: The interval between bars.
+
+        Returns:
+            The bars indexed by timestamp, empty if the ticker has no file.
+
+        """
+        bars = self._bars_of(ticker, interval)
+
+        if bars.empty:
+            return bars
+
+        start_nanoseconds = int(start.timestamp() * 1_000_000_000)
+
+        return bars.iloc[np.searchsorted(pd.DatetimeIndex(bars.index).asi8, start_nanoseconds) :]
+
+    def history_between(self, ticker: str, start: datetime, end: datetime | None, interval: Interval) -> pd.DataFrame:
+        """Read the bars of a time range.
+
+        Args:
+            ticker: The ticker symbol.
+            start: The timestamp of the first bar.
+            end: The timestamp the bars end before, or None for the last bar.
+            interval: The interval between bars.
+
+        Returns:
+            The bars indexed by timestamp, empty if the ticker has no file.
+
+        """
+        bars = self._bars_of(ticker, interval)
+
+        if bars.empty:
+            return bars
+
+        first, last = range_positions(pd.DatetimeIndex(bars.index), start, end)
+
+        return bars.iloc[first:last]
+
+    def download(self, tickers: list[str], period: Period, interval: Interval) -> dict[str, pd.DataFrame]:
+        """Read the bars of a period for several tickers.
+
+        Args:
+            tickers: The normalized ticker symbols.
+            period: The time period to read.
+            interval: The interval between bars.
+
+        Returns:
+            The bars of each ticker indexed by timestamp, empty if the ticker has no file.
+
+        """
+        return {ticker: self.history(ticker, period, interval) for ticker in tickers}
+
+    def download_since(self, tickers: list[str], start: datetime, interval: Interval) -> dict[str, pd.DataFrame]:
+        """Read the bars from a point in time onwards for several tickers.
+
+        Args:
+            tickers: The normalized ticker symbols.
+            start: The timestamp of the first bar.
+            interval: The interval between bars.
+
+        Returns:
+            The bars of each ticker indexed by timestamp, empty if the ticker has no file.
+
+        """
+        return {ticker: self.history_since(ticker, start, interval) for ticker in tickers}
+
+    def period_reference(self, ticker: str, interval: Interval, now: datetime) -> datetime:
+        """Get the time the periods of a ticker are counted back from.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The interval between bars.
+            now: The current time, timezone-aware.
+
+        Returns:
+            The timestamp of the last bar of the file, or the current time if
+            the ticker has no file.
+
+        """
+        bars = self._bars_of(ticker, interval)
+
+        if bars.empty:
+            return now
+
+        return pd.DatetimeIndex(bars.index)[-1:].to_list()[0]
+
+    def information(self, ticker: str) -> dict[str, Any]:
+        """Read the information payload of a ticker.
+
+        Args:
+            ticker: The ticker symbol.
+
+        Returns:
+            The information fields, empty if the ticker has no file.
+
+        Raises:
+            ValueError: If the file is not valid JSON.
+            TypeError: If the file is not a JSON object.
+
+        """
+        symbol = ticker.strip().upper()
+        info = self._information.get(symbol)
+
+        if info is None:
+            info = self._read_information(ticker)
+
+            if info:
+                self._information[symbol] = info
+
+        return info
+
+    def _ticker_directory(self, ticker: str) -> Path | None:
+        """Get the directory of a ticker.
+
+        Args:
+            ticker: The ticker symbol.
+
+        Returns:
+            The directory, or None if the symbol is not a plain file name.
+
+        """
+        symbol = ticker.strip().upper()
+
+        if not symbol or Path(symbol).name != symbol or symbol.startswith("."):
+            return None
+
+        return self._directory / symbol
+
+    def _read_information(self, ticker: str) -> dict[str, Any]:
+        """Read the information file of a ticker.
+
+        Args:
+            ticker: The ticker symbol.
+
+        Returns:
+            The information fields, empty if the ticker has no file.
+
+        Raises:
+            ValueError: If the file is not valid JSON.
+            TypeError: If the file is not a JSON object.
+
+        """
+        directory = self._ticker_directory(ticker)
+        path = directory / _INFORMATION_FILE if directory is not None else None
+
+        if path is None or not path.is_file():
+            return {}
+
+        info = json.loads(path.read_text(encoding="utf-8"))
+
+        if not isinstance(info, dict):
+            message = f"Invalid information file: {path}"
+            raise TypeError(message)
+
+        return info
+
+    def _bars_of(self, ticker: str, interval: Interval) -> pd.DataFrame:
+        """Get every bar of a ticker, reading its file the first time only.
+
+        Missing files are not remembered, so unknown tickers do not fill the memory.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The interval between bars.
+
+        Returns:
+            The bars indexed by timestamp, empty if the ticker has no file.
+
+        """
+        key = (ticker.strip().upper(), interval)
+        bars = self._bars.get(key)
+
+        if bars is None:
+            bars = self._read_bars(ticker, interval)
+
+            if not bars.empty:
+                self._bars[key] = bars
+
+        return bars
+
+    def _read_bars(self, ticker: str, interval: Interval) -> pd.DataFrame:
+        """Read every bar of a ticker.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The interval between bars.
+
+        Returns:
+            The bars indexed by timestamp, empty if the ticker has no file.
+
+        """
+        directory = self._ticker_directory(ticker)
+
+        if directory is None:
+            return pd.DataFrame()
+
+        if (directory / f"{interval}.npz").is_file():
+            with np.load(directory / f"{interval}.npz") as arrays:
+                timestamps = pd.to_datetime(arrays["Date"], utc=True)
+                bars = pd.DataFrame({name: arrays[name] for name in PRICE_COLUMNS if name in arrays}, index=timestamps)
+        elif (directory / f"{interval}.csv").is_file():
+            bars = pd.read_csv(directory / f"{interval}.csv", index_col="Date")
+            bars.index = pd.to_datetime(bars.index, utc=True, format="ISO8601")
+        else:
+            return pd.DataFrame()
+
+        timezone = self.information(ticker).get(_TIMEZONE_FIELD)
+        index = pd.DatetimeIndex(bars.index)
+        bars.index = index.tz_convert(timezone) if timezone else index
+        bars.index.name = "Date"
+
+        for name in _ACTION_FIELDS:
+            if name not in bars.columns:
+                bars[name] = 0.0
+
+        return pd.DataFrame(bars[PRICE_COLUMNS]).sort_index()
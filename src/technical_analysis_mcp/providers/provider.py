@@ -0,0 +1,117 @@
+"""Interface of the sources of market data."""
+
+from datetime import datetime
+from typing import Any, Protocol
+
+import pandas as pd
+
+from technical_analysis_mcp.models import Interval, Period
+
+
+class PriceProvider(Protocol):
+    """Source of price bars and ticker information.
+
+    Bars are returned as data frames indexed by timezone-aware timestamps, with
+    the columns `Open`, `High`, `Low`, `Close`, `Volume`, `Dividends` and
+    `Stock Splits`, and empty if the ticker has no data.
+    """
+
+    def history(self, ticker: str, period: Period, interval: Interval) -> pd.DataFrame:
+        """Get the bars of a period.
+
+        Args:
+            ticker: The ticker symbol.
+            period: The time period to get.
+            interval: The interval between bars.
+
+        Returns:
+            The bars indexed by timestamp.
+
+        """
+        ...
+
+    def history_since(self, ticker: str, start: datetime, interval: Interval) -> pd.DataFrame:
+        """Get the bars from a point in time onwards.
+
+        Args:
+            ticker: The ticker symbol.
+            start: The timestamp of the first bar.
+            interval: The interval between bars.
+
+        Returns:
+            The bars indexed by timestamp.
+
+        """
+        ...
+
+    def history_between(self, ticker: str, start: datetime, end: datetime | None, interval: Interval) -> pd.DataFrame:
+        """Get the bars of a time range.
+
+        Args:
+            ticker: The ticker symbol.
+            start: The timestamp of the first bar.
+            end: The timestamp the bars end before, or None for the latest bar.
+            interval: The interval between bars.
+
+        Returns:
+            The bars indexed by timestamp.
+
+        """
+        ...
+
+    def download(self, tickers: list[str], period: Period, interval: Interval) -> dict[str, pd.DataFrame]:
+        """Get the bars of a period for several tickers at once.
+
+        Args:
+            tickers: The normalized ticker symbols.
+            period: The time period to get.
+            interval: The interval between bars.
+
+        Returns:
+            The bars of each ticker indexed by timestamp.
+
+        """
+        ...
+
+    def download_since(self, tickers: list[str], start: datetime, interval: Interval) -> dict[str, pd.DataFrame]:
+        """Get the bars from a point in time onwards for several tickers at once.
+
+        Args:
+            tickers: The normalized ticker symbols.
+            start: The timestamp of the first bar.
+            interval: The interval between bars.
+
+        Returns:
+            The bars of each ticker indexed by timestamp.
+
+        """
+        ...
+
+    def period_reference(self, ticker: str, interval: Interval, now: datetime) -> datetime:
+        """Get the time the periods of a ticker are counted back from.
+
+        Bars of a period sliced out of longer cached or stored bars must start
+        where the bars of the same period fetched directly would.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The interval between bars.
+            now: The current time, timezone-aware.
+
+        Returns:
+            The reference time, timezone-aware.
+
+        """
+        ...
+
+    def information(self, ticker: str) -> dict[str, Any]:
+        """Get the information payload of a ticker.
+
+        Args:
+            ticker: The ticker symbol.
+
+        Returns:
+            The information fields, without a `symbol` field if the ticker is unknown.
+
+        """
+        ...
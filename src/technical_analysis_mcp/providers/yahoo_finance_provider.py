@@ -0,0 +1,159 @@
+"""Market data from Yahoo Finance."""
+
+from datetime import datetime
+from typing import Any
+
+import pandas as pd
+import yfinance as yf
+
+from technical_analysis_mcp.models import Interval, Period
+
+_ACTION_FIELDS = ["Dividends", "Stock Splits"]
+
+
+class YahooFinanceProvider:
+    """Provider downloading every request from Yahoo Finance."""
+
+    def history(self, ticker: str, period: Period, interval: Interval) -> pd.DataFrame:
+        """Download the bars of a period.
+
+        Args:
+            ticker: The ticker symbol.
+            period: The time period to download.
+            interval: The interval between bars.
+
+        Returns:
+            The bars indexed by timestamp, empty if the ticker has no data.
+
+        """
+        return yf.Ticker(ticker).history(period=period, interval=interval)
+
+    def history_since(self, ticker: str, start: datetime, interval: Interval) -> pd.DataFrame:
+        """Download the bars from a point in time onwards.
+
+        Args:
+            ticker: The ticker symbol.
+            start: The timestamp of the first bar.
+            interval: The interval between bars.
+
+        Returns:
+            The bars indexed by timestamp, empty if the ticker has no data.
+
+        """
+        return yf.Ticker(ticker).history(start=start, interval=interval)
+
+    def history_between(self, ticker: str, start: datetime, end: datetime | None, interval: Interval) -> pd.DataFrame:
+        """Download the bars of a time range.
+
+        Args:
+            ticker: The ticker symbol.
+            start: The timestamp of the first bar.
+            end: The timestamp the bars end before, or None for the latest bar.
+            interval: The interval between bars.
+
+        Returns:
+            The bars indexed by timestamp, empty if the ticker has no data.
+
+        """
+        return yf.Ticker(ticker).history(start=start, end=end, interval=interval)
+
+    def download(self, tickers: list[str], period: Period, interval: Interval) -> dict[str, pd.DataFrame]:
+        """Download the bars of a period for several tickers in a single request.
+
+        Args:
+            tickers: The normalized ticker symbols.
+            period: The time period to download.
+            interval: The interval between bars.
+
+        Returns:
+            The bars of each ticker indexed by timestamp, empty if the ticker has no data.
+
+        """
+        data = yf.download(
+            tickers,
+            period=period,
+            interval=interval,
+            group_by="ticker",
+            actions=True,
+            ignore_tz=False,
+            progress=False,
+            multi_level_index=True,
+        )
+
+        return _split_download(data, tickers)
+
+    def download_since(self, tickers: list[str], start: datetime, interval: Interval) -> dict[str, pd.DataFrame]:
+        """Download the bars from a point in time onwards for several tickers in a single request.
+
+        Args:
+            tickers: The normalized ticker symbols.
+            start: The timestamp of the first bar.
+            interval: The interval between bars.
+
+        Returns:
+            The bars of each ticker indexed by timestamp, empty if the ticker has no data.
+
+        """
+        data = yf.download(
+            tickers,
+            start=start,
+            interval=interval,
+            group_by="ticker",
+            actions=True,
+            ignore_tz=False,
+            progress=False,
+            multi_level_index=True,
+        )
+
+        return _split_download(data, tickers)
+
+    def period_reference(self, ticker: str, interval: Interval, now: datetime) -> datetime:  # noqa: ARG002
+        """Get the time the periods of a ticker are counted back from.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The interval between bars.
+            now: The current time, timezone-aware.
+
+        Returns:
+            The current time, since Yahoo Finance counts periods back from the present.
+
+        """
+        return now
+
+    def information(self, ticker: str) -> dict[str, Any]:
+        """Download the information payload of a ticker.
+
+        Args:
+            ticker: The ticker symbol.
+
+        Returns:
+            The information fields, without a `symbol` field if the ticker is unknown.
+
+        """
+        return yf.Ticker(ticker).info
+
+
+def _split_download(data: pd.DataFrame | None, tickers: list[str]) -> dict[str, pd.DataFrame]:
+    """Split the bars of a bulk download by ticker.
+
+    Args:
+        data: The downloaded bars, with the tickers as the first level of the columns.
+        tickers: The normalized ticker symbols.
+
+    Returns:
+        The bars of each ticker indexed by timestamp, empty if the ticker has no data.
+
+    """
+    downloaded = {}
+
+    for ticker in tickers:
+        bars = pd.DataFrame()
+
+        if data is not None and ticker in data.columns.get_level_values(0):
+            bars = pd.DataFrame(data[ticker])
+            bars = bars.loc[bars["Close"].notna()].fillna(dict.fromkeys(_ACTION_FIELDS, 0.0))
+
+        downloaded[ticker] = bars
+
+    return downloaded
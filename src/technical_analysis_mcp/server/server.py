@@ -1,18 +1,46 @@
 """MCP server entry point."""
 
+from datetime import datetime
+
 from fastmcp.utilities.logging import get_logger
 from mcp.server.fastmcp import FastMCP
 
 from technical_analysis_mcp.models import (
+    AssetPriceHistories,
     AssetPriceHistory,
+    CacheStatistics,
+    ColumnarAssetPriceHistory,
+    CompactTimeSeries,
     Error,
+    IndicatorResults,
+    IndicatorSpec,
     Interval,
     Period,
+    PriceFormat,
     PriceSource,
+    SeriesFormat,
     TickerInformation,
     TimeSeries,
+    TimeSeriesTable,
+)
+from technical_analysis_mcp.tools import (
+    collect_cache_statistics,
+    compute_atr,
+    compute_bollinger_bands,
+    compute_donchian_channels,
+    compute_ema,
+    compute_indicators,
+    compute_macd,
+    compute_rsi,
+    compute_sma,
+    compute_stochastic,
+    compute_volatility,
+    compute_williams_r,
+    fetch_asset_price_histories,
+    fetch_asset_price_history,
+    fetch_columnar_asset_price_history,
+    fetch_ticker_information,
 )
-from technical_analysis_mcp.tools import compute_rsi, compute_sma, fetch_asset_price_history, fetch_ticker_information
 from technical_analysis_mcp.version import __version__
 
 from .instructions import INSTRUCTIONS
@@ -54,11 +82,17 @@ async def get_ticker_information(ticker: str) -> TickerInformation | Error:
 
 
 @server.tool(structured_output=True)
-async def get_asset_price_history(
+async def get_asset_price_history(  # noqa: PLR0913
     ticker: str,
     period: Period,
     interval: Interval,
-) -> AssetPriceHistory | Error:
+    format: PriceFormat = "rows",  # noqa: A002
+    max_points: int | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> AssetPriceHistory | ColumnarAssetPriceHistory | Error:
     """Get the historical price data for a financial asset.
 
     Retrieves comprehensive historical pricing information including open,
@@ -81,24 +115,82 @@ async def get_asset_price_history(
                       pairs (e.g., "BTC/USD" or "ETH-USD").
         period (str): The time range for historical data retrieval.
         interval (str): The frequency of data points.
+        format (str): The layout of the prices. "rows" returns a list of
+                      price entries, and "columnar" returns parallel arrays
+                      of timestamps, prices, volumes, dividends and splits.
+                      Prefer "columnar" for long histories, since it is
+                      several times smaller. Default is "rows".
+        max_points (int | None): The maximum number of price entries. Longer
+                      histories are split into buckets of consecutive
+                      entries, each keeping the first open, the highest
+                      high, the lowest low, the last close and the total
+                      volume. Default is all entries.
+        start (datetime | None): The date and time of the first price entry.
+                      If given, only the entries from it onwards are fetched
+                      and the period is ignored. Timestamps without a
+                      timezone are in UTC. Default is the start of the period.
+        end (datetime | None): The date and time the price entries end
+                      before. Default is the latest entry.
+        limit (int | None): The maximum number of price entries per page.
+                      If there are more, the response has a next_cursor.
+                      Default is all entries.
+        cursor (str | None): The next_cursor of a previous response, to get
+                      the following page with the same other parameters.
 
     Returns:
-        AssetPriceHistory | Error: The structured historical price data
-        or an error if the ticker is invalid, no data is available,
-        or parameters are invalid.
+        AssetPriceHistory | ColumnarAssetPriceHistory | Error: The structured
+        historical price data or an error if the ticker is invalid, no data
+        is available, or parameters are invalid.
 
     """
-    return await fetch_asset_price_history(ticker, period, interval)
+    fetch = fetch_columnar_asset_price_history if format == "columnar" else fetch_asset_price_history
+
+    return await fetch(ticker, period, interval, max_points, start=start, end=end, limit=limit, cursor=cursor)
 
 
 @server.tool(structured_output=True)
-async def get_rsi(
+async def get_asset_price_histories(
+    tickers: list[str],
+    period: Period,
+    interval: Interval,
+) -> AssetPriceHistories | Error:
+    """Get the historical price data for several financial assets at once.
+
+    Retrieves the same historical pricing information as
+    get_asset_price_history for many financial instruments together, with a
+    single bulk download instead of one request per instrument.
+
+    Use this tool when you need the raw price data of many assets, e.g., to
+    screen or compare a universe of stocks. Prefer it over calling
+    get_asset_price_history once per ticker.
+
+    Args:
+        tickers (list[str]): The unique identifiers for the assets.
+                             Supports the same symbols as
+                             get_asset_price_history.
+        period (str): The time range for historical data retrieval.
+        interval (str): The frequency of data points.
+
+    Returns:
+        AssetPriceHistories | Error: The structured historical price data of
+        each ticker, or an error for each ticker without data. An error is
+        returned if the list of tickers is empty or the download fails.
+
+    """
+    return await fetch_asset_price_histories(tickers, period, interval)
+
+
+@server.tool(structured_output=True)
+async def get_rsi(  # noqa: PLR0913
     ticker: str,
     source: PriceSource,
     period: Period,
     interval: Interval,
-    candles: int = 14,
-) -> TimeSeries | Error:
+    candles: int | list[int] = 14,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> TimeSeries | CompactTimeSeries | TimeSeriesTable | Error:
     """Compute the Relative Strength Index (RSI) for a given ticker.
 
     The Relative Strength Index (RSI) is a momentum oscillator that measures
@@ -117,26 +209,45 @@ async def get_rsi(
                       Typically "close" is used for RSI.
         period (str): The time range for historical data retrieval.
         interval (str): The frequency of data points.
-        candles (int): The number of candles/samples to use for RSI calculation.
-                       Default is 14 candles.
+        candles (int | list[int]): The number of candles/samples to use for
+                       RSI calculation. Default is 14 candles. A list, e.g.
+                       [7, 14, 21], computes every period in one pass and
+                       returns a table with a column per period, e.g.
+                       "rsi_14", in the "compact" layout.
+        format (str): The layout of the series. "points" returns a list
+                      of dated values, and "compact" returns the epoch
+                      seconds of the first value and the step between values
+                      (or an array of epoch seconds if they are not evenly
+                      spaced) with a plain array of values. Prefer "compact"
+                      for long series. Default is "points".
+        decimals (int): The number of decimal places of the values in the
+                        "compact" layout. Default is 6.
+        max_points (int | None): The maximum number of values. Longer series
+                      are reduced to the values that best keep their shape,
+                      including peaks and troughs. Prefer a few hundred
+                      values for long periods. Not supported with a list.
+                      Default is all values.
 
     Returns:
-        TimeSeries | Error: The RSI time series data or an error if the
-        ticker is invalid, insufficient data is available, or parameters
-        are invalid.
+        TimeSeries | CompactTimeSeries | TimeSeriesTable | Error: The RSI
+        time series data, the table of a list, or an error if the ticker is
+        invalid, insufficient data is available, or parameters are invalid.
 
     """
-    return await compute_rsi(ticker, source, period, interval, candles)
+    return await compute_rsi(ticker, source, period, interval, candles, format, decimals, max_points)
 
 
 @server.tool(structured_output=True)
-async def get_sma(
+async def get_sma(  # noqa: PLR0913
     ticker: str,
     source: PriceSource,
     period: Period,
     interval: Interval,
-    window: int = 20,
-) -> TimeSeries | Error:
+    window: int | list[int] = 20,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> TimeSeries | CompactTimeSeries | TimeSeriesTable | Error:
     """Compute the Simple Moving Average (SMA) for a given ticker.
 
     The Simple Moving Average (SMA) is a technical indicator that calculates
@@ -155,16 +266,451 @@ async def get_sma(
                       Typically "close" is used for SMA.
         period (str): The time range for historical data retrieval.
         interval (str): The frequency of data points.
-        window (int): The moving window period for SMA calculation.
+        window (int | list[int]): The moving window period for SMA
+                      calculation. Default is 20 periods. A list, e.g. every
+                      window from 5 to 200, computes every window in one pass
+                      and returns a table with a column per window, e.g.
+                      "sma_20", in the "compact" layout. Prefer it to
+                      calling this tool once per window.
+        format (str): The layout of the series. "points" returns a list
+                      of dated values, and "compact" returns the epoch
+                      seconds of the first value and the step between values
+                      (or an array of epoch seconds if they are not evenly
+                      spaced) with a plain array of values. Prefer "compact"
+                      for long series. Default is "points".
+        decimals (int): The number of decimal places of the values in the
+                        "compact" layout. Default is 6.
+        max_points (int | None): The maximum number of values. Longer series
+                      are reduced to the values that best keep their shape,
+                      including peaks and troughs. Prefer a few hundred
+                      values for long periods. Not supported with a list.
+                      Default is all values.
+
+    Returns:
+        TimeSeries | CompactTimeSeries | TimeSeriesTable | Error: The SMA
+        time series data, the table of a list, or an error if the ticker is
+        invalid, insufficient data is available, or parameters are invalid.
+
+    """
+    return await compute_sma(ticker, source, period, interval, window, format, decimals, max_points)
+
+
+@server.tool(structured_output=True)
+async def get_ema(  # noqa: PLR0913
+    ticker: str,
+    source: PriceSource,
+    period: Period,
+    interval: Interval,
+    window: int = 20,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> TimeSeries | CompactTimeSeries | Error:
+    """Compute the Exponential Moving Average (EMA) for a given ticker.
+
+    The Exponential Moving Average (EMA) is a moving average that weighs
+    recent prices more than older ones, so it reacts faster to price changes
+    than the Simple Moving Average (SMA) of the same window.
+
+    Use this tool when you need to follow trends with less lag than the SMA,
+    or generate trading signals based on EMA crossovers (e.g., EMA(12)
+    crossing EMA(26)).
+
+    Args:
+        ticker (str): The unique identifier for the asset.
+        source (str): The price source to use for calculation.
+                      Options: "open", "high", "low", "close".
+                      Typically "close" is used for EMA.
+        period (str): The time range for historical data retrieval.
+        interval (str): The frequency of data points.
+        window (int): The number of candles/samples of the EMA. The first
+                      value is the SMA of the first window. Default is 20.
+        format (str): The layout of the series. "points" returns a list
+                      of dated values, and "compact" returns the epoch
+                      seconds of the first value and the step between values
+                      (or an array of epoch seconds if they are not evenly
+                      spaced) with a plain array of values. Prefer "compact"
+                      for long series. Default is "points".
+        decimals (int): The number of decimal places of the values in the
+                        "compact" layout. Default is 6.
+        max_points (int | None): The maximum number of values. Longer series
+                      are reduced to the values that best keep their shape,
+                      including peaks and troughs. Prefer a few hundred
+                      values for long periods. Default is all values.
+
+    Returns:
+        TimeSeries | CompactTimeSeries | Error: The EMA time series data or
+        an error if the ticker is invalid, insufficient data is available,
+        or parameters are invalid.
+
+    """
+    return await compute_ema(ticker, source, period, interval, window, format, decimals, max_points)
+
+
+@server.tool(structured_output=True)
+async def get_macd(  # noqa: PLR0913
+    ticker: str,
+    source: PriceSource,
+    period: Period,
+    interval: Interval,
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the Moving Average Convergence Divergence (MACD) for a given ticker.
+
+    The MACD line is the fast EMA minus the slow EMA of the prices, the
+    signal line is the EMA of the MACD line, and the histogram is the MACD
+    line minus the signal line. It measures the strength and direction of a
+    trend and how it changes.
+
+    Use this tool when you need to analyze momentum or generate trading
+    signals based on the MACD line crossing its signal line or zero, or on
+    divergences between the histogram and the price.
+
+    Args:
+        ticker (str): The unique identifier for the asset.
+        source (str): The price source to use for calculation.
+                      Options: "open", "high", "low", "close".
+                      Typically "close" is used for MACD.
+        period (str): The time range for historical data retrieval.
+        interval (str): The frequency of data points.
+        fast (int): The window of the fast EMA. Default is 12.
+        slow (int): The window of the slow EMA, longer than the fast one.
+                    Default is 26.
+        signal (int): The window of the EMA of the MACD line. Default is 9.
+        decimals (int): The number of decimal places of the values.
+                        Default is 6.
+
+    Returns:
+        TimeSeriesTable | Error: A table with the "macd", "signal" and
+        "histogram" columns, the last two null until the signal window
+        fills, or an error if the ticker is invalid, insufficient data is
+        available, or parameters are invalid.
+
+    """
+    return await compute_macd(ticker, source, period, interval, fast, slow, signal, decimals)
+
+
+@server.tool(structured_output=True)
+async def get_bollinger_bands(  # noqa: PLR0913
+    ticker: str,
+    source: PriceSource,
+    period: Period,
+    interval: Interval,
+    window: int = 20,
+    deviations: float = 2.0,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the Bollinger Bands for a given ticker.
+
+    The middle band is the Simple Moving Average (SMA) of the prices, and the
+    upper and lower bands are a number of standard deviations of the prices
+    of the same window above and below it. The %B tells where the price lies
+    between the lower band, at 0, and the upper band, at 1.
+
+    Use this tool when you need to analyze volatility, e.g. bands narrowing
+    before a breakout, or identify prices that are high or low relative to
+    their recent range (e.g., %B above 1 or below 0).
+
+    Args:
+        ticker (str): The unique identifier for the asset.
+        source (str): The price source to use for calculation.
+                      Options: "open", "high", "low", "close".
+                      Typically "close" is used for Bollinger Bands.
+        period (str): The time range for historical data retrieval.
+        interval (str): The frequency of data points.
+        window (int): The moving window period of the middle band.
                       Default is 20 periods.
+        deviations (float): The number of standard deviations between the
+                      middle band and the others. Default is 2.
+        decimals (int): The number of decimal places of the values.
+                        Default is 6.
+
+    Returns:
+        TimeSeriesTable | Error: A table with the "middle", "upper", "lower"
+        and "percent_b" columns, or an error if the ticker is invalid,
+        insufficient data is available, or parameters are invalid.
+
+    """
+    return await compute_bollinger_bands(ticker, source, period, interval, window, deviations, decimals)
+
+
+@server.tool(structured_output=True)
+async def get_atr(  # noqa: PLR0913
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    candles: int = 14,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> TimeSeries | CompactTimeSeries | Error:
+    """Compute the Average True Range (ATR) for a given ticker.
+
+    The true range of a bar is the greatest of its high-low range and the
+    distances from the previous close to its high and to its low, so it
+    includes gaps between bars. The Average True Range (ATR) smooths it with
+    Wilder's method. It measures volatility in price units.
+
+    Use this tool when you need to size positions or place stop losses
+    according to volatility (e.g., a stop two ATRs below the entry).
+
+    Args:
+        ticker (str): The unique identifier for the asset.
+        period (str): The time range for historical data retrieval.
+        interval (str): The frequency of data points.
+        candles (int): The number of candles/samples to use for ATR
+                       calculation. Default is 14 candles.
+        format (str): The layout of the series. "points" returns a list
+                      of dated values, and "compact" returns the epoch
+                      seconds of the first value and the step between values
+                      (or an array of epoch seconds if they are not evenly
+                      spaced) with a plain array of values. Prefer "compact"
+                      for long series. Default is "points".
+        decimals (int): The number of decimal places of the values in the
+                        "compact" layout. Default is 6.
+        max_points (int | None): The maximum number of values. Longer series
+                      are reduced to the values that best keep their shape,
+                      including peaks and troughs. Prefer a few hundred
+                      values for long periods. Default is all values.
+
+    Returns:
+        TimeSeries | CompactTimeSeries | Error: The ATR time series data or
+        an error if the ticker is invalid, insufficient data is available,
+        or parameters are invalid.
+
+    """
+    return await compute_atr(ticker, period, interval, candles, format, decimals, max_points)
+
+
+@server.tool(structured_output=True)
+async def get_volatility(
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    window: int = 20,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Estimate the volatility of a given ticker from the open, high, low and close of its bars.
+
+    Parkinson's estimator uses the high-low range of each bar, Garman and
+    Klass' adds its open-close return, and Yang and Zhang's adds the return
+    from the previous close to the open, so it also captures gaps between
+    bars, e.g. overnight. They are more efficient than the standard
+    deviation of close-to-close returns over the same number of bars.
+
+    Use this tool when you need to compare or target volatility, e.g. to size
+    positions. The estimates are standard deviations of logarithmic returns
+    per bar; multiply them by the square root of the bars per year to
+    annualize them (e.g., the square root of 252 for daily bars).
+
+    Args:
+        ticker (str): The unique identifier for the asset.
+        period (str): The time range for historical data retrieval.
+        interval (str): The frequency of data points.
+        window (int): The number of candles/samples of each estimate, at
+                      least 2. Default is 20.
+        decimals (int): The number of decimal places of the values.
+                        Default is 6.
+
+    Returns:
+        TimeSeriesTable | Error: A table with the "parkinson",
+        "garman_klass" and "yang_zhang" columns, the last one null on the
+        first row, or an error if the ticker is invalid, insufficient data is
+        available, or parameters are invalid.
+
+    """
+    return await compute_volatility(ticker, period, interval, window, decimals)
+
+
+@server.tool(structured_output=True)
+async def get_stochastic(  # noqa: PLR0913
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    window: int = 14,
+    smoothing: int = 3,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the stochastic oscillator for a given ticker.
+
+    The %K line tells where the close lies between the lowest low, at 0, and
+    the highest high, at 100, of the recent bars, and the %D line is its
+    moving average. Traditionally, the market is considered overbought when
+    %K is above 80 and oversold when below 20.
+
+    Use this tool when you need to analyze momentum, identify overbought or
+    oversold conditions, or generate trading signals based on %K crossing
+    %D.
+
+    Args:
+        ticker (str): The unique identifier for the asset.
+        period (str): The time range for historical data retrieval.
+        interval (str): The frequency of data points.
+        window (int): The number of candles/samples of the highest high and
+                      lowest low. Default is 14.
+        smoothing (int): The number of %K values averaged by %D.
+                         Default is 3.
+        decimals (int): The number of decimal places of the values.
+                        Default is 6.
+
+    Returns:
+        TimeSeriesTable | Error: A table with the "k" and "d" columns, the
+        last one null until its window fills, or an error if the ticker is
+        invalid, insufficient data is available, or parameters are invalid.
+
+    """
+    return await compute_stochastic(ticker, period, interval, window, smoothing, decimals)
+
+
+@server.tool(structured_output=True)
+async def get_williams_r(  # noqa: PLR0913
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    candles: int = 14,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> TimeSeries | CompactTimeSeries | Error:
+    """Compute the Williams %R for a given ticker.
+
+    The Williams %R tells where the close lies between the highest high, at
+    0, and the lowest low, at -100, of the recent bars. Traditionally, the
+    market is considered overbought when above -20 and oversold when below
+    -80.
+
+    Use this tool when you need to analyze momentum or identify overbought
+    or oversold conditions.
+
+    Args:
+        ticker (str): The unique identifier for the asset.
+        period (str): The time range for historical data retrieval.
+        interval (str): The frequency of data points.
+        candles (int): The number of candles/samples of the highest high and
+                       lowest low. Default is 14 candles.
+        format (str): The layout of the series. "points" returns a list
+                      of dated values, and "compact" returns the epoch
+                      seconds of the first value and the step between values
+                      (or an array of epoch seconds if they are not evenly
+                      spaced) with a plain array of values. Prefer "compact"
+                      for long series. Default is "points".
+        decimals (int): The number of decimal places of the values in the
+                        "compact" layout. Default is 6.
+        max_points (int | None): The maximum number of values. Longer series
+                      are reduced to the values that best keep their shape,
+                      including peaks and troughs. Prefer a few hundred
+                      values for long periods. Default is all values.
+
+    Returns:
+        TimeSeries | CompactTimeSeries | Error: The Williams %R time series
+        data or an error if the ticker is invalid, insufficient data is
+        available, or parameters are invalid.
+
+    """
+    return await compute_williams_r(ticker, period, interval, candles, format, decimals, max_points)
+
+
+@server.tool(structured_output=True)
+async def get_donchian_channels(
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    window: int = 20,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the Donchian channels for a given ticker.
+
+    The upper channel is the highest high and the lower channel the lowest
+    low of the recent bars, and the middle channel is halfway between them.
+
+    Use this tool when you need to identify breakouts (e.g., a close above
+    the previous upper channel) or the recent trading range.
+
+    Args:
+        ticker (str): The unique identifier for the asset.
+        period (str): The time range for historical data retrieval.
+        interval (str): The frequency of data points.
+        window (int): The number of candles/samples of each channel.
+                      Default is 20.
+        decimals (int): The number of decimal places of the values.
+                        Default is 6.
+
+    Returns:
+        TimeSeriesTable | Error: A table with the "upper", "middle" and
+        "lower" columns, or an error if the ticker is invalid, insufficient
+        data is available, or parameters are invalid.
+
+    """
+    return await compute_donchian_channels(ticker, period, interval, window, decimals)
+
+
+@server.tool(structured_output=True)
+async def get_indicators(  # noqa: PLR0913
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    specs: list[IndicatorSpec],
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> IndicatorResults | Error:
+    """Compute several technical indicators for a given ticker at once.
+
+    The price history is fetched once and shared by every indicator, so
+    this is faster than calling the tool of each indicator separately.
+
+    Use this tool when you need several indicators over the same period,
+    e.g. RSI(14) together with SMA(20), SMA(50) and SMA(200) to combine
+    momentum with short, medium and long term trends.
+
+    Args:
+        ticker (str): The unique identifier for the asset.
+        period (str): The time range for historical data retrieval.
+        interval (str): The frequency of data points.
+        specs (list[IndicatorSpec]): The indicators to compute. Each one
+                      has an "indicator", "ema", "rsi" or "sma", a "length",
+                      the RSI candles or the EMA or SMA window, and a price
+                      "source", "close" by default. E.g. [{"indicator":
+                      "rsi", "length": 14}, {"indicator": "sma", "length":
+                      50}].
+        format (str): The layout of each series, "points" or "compact",
+                      as in the tool of each indicator. Default is "points".
+        decimals (int): The number of decimal places of the values in the
+                        "compact" layout. Default is 6.
+        max_points (int | None): The maximum number of values of each
+                      series. Longer series are reduced to the values that
+                      best keep their shape. Default is all values.
+
+    Returns:
+        IndicatorResults | Error: The series of each indicator, in the
+        requested order, each one replaced by an error if insufficient data
+        is available, or an error if the ticker or parameters are invalid.
+
+    """
+    return await compute_indicators(ticker, period, interval, specs, format, decimals, max_points)
+
+
+@server.tool(structured_output=True)
+async def get_cache_statistics() -> CacheStatistics:
+    """Get the usage of the in-memory caches of the server.
+
+    Reports, for each cache, the number of entries, the number of lookups
+    that found a fresh entry (hits) or not (misses), and the hit rate, since
+    the server started. The caches hold price histories, errors of unknown
+    tickers or empty histories, ticker information, and indicator states and
+    results.
+
+    Use this tool when you need to check whether repeated requests are served
+    from memory, e.g. to tune the cache sizes.
 
     Returns:
-        TimeSeries | Error: The SMA time series data or an error if the
-        ticker is invalid, insufficient data is available, or parameters
-        are invalid.
+        CacheStatistics: The usage of each cache, by name.
 
     """
-    return await compute_sma(ticker, source, period, interval, window)
+    return collect_cache_statistics()
 
 
 def main() -> None:
@@ -0,0 +1,80 @@
+"""Server settings."""
+
+import os
+from functools import cache
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+ENVIRONMENT_PREFIX = "TECHNICAL_ANALYSIS_MCP_"
+
+_DESCRIPTIONS = {
+    "data_directory": "Directory where the local price database is stored.",
+    "price_cache_entries": "Maximum number of price histories kept in memory.",
+    "io_workers": "Maximum number of concurrent requests to the data provider.",
+    "information_cache_entries": "Maximum number of tickers whose information is kept in memory.",
+    "static_information_ttl": "Seconds static ticker information, e.g. names or sector, is kept in memory.",
+    "market_information_ttl": "Seconds market ticker information, e.g. price or volume, is kept in memory.",
+    "negative_cache_entries": "Maximum number of unknown tickers and empty histories remembered.",
+    "negative_cache_ttl": "Seconds unknown tickers and empty histories are remembered.",
+    "indicator_cache_entries": "Maximum number of indicator states, and of indicator results, kept in memory.",
+    "indicator_cache_ttl": "Seconds an indicator state or result is kept in memory.",
+    "provider": "Source of market data, either `yahoo` or `files`.",
+    "provider_directory": "Directory served by the `files` provider, by default `files` in the data directory.",
+}
+
+
+class Settings(BaseModel):
+    """Runtime settings of the server.
+
+    Every field can be overridden with an environment variable named after the
+    field in upper case and prefixed with `TECHNICAL_ANALYSIS_MCP_`, e.g.
+    `TECHNICAL_ANALYSIS_MCP_DATA_DIRECTORY`.
+    """
+
+    data_directory: Path = Field(
+        default_factory=lambda: Path.home() / ".cache" / "technical-analysis-mcp",
+        description=_DESCRIPTIONS["data_directory"],
+    )
+    price_cache_entries: int = Field(default=256, gt=0, description=_DESCRIPTIONS["price_cache_entries"])
+    io_workers: int = Field(default=8, gt=0, description=_DESCRIPTIONS["io_workers"])
+    information_cache_entries: int = Field(default=1024, gt=0, description=_DESCRIPTIONS["information_cache_entries"])
+    static_information_ttl: float = Field(default=259_200.0, ge=0, description=_DESCRIPTIONS["static_information_ttl"])
+    market_information_ttl: float = Field(default=120.0, ge=0, description=_DESCRIPTIONS["market_information_ttl"])
+    negative_cache_entries: int = Field(default=1024, gt=0, description=_DESCRIPTIONS["negative_cache_entries"])
+    negative_cache_ttl: float = Field(default=300.0, ge=0, description=_DESCRIPTIONS["negative_cache_ttl"])
+    indicator_cache_entries: int = Field(default=256, gt=0, description=_DESCRIPTIONS["indicator_cache_entries"])
+    indicator_cache_ttl: float = Field(default=3_600.0, ge=0, description=_DESCRIPTIONS["indicator_cache_ttl"])
+    provider: Literal["yahoo", "files"] = Field(default="yahoo", description=_DESCRIPTIONS["provider"])
+    provider_directory: Path | None = Field(default=None, description=_DESCRIPTIONS["provider_directory"])
+
+    @classmethod
+    def from_environment(cls) -> "Settings":
+        """Build the settings from the process environment.
+
+        Returns:
+            The settings, with defaults for the variables that are not set.
+
+        Raises:
+            pydantic.ValidationError: If any of the variables has an invalid value.
+
+        """
+        values = {
+            name: os.environ[ENVIRONMENT_PREFIX + name.upper()]
+            for name in cls.model_fields
+            if ENVIRONMENT_PREFIX + name.upper() in os.environ
+        }
+
+        return cls.model_validate(values)
+
+
+@cache
+def get_settings() -> Settings:
+    """Get the process-wide settings.
+
+    Returns:
+        The settings read from the environment on first use.
+
+    """
+    return Settings.from_environment()
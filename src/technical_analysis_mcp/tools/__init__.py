@@ -1,13 +1,36 @@
 """Technical analysis tools module."""
 
+from .collect_cache_statistics import collect_cache_statistics
+from .compute_atr import compute_atr
+from .compute_bollinger_bands import compute_bollinger_bands
+from .compute_donchian_channels import compute_donchian_channels
+from .compute_ema import compute_ema
+from .compute_indicators import compute_indicators
+from .compute_macd import compute_macd
 from .compute_rsi import compute_rsi
 from .compute_sma import compute_sma
-from .fetch_asset_price_history import fetch_asset_price_history
+from .compute_stochastic import compute_stochastic
+from .compute_volatility import compute_volatility
+from .compute_williams_r import compute_williams_r
+from .fetch_asset_price_histories import fetch_asset_price_histories
+from .fetch_asset_price_history import fetch_asset_price_history, fetch_columnar_asset_price_history
 from .fetch_ticker_information import fetch_ticker_information
 
 __all__ = [
+    "collect_cache_statistics",
+    "compute_atr",
+    "compute_bollinger_bands",
+    "compute_donchian_channels",
+    "compute_ema",
+    "compute_indicators",
+    "compute_macd",
     "compute_rsi",
     "compute_sma",
+    "compute_stochastic",
+    "compute_volatility",
+    "compute_williams_r",
+    "fetch_asset_price_histories",
     "fetch_asset_price_history",
+    "fetch_columnar_asset_price_history",
     "fetch_ticker_information",
 ]
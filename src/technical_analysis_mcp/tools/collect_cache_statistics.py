@@ -0,0 +1,52 @@
+"""Module for reporting the usage of the in-memory caches."""
+
+from typing import Any
+
+from technical_analysis_mcp.cache import (
+    TtlCache,
+    get_indicator_result_cache,
+    get_indicator_state_cache,
+    get_market_information_cache,
+    get_negative_cache,
+    get_price_cache,
+    get_static_information_cache,
+)
+from technical_analysis_mcp.models import CacheStatistics, CacheUsage
+
+
+def collect_cache_statistics() -> CacheStatistics:
+    """Collect the size and hit rate of every in-memory cache.
+
+    Returns:
+        The usage of each cache since the server started.
+    """
+    return CacheStatistics(
+        caches={
+            "prices": _usage(get_price_cache()),
+            "errors": _usage(get_negative_cache()),
+            "static_information": _usage(get_static_information_cache()),
+            "market_information": _usage(get_market_information_cache()),
+            "indicator_states": _usage(get_indicator_state_cache()),
+            "indicator_results": _usage(get_indicator_result_cache()),
+        },
+    )
+
+
+def _usage(cache: TtlCache[Any, Any]) -> CacheUsage:
+    """Describe the usage of a cache.
+
+    Args:
+        cache: The cache.
+
+    Returns:
+        The number of entries, hits and misses of the cache, and its hit rate.
+    """
+    lookups = cache.hits + cache.misses
+
+    return CacheUsage(
+        entries=len(cache),
+        max_entries=cache.max_entries,
+        hits=cache.hits,
+        misses=cache.misses,
+        hit_rate=cache.hits / lookups if lookups else None,
+    )
@@ -0,0 +1,91 @@
+"""Module for computing the Bollinger Bands."""
+
+from technical_analysis_mcp.indicators import PriceColumns, bollinger_bands
+from technical_analysis_mcp.models import (
+    Error,
+    Interval,
+    Period,
+    PriceSource,
+    TimeSeriesTable,
+    build_time_series_table,
+)
+
+from .fetch_asset_price_history import PriceHistory, fetch_price_history
+from .indicator_series import validate_lengths, validate_series_options
+
+
+async def compute_bollinger_bands(  # noqa: PLR0913
+    ticker: str,
+    source: PriceSource,
+    period: Period,
+    interval: Interval,
+    window: int = 20,
+    deviations: float = 2.0,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the Bollinger Bands for a given ticker.
+
+    Args:
+        ticker: The ticker symbol (e.g., "AAPL").
+        source: The price source to use.
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+        window: The moving window period of the middle band (default 20).
+        deviations: The number of standard deviations between the middle band and the others (default 2).
+        decimals: The number of decimal places of the values (default 6).
+
+    Returns:
+        A table with the middle, upper and lower bands and the %B.
+    """
+    error = validate_lengths("Bollinger window", window, None) or validate_series_options(decimals, None)
+
+    if error is not None:
+        return error
+
+    if deviations <= 0:
+        return Error(what=f"Bollinger deviations must be positive, got: {deviations}")
+
+    history = await fetch_price_history(ticker, period, interval)
+
+    if isinstance(history, Error):
+        return history
+
+    return bollinger_table(history, source, window, deviations, decimals)
+
+
+def bollinger_table(
+    history: PriceHistory,
+    source: PriceSource,
+    window: int,
+    deviations: float,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the Bollinger Bands over a fetched history.
+
+    Args:
+        history: The price bars.
+        source: The price source to use.
+        window: The moving window period of the middle band.
+        deviations: The number of standard deviations between the middle band and the others.
+        decimals: The number of decimal places of the values.
+
+    Returns:
+        A table with the middle, upper and lower bands and the %B, from the first complete window.
+    """
+    if len(history.bars) < window:
+        return Error(
+            what=f"Insufficient data for Bollinger Bands calculation. "
+            f"Need at least {window} candles/samples, but got {len(history.bars)} points. Reason: "
+            f"1) The period is too short for the interval, 2) or the interval is too big for the period. "
+            f"Try a) increasing the period, b) reducing the interval, c) or reducing the Bollinger window."
+        )
+
+    columns = PriceColumns.from_bars(history.bars)
+    middle, upper, lower, percent_b = bollinger_bands(columns.price(source), window, deviations)
+
+    return build_time_series_table(
+        history.ticker,
+        columns.dates[window - 1 :],
+        {"middle": middle, "upper": upper, "lower": lower, "percent_b": percent_b},
+        decimals,
+    )
@@ -0,0 +1,79 @@
+"""Module for computing the Donchian channels."""
+
+from technical_analysis_mcp.indicators import PriceColumns, donchian_channels
+from technical_analysis_mcp.models import (
+    Error,
+    Interval,
+    Period,
+    TimeSeriesTable,
+    build_time_series_table,
+)
+
+from .fetch_asset_price_history import PriceHistory, fetch_price_history
+from .indicator_series import validate_lengths, validate_series_options
+
+
+async def compute_donchian_channels(
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    window: int = 20,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the Donchian channels for a given ticker.
+
+    Args:
+        ticker: The ticker symbol (e.g., "AAPL").
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+        window: The number of candles/samples of each channel (default 20).
+        decimals: The number of decimal places of the values (default 6).
+
+    Returns:
+        A table with the upper, middle and lower channels.
+    """
+    error = validate_lengths("Donchian window", window, None) or validate_series_options(decimals, None)
+
+    if error is not None:
+        return error
+
+    history = await fetch_price_history(ticker, period, interval)
+
+    if isinstance(history, Error):
+        return history
+
+    return donchian_table(history, window, decimals)
+
+
+def donchian_table(
+    history: PriceHistory,
+    window: int,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the Donchian channels over a fetched history.
+
+    Args:
+        history: The price bars.
+        window: The number of candles/samples of each channel.
+        decimals: The number of decimal places of the values.
+
+    Returns:
+        A table with the upper, middle and lower channels, from the first complete window.
+    """
+    if len(history.bars) < window:
+        return Error(
+            what=f"Insufficient data for Donchian channels calculation. "
+            f"Need at least {window} candles/samples, but got {len(history.bars)} points. Reason: "
+            f"1) The period is too short for the interval, 2) or the interval is too big for the period. "
+            f"Try a) increasing the period, b) reducing the interval, c) or reducing the Donchian window."
+        )
+
+    columns = PriceColumns.from_bars(history.bars)
+    upper, middle, lower = donchian_channels(columns.high, columns.low, window)
+
+    return build_time_series_table(
+        history.ticker,
+        columns.dates[window - 1 :],
+        {"upper": upper, "middle": middle, "lower": lower},
+        decimals,
+    )
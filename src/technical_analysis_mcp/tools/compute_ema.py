@@ -0,0 +1,127 @@
+"""Module for computing the Exponential Moving Average (EMA)."""
+
+from technical_analysis_mcp.cache import (
+    find_indicator_result,
+    history_fingerprint,
+    remember_indicator_result,
+    stream_indicator,
+)
+from technical_analysis_mcp.helpers import downsample_series
+from technical_analysis_mcp.indicators import PriceColumns, start_ema
+from technical_analysis_mcp.models import (
+    CompactTimeSeries,
+    Error,
+    Interval,
+    Period,
+    PriceSource,
+    SeriesFormat,
+    TimeSeries,
+)
+
+from .fetch_asset_price_history import PriceHistory, fetch_price_history
+from .indicator_series import build_indicator_series, validate_lengths, validate_series_options
+
+
+async def compute_ema(  # noqa: PLR0913
+    ticker: str,
+    source: PriceSource,
+    period: Period,
+    interval: Interval,
+    window: int = 20,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> TimeSeries | CompactTimeSeries | Error:
+    """Compute the Exponential Moving Average (EMA) for a given ticker.
+
+    The state of the indicator after the last complete bar is kept in memory,
+    so refreshing a series that only gained new bars adds just those bars, and
+    so is the result, so identical requests over the same bars are served
+    without computing it again.
+
+    Args:
+        ticker: The ticker symbol (e.g., "AAPL").
+        source: The price source to use.
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+        window: The number of candles/samples of the EMA (default 20).
+        format: The layout of the series, a list of dated values or compact arrays.
+        decimals: The number of decimal places of the values in the compact layout (default 6).
+        max_points: The maximum number of values, selected to keep the shape of the series (default all).
+
+    Returns:
+        The indicator series.
+    """
+    error = validate_lengths("EMA window", window, max_points) or validate_series_options(decimals, max_points)
+
+    if error is not None:
+        return error
+
+    history = await fetch_price_history(ticker, period, interval)
+
+    if isinstance(history, Error):
+        return history
+
+    return ema_series(history, source, window, format, decimals, max_points)
+
+
+def ema_series(  # noqa: PLR0913
+    history: PriceHistory,
+    source: PriceSource,
+    window: int,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+    columns: PriceColumns | None = None,
+) -> TimeSeries | CompactTimeSeries | Error:
+    """Compute the Exponential Moving Average (EMA) over a fetched history.
+
+    Args:
+        history: The price bars.
+        source: The price source to use.
+        window: The number of candles/samples of the EMA.
+        format: The layout of the series, a list of dated values or compact arrays.
+        decimals: The number of decimal places of the values in the compact layout.
+        max_points: The maximum number of values, selected to keep the shape of the series, if any.
+        columns: The columns of the history, if already built, e.g. for several indicators.
+
+    Returns:
+        The indicator series.
+    """
+    ticker, period, interval = history.ticker, history.period, history.interval
+
+    if len(history.bars) < window:
+        return Error(
+            what=f"Insufficient data for EMA calculation. "
+            f"Need at least {window} candles/samples, but got {len(history.bars)} points. Reason: "
+            f"1) The period is too short for the interval, 2) or the interval is too big for the period. "
+            f"Try a) increasing the period, b) reducing the interval, c) or reducing the EMA window."
+        )
+
+    key = (
+        "ema",
+        ticker,
+        period,
+        interval,
+        source,
+        str(window),
+        format,
+        str(decimals),
+        str(max_points),
+        *history_fingerprint(history.bars),
+    )
+    result = find_indicator_result(key)
+
+    if result is None:
+        columns = columns or PriceColumns.from_bars(history.bars)
+        ema = stream_indicator(
+            ("ema", ticker.strip().upper(), period, interval, source, str(window)),
+            columns.timestamps,
+            columns.price(source),
+            lambda prices: start_ema(prices, window),
+        )
+        ema_dates, ema_values = downsample_series(columns.dates[window - 1 :], ema, max_points)
+        result = build_indicator_series(ticker, ema_dates, ema_values, format, decimals)
+        remember_indicator_result(key, result)
+
+    return result
@@ -0,0 +1,82 @@
+"""Module for computing several indicators over one price history."""
+
+from technical_analysis_mcp.indicators import PriceColumns
+from technical_analysis_mcp.models import (
+    Error,
+    IndicatorResult,
+    IndicatorResults,
+    IndicatorSpec,
+    Interval,
+    Period,
+    SeriesFormat,
+)
+
+from .compute_ema import ema_series
+from .compute_rsi import rsi_series
+from .compute_sma import sma_series
+from .fetch_asset_price_history import fetch_price_history
+from .indicator_series import validate_series_options
+
+
+async def compute_indicators(  # noqa: PLR0913
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    specs: list[IndicatorSpec],
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> IndicatorResults | Error:
+    """Compute several indicators for a given ticker.
+
+    The price history is fetched once, and its columns are extracted once and
+    shared by every indicator, e.g. RSI(14), SMA(20), SMA(50) and SMA(200).
+
+    Args:
+        ticker: The ticker symbol (e.g., "AAPL").
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+        specs: The indicators to compute, with their parameters.
+        format: The layout of the series, a list of dated values or compact arrays.
+        decimals: The number of decimal places of the values in the compact layout (default 6).
+        max_points: The maximum number of values of each series, selected to keep its shape (default all).
+
+    Returns:
+        The series of each indicator, or an error per indicator that lacks data.
+    """
+    if not specs:
+        return Error(what="At least one indicator is required.")
+
+    error = validate_series_options(decimals, max_points)
+
+    if error is not None:
+        return error
+
+    history = await fetch_price_history(ticker, period, interval)
+
+    if isinstance(history, Error):
+        return history
+
+    columns = PriceColumns.from_bars(history.bars)
+    compute = {"ema": ema_series, "rsi": rsi_series, "sma": sma_series}
+
+    return IndicatorResults(
+        ticker=history.ticker,
+        period=period,
+        interval=interval,
+        results=[
+            IndicatorResult(
+                spec=spec,
+                series=compute[spec.indicator](
+                    history,
+                    spec.source,
+                    spec.length,
+                    format,
+                    decimals,
+                    max_points,
+                    columns,
+                ),
+            )
+            for spec in specs
+        ],
+    )
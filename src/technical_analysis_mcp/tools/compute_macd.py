@@ -0,0 +1,114 @@
+"""Module for computing the Moving Average Convergence Divergence (MACD)."""
+
+from technical_analysis_mcp.indicators import PriceColumns, moving_average_convergence_divergence
+from technical_analysis_mcp.models import (
+    Error,
+    Interval,
+    Period,
+    PriceSource,
+    TimeSeriesTable,
+    build_time_series_table,
+)
+
+from .fetch_asset_price_history import PriceHistory, fetch_price_history
+from .indicator_series import validate_series_options
+
+
+async def compute_macd(  # noqa: PLR0913
+    ticker: str,
+    source: PriceSource,
+    period: Period,
+    interval: Interval,
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the Moving Average Convergence Divergence (MACD) for a given ticker.
+
+    Args:
+        ticker: The ticker symbol (e.g., "AAPL").
+        source: The price source to use.
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+        fast: The window of the fast EMA (default 12).
+        slow: The window of the slow EMA (default 26).
+        signal: The window of the EMA of the MACD line (default 9).
+        decimals: The number of decimal places of the values (default 6).
+
+    Returns:
+        A table with the MACD line, the signal line and the histogram.
+    """
+    error = _validate_windows(fast, slow, signal) or validate_series_options(decimals, None)
+
+    if error is not None:
+        return error
+
+    history = await fetch_price_history(ticker, period, interval)
+
+    if isinstance(history, Error):
+        return history
+
+    return macd_table(history, source, fast, slow, signal, decimals)
+
+
+def macd_table(  # noqa: PLR0913
+    history: PriceHistory,
+    source: PriceSource,
+    fast: int,
+    slow: int,
+    signal: int,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the Moving Average Convergence Divergence (MACD) over a fetched history.
+
+    Args:
+        history: The price bars.
+        source: The price source to use.
+        fast: The window of the fast EMA.
+        slow: The window of the slow EMA.
+        signal: The window of the EMA of the MACD line.
+        decimals: The number of decimal places of the values.
+
+    Returns:
+        A table with the MACD line, the signal line and the histogram, from the
+        first bar the slow EMA is defined for.
+    """
+    if len(history.bars) < slow:
+        return Error(
+            what=f"Insufficient data for MACD calculation. "
+            f"Need at least {slow} candles/samples, but got {len(history.bars)} points. Reason: "
+            f"1) The period is too short for the interval, 2) or the interval is too big for the period. "
+            f"Try a) increasing the period, b) reducing the interval, c) or reducing the slow EMA window."
+        )
+
+    columns = PriceColumns.from_bars(history.bars)
+    line, signal_line, histogram = moving_average_convergence_divergence(columns.price(source), fast, slow, signal)
+
+    return build_time_series_table(
+        history.ticker,
+        columns.dates[slow - 1 :],
+        {"macd": line, "signal": signal_line, "histogram": histogram},
+        decimals,
+    )
+
+
+def _validate_windows(fast: int, slow: int, signal: int) -> Error | None:
+    """Validate the windows of the MACD.
+
+    Args:
+        fast: The window of the fast EMA.
+        slow: The window of the slow EMA.
+        signal: The window of the EMA of the MACD line.
+
+    Returns:
+        An error if any window is not positive, or the fast one is not shorter than the slow one, otherwise None.
+    """
+    for name, window in (("fast", fast), ("slow", slow), ("signal", signal)):
+        if window <= 0:
+            return Error(what=f"MACD {name} window must be positive, got: {window}")
+
+    if fast >= slow:
+        return Error(what=f"MACD fast window must be shorter than the slow one, got: {fast} and {slow}")
+
+    return None
@@ -1,196 +1,182 @@
 """Module for computing the Relative Strength Index (RSI)."""
 
-from datetime import datetime
-
+from technical_analysis_mcp.cache import (
+    find_indicator_result,
+    history_fingerprint,
+    remember_indicator_result,
+    stream_indicator,
+)
+from technical_analysis_mcp.helpers import downsample_series
+from technical_analysis_mcp.indicators import PriceColumns, relative_strength_indices, start_rsi
 from technical_analysis_mcp.models import (
-    DataPoint,
+    CompactTimeSeries,
     Error,
     Interval,
     Period,
-    Price,
     PriceSource,
+    SeriesFormat,
     TimeSeries,
+    TimeSeriesTable,
+    build_time_series_table,
 )
 
-from .fetch_asset_price_history import fetch_asset_price_history
-
-
-def extract_price_data(prices: list[Price], source: PriceSource) -> list[tuple[datetime, float]]:
-    """Extract price data from Price objects based on the specified source.
-
-    Args:
-        prices: List of Price objects.
-        source: Which price field to extract (open, high, low, close).
-
-    Returns:
-        List of tuples containing (datetime, price_value).
-    """
-    extracted_data: list[tuple[datetime, float]] = []
+from .fetch_asset_price_history import PriceHistory, fetch_price_history
+from .indicator_series import build_indicator_series, validate_lengths, validate_series_options
 
-    for price in prices:
-        if source == "open":
-            extracted_data.append((price.date, price.open))
-        elif source == "high":
-            extracted_data.append((price.date, price.high))
-        elif source == "low":
-            extracted_data.append((price.date, price.low))
-        else:  # "close"
-            extracted_data.append((price.date, price.close))
-
-    return extracted_data
 
+async def compute_rsi(  # noqa: PLR0913
+    ticker: str,
+    source: PriceSource,
+    period: Period,
+    interval: Interval,
+    candles: int | list[int] = 14,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> TimeSeries | CompactTimeSeries | TimeSeriesTable | Error:
+    """Compute the Relative Strength Index (RSI) for a given ticker.
 
-def compute_price_deltas(prices: list[float]) -> list[float]:
-    """Calculate price differences between consecutive periods.
+    The state of the indicator after the last complete bar is kept in memory,
+    so refreshing a series that only gained new bars adds just those bars, and
+    so is the result, so identical requests over the same bars are served
+    without computing it again. A list of periods sweeps them all in one
+    vectorized pass and returns a table with a column per period.
 
     Args:
-        prices: List of price values.
+        ticker: The ticker symbol (e.g., "AAPL").
+        source: The price source to use.
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+        candles: The number of candles/samples to calculate RSI, or a list of them (default 14).
+        format: The layout of the series, a list of dated values or compact arrays.
+        decimals: The number of decimal places of the values in the compact layout (default 6).
+        max_points: The maximum number of values, selected to keep the shape of the series (default all).
 
     Returns:
-        List of price differences where the first element is 0.
+        The indicator series.
     """
-    if not prices:
-        return []
-
-    deltas = [0.0] * len(prices)
+    error = validate_lengths("RSI period", candles, max_points) or validate_series_options(decimals, max_points)
 
-    for i in range(1, len(prices)):
-        deltas[i] = prices[i] - prices[i - 1]
+    if error is not None:
+        return error
 
-    return deltas
+    history = await fetch_price_history(ticker, period, interval)
 
+    if isinstance(history, Error):
+        return history
 
-def separate_gains_losses(deltas: list[float]) -> tuple[list[float], list[float]]:
-    """Separate price deltas into gains and losses.
-
-    Args:
-        deltas: List of price differences.
-
-    Returns:
-        Tuple of (gains, losses) where:
-        - gains[i] = delta[i] if delta[i] > 0 else 0
-        - losses[i] = abs(delta[i]) if delta[i] < 0 else 0
-    """
-    gains = [0.0] * len(deltas)
-    losses = [0.0] * len(deltas)
-
-    for i, delta in enumerate(deltas):
-        if delta > 0:
-            gains[i] = delta
-        elif delta < 0:
-            losses[i] = -delta
+    if isinstance(candles, list):
+        return rsi_sweep(history, source, candles, decimals)
 
-    return gains, losses
+    return rsi_series(history, source, candles, format, decimals, max_points)
 
 
-def compute_average_gain_loss(
-    gains: list[float],
-    losses: list[float],
-    period: int,
-) -> tuple[list[float], list[float]]:
-    """Compute exponential moving averages of gains and losses.
+def rsi_series(  # noqa: PLR0913
+    history: PriceHistory,
+    source: PriceSource,
+    candles: int,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+    columns: PriceColumns | None = None,
+) -> TimeSeries | CompactTimeSeries | Error:
+    """Compute the Relative Strength Index (RSI) over a fetched history.
 
     Args:
-        gains: List of gain values.
-        losses: List of loss values.
-        period: RSI period for smoothing.
+        history: The price bars.
+        source: The price source to use.
+        candles: The number of candles/samples to calculate RSI.
+        format: The layout of the series, a list of dated values or compact arrays.
+        decimals: The number of decimal places of the values in the compact layout.
+        max_points: The maximum number of values, selected to keep the shape of the series, if any.
+        columns: The columns of the history, if already built, e.g. for several indicators.
 
     Returns:
-        Tuple of (average_gains, average_losses) lists.
+        The indicator series.
     """
-    n = len(gains)
-    average_gains = [0.0] * n
-    average_losses = [0.0] * n
-
-    if n <= period:
-        return average_gains, average_losses
-
-    avg_gain = sum(gains[1 : period + 1]) / period
-    avg_loss = sum(losses[1 : period + 1]) / period
-    average_gains[period] = avg_gain
-    average_losses[period] = avg_loss
+    ticker, period, interval = history.ticker, history.period, history.interval
+
+    if len(history.bars) <= candles:
+        return _insufficient_data(candles, len(history.bars))
+
+    key = (
+        "rsi",
+        ticker,
+        period,
+        interval,
+        source,
+        str(candles),
+        format,
+        str(decimals),
+        str(max_points),
+        *history_fingerprint(history.bars),
+    )
+    result = find_indicator_result(key)
+
+    if result is None:
+        columns = columns or PriceColumns.from_bars(history.bars)
+        rsi = stream_indicator(
+            ("rsi", ticker.strip().upper(), period, interval, source, str(candles)),
+            columns.timestamps,
+            columns.price(source),
+            lambda prices: start_rsi(prices, candles),
+        )
+        rsi_dates, rsi_values = downsample_series(columns.dates[candles:], rsi, max_points)
+        result = build_indicator_series(ticker, rsi_dates, rsi_values, format, decimals)
+        remember_indicator_result(key, result)
 
-    for i in range(period + 1, n):
-        average_gains[i] = (average_gains[i - 1] * (period - 1) + gains[i]) / period
-        average_losses[i] = (average_losses[i - 1] * (period - 1) + losses[i]) / period
+    return result
 
-    return average_gains, average_losses
 
+def rsi_sweep(
+    history: PriceHistory,
+    source: PriceSource,
+    candles: list[int],
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the Relative Strength Index (RSI) over a fetched history for several periods.
 
-def compute_rsi_values(
-    average_gains: list[float],
-    average_losses: list[float],
-    period: int,
-) -> list[float]:
-    """Compute RSI values from average gains and losses.
+    Every period is computed in one vectorized pass over the same prices, sharing the gains and losses.
 
     Args:
-        average_gains: List of average gain values.
-        average_losses: List of average loss values.
-        period: RSI period.
+        history: The price bars.
+        source: The price source to use.
+        candles: The periods, repeated ones computed once.
+        decimals: The number of decimal places of the values.
 
     Returns:
-        List of RSI values.
+        A table with a column per period, from the first value of the shortest one.
     """
-    n = len(average_gains)
-    rsi_values = [0.0] * n
+    lengths = list(dict.fromkeys(candles))
+    shortest = min(lengths)
 
-    for i in range(period, n):
-        avg_gain = average_gains[i]
-        avg_loss = average_losses[i]
+    if len(history.bars) <= shortest:
+        return _insufficient_data(shortest, len(history.bars))
 
-        if avg_loss == 0:
-            rsi_values[i] = 100.0
-        else:
-            rs = avg_gain / avg_loss
-            rsi_values[i] = 100 - (100 / (1 + rs))
+    columns = PriceColumns.from_bars(history.bars)
+    table = relative_strength_indices(columns.price(source), lengths)
 
-    return rsi_values
+    return build_time_series_table(
+        history.ticker,
+        columns.dates[shortest:],
+        {f"rsi_{length}": row[shortest:] for length, row in zip(lengths, table, strict=True)},
+        decimals,
+    )
 
 
-async def compute_rsi(
-    ticker: str,
-    source: PriceSource,
-    period: Period,
-    interval: Interval,
-    candles: int = 14,
-) -> TimeSeries | Error:
-    """Compute the Relative Strength Index (RSI) for a given ticker.
+def _insufficient_data(candles: int, count: int) -> Error:
+    """Describe why there are not enough prices for the RSI.
 
     Args:
-        ticker: The ticker symbol (e.g., "AAPL").
-        source: The price source to use.
-        period: The time period for which to fetch historical data.
-        interval: The interval between data points.
-        candles: The number of candles/samples to calculate RSI (default 14).
+        candles: The number of candles of the RSI.
+        count: The number of prices.
 
     Returns:
-        The indicator series.
+        The error.
     """
-    if candles <= 0:
-        return Error(what=f"RSI period must be positive, got: {candles}")
-
-    history = await fetch_asset_price_history(ticker, period, interval)
-
-    if isinstance(history, Error):
-        return history
-
-    if len(history.prices) <= candles:
-        return Error(
-            what=f"Insufficient data for RSI calculation. "
-            f"Need at least {candles + 1} candles/samples. but got {len(history.prices)} points. Reason: "
-            f"1) The period is too short for the interval, 2) or the interval is too big for the period. "
-            f"Try a) increasing the period, b) reducing the interval, c) or reducing the number of RSI candles."
-        )
-
-    price_data = extract_price_data(history.prices, source)
-    x = [date for date, _ in price_data]
-    y = [value for _, value in price_data]
-    deltas = compute_price_deltas(y)
-    gains, losses = separate_gains_losses(deltas)
-    average_gains, average_losses = compute_average_gain_loss(gains, losses, candles)
-    rsi = compute_rsi_values(average_gains, average_losses, candles)
-
-    result = [DataPoint(date=x[i], value=float(rsi[i])) for i in range(candles, len(rsi))]
-
-    return TimeSeries(ticker=ticker, data_points=result)
+    return Error(
+        what=f"Insufficient data for RSI calculation. "
+        f"Need at least {candles + 1} candles/samples. but got {count} points. Reason: "
+        f"1) The period is too short for the interval, 2) or the interval is too big for the period. "
+        f"Try a) increasing the period, b) reducing the interval, c) or reducing the number of RSI candles."
+    )
@@ -1,111 +1,182 @@
 """Module for computing Simple Moving Average (SMA)."""
 
-from datetime import datetime
-
+from technical_analysis_mcp.cache import (
+    find_indicator_result,
+    history_fingerprint,
+    remember_indicator_result,
+    stream_indicator,
+)
+from technical_analysis_mcp.helpers import downsample_series
+from technical_analysis_mcp.indicators import PriceColumns, simple_moving_averages, start_sma
 from technical_analysis_mcp.models import (
-    DataPoint,
+    CompactTimeSeries,
     Error,
     Interval,
     Period,
-    Price,
     PriceSource,
+    SeriesFormat,
     TimeSeries,
+    TimeSeriesTable,
+    build_time_series_table,
 )
 
-from .fetch_asset_price_history import fetch_asset_price_history
+from .fetch_asset_price_history import PriceHistory, fetch_price_history
+from .indicator_series import build_indicator_series, validate_lengths, validate_series_options
+
 
+async def compute_sma(  # noqa: PLR0913
+    ticker: str,
+    source: PriceSource,
+    period: Period,
+    interval: Interval,
+    window: int | list[int] = 20,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> TimeSeries | CompactTimeSeries | TimeSeriesTable | Error:
+    """Compute the Simple Moving Average (SMA) for a given ticker.
 
-def extract_price_data(prices: list[Price], source: PriceSource) -> list[tuple[datetime, float]]:
-    """Extract price data from Price objects based on the specified source.
+    The state of the indicator after the last complete bar is kept in memory,
+    so refreshing a series that only gained new bars adds just those bars, and
+    so is the result, so identical requests over the same bars are served
+    without computing it again. A list of windows sweeps them all in one
+    vectorized pass and returns a table with a column per window.
 
     Args:
-        prices: List of Price objects.
-        source: Which price field to extract (open, high, low, close).
+        ticker: The ticker symbol (e.g., "AAPL").
+        source: The price source to use.
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+        window: The moving window period for SMA calculation, or a list of them (default 20).
+        format: The layout of the series, a list of dated values or compact arrays.
+        decimals: The number of decimal places of the values in the compact layout (default 6).
+        max_points: The maximum number of values, selected to keep the shape of the series (default all).
 
     Returns:
-        List of tuples containing (datetime, price_value).
+        The indicator series.
     """
-    extracted_data: list[tuple[datetime, float]] = []
+    error = validate_lengths("SMA window", window, max_points) or validate_series_options(decimals, max_points)
+
+    if error is not None:
+        return error
+
+    history = await fetch_price_history(ticker, period, interval)
 
-    for price in prices:
-        if source == "open":
-            extracted_data.append((price.date, price.open))
-        elif source == "high":
-            extracted_data.append((price.date, price.high))
-        elif source == "low":
-            extracted_data.append((price.date, price.low))
-        else:
-            extracted_data.append((price.date, price.close))
+    if isinstance(history, Error):
+        return history
 
-    return extracted_data
+    if isinstance(window, list):
+        return sma_sweep(history, source, window, decimals)
 
+    return sma_series(history, source, window, format, decimals, max_points)
 
-def compute_sma_values(
-    prices: list[float],
-    period: int,
-) -> list[float]:
-    """Compute Simple Moving Average values.
+
+def sma_series(  # noqa: PLR0913
+    history: PriceHistory,
+    source: PriceSource,
+    window: int,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+    columns: PriceColumns | None = None,
+) -> TimeSeries | CompactTimeSeries | Error:
+    """Compute the Simple Moving Average (SMA) over a fetched history.
 
     Args:
-        prices: List of price values.
-        period: The moving window period.
+        history: The price bars.
+        source: The price source to use.
+        window: The moving window period for SMA calculation.
+        format: The layout of the series, a list of dated values or compact arrays.
+        decimals: The number of decimal places of the values in the compact layout.
+        max_points: The maximum number of values, selected to keep the shape of the series, if any.
+        columns: The columns of the history, if already built, e.g. for several indicators.
 
     Returns:
-        List of SMA values.
+        The indicator series.
     """
-    if len(prices) < period or period <= 0:
-        return []
-
-    sma_values: list[float] = []
-
-    for i in range(period - 1, len(prices)):
-        window = prices[i - period + 1 : i + 1]
-        sma = sum(window) / period
-        sma_values.append(sma)
+    ticker, period, interval = history.ticker, history.period, history.interval
+
+    if len(history.bars) < window:
+        return _insufficient_data(window, len(history.bars))
+
+    key = (
+        "sma",
+        ticker,
+        period,
+        interval,
+        source,
+        str(window),
+        format,
+        str(decimals),
+        str(max_points),
+        *history_fingerprint(history.bars),
+    )
+    result = find_indicator_result(key)
+
+    if result is None:
+        columns = columns or PriceColumns.from_bars(history.bars)
+        sma = stream_indicator(
+            ("sma", ticker.strip().upper(), period, interval, source, str(window)),
+            columns.timestamps,
+            columns.price(source),
+            lambda prices: start_sma(prices, window),
+        )
+        sma_dates, sma_values = downsample_series(columns.dates[window - 1 :], sma, max_points)
+        result = build_indicator_series(ticker, sma_dates, sma_values, format, decimals)
+        remember_indicator_result(key, result)
 
-    return sma_values
+    return result
 
 
-async def compute_sma(
-    ticker: str,
+def sma_sweep(
+    history: PriceHistory,
     source: PriceSource,
-    period: Period,
-    interval: Interval,
-    window: int = 20,
-) -> TimeSeries | Error:
-    """Compute the Simple Moving Average (SMA) for a given ticker.
+    window: list[int],
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the Simple Moving Average (SMA) over a fetched history for several windows.
+
+    Every window is computed in one vectorized pass over the same prices, from a single cumulative sum.
 
     Args:
-        ticker: The ticker symbol (e.g., "AAPL").
+        history: The price bars.
         source: The price source to use.
-        period: The time period for which to fetch historical data.
-        interval: The interval between data points.
-        window: The moving window period for SMA calculation (default 20).
+        window: The windows, repeated ones computed once.
+        decimals: The number of decimal places of the values.
 
     Returns:
-        The indicator series.
+        A table with a column per window, from the first value of the shortest one.
     """
-    if window <= 0:
-        return Error(what=f"SMA window must be positive, got: {window}")
+    lengths = list(dict.fromkeys(window))
+    shortest = min(lengths)
 
-    history = await fetch_asset_price_history(ticker, period, interval)
+    if len(history.bars) < shortest:
+        return _insufficient_data(shortest, len(history.bars))
 
-    if isinstance(history, Error):
-        return history
+    columns = PriceColumns.from_bars(history.bars)
+    table = simple_moving_averages(columns.price(source), lengths)
+
+    return build_time_series_table(
+        history.ticker,
+        columns.dates[shortest - 1 :],
+        {f"sma_{length}": row[shortest - 1 :] for length, row in zip(lengths, table, strict=True)},
+        decimals,
+    )
 
-    if len(history.prices) < window:
-        return Error(
-            what=f"Insufficient data for SMA calculation. "
-            f"Need at least {window} candles/samples, but got {len(history.prices)} points. Reason: "
-            f"1) The period is too short for the interval, 2) or the interval is too big for the period. "
-            f"Try a) increasing the period, b) reducing the interval, c) or reducing the SMA window."
-        )
 
-    price_data = extract_price_data(history.prices, source)
-    dates = [date for date, _ in price_data]
-    values = [value for _, value in price_data]
-    sma_values = compute_sma_values(values, window)
+def _insufficient_data(window: int, count: int) -> Error:
+    """Describe why there are not enough prices for the SMA.
 
-    result = [DataPoint(date=dates[i + window - 1], value=float(sma_values[i])) for i in range(len(sma_values))]
+    Args:
+        window: The moving window period of the SMA.
+        count: The number of prices.
 
-    return TimeSeries(ticker=ticker, data_points=result)
+    Returns:
+        The error.
+    """
+    return Error(
+        what=f"Insufficient data for SMA calculation. "
+        f"Need at least {window} candles/samples, but got {count} points. Reason: "
+        f"1) The period is too short for the interval, 2) or the interval is too big for the period. "
+        f"Try a) increasing the period, b) reducing the interval, c) or reducing the SMA window."
+    )
@@ -0,0 +1,82 @@
+"""Module for computing the stochastic oscillator."""
+
+from technical_analysis_mcp.indicators import PriceColumns, stochastic_oscillator
+from technical_analysis_mcp.models import (
+    Error,
+    Interval,
+    Period,
+    TimeSeriesTable,
+    build_time_series_table,
+)
+
+from .fetch_asset_price_history import PriceHistory, fetch_price_history
+from .indicator_series import validate_lengths, validate_series_options
+
+
+async def compute_stochastic(  # noqa: PLR0913
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    window: int = 14,
+    smoothing: int = 3,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the stochastic oscillator for a given ticker.
+
+    Args:
+        ticker: The ticker symbol (e.g., "AAPL").
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+        window: The number of candles/samples of the highest high and lowest low (default 14).
+        smoothing: The number of %K values averaged by %D (default 3).
+        decimals: The number of decimal places of the values (default 6).
+
+    Returns:
+        A table with the %K and %D lines.
+    """
+    error = (
+        validate_lengths("Stochastic window", window, None)
+        or validate_lengths("Stochastic smoothing", smoothing, None)
+        or validate_series_options(decimals, None)
+    )
+
+    if error is not None:
+        return error
+
+    history = await fetch_price_history(ticker, period, interval)
+
+    if isinstance(history, Error):
+        return history
+
+    return stochastic_table(history, window, smoothing, decimals)
+
+
+def stochastic_table(
+    history: PriceHistory,
+    window: int,
+    smoothing: int,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Compute the stochastic oscillator over a fetched history.
+
+    Args:
+        history: The price bars.
+        window: The number of candles/samples of the highest high and lowest low.
+        smoothing: The number of %K values averaged by %D.
+        decimals: The number of decimal places of the values.
+
+    Returns:
+        A table with the %K and %D lines, from the first complete window.
+    """
+    if len(history.bars) < window:
+        return Error(
+            what=f"Insufficient data for stochastic oscillator calculation. "
+            f"Need at least {window} candles/samples, but got {len(history.bars)} points. Reason: "
+            f"1) The period is too short for the interval, 2) or the interval is too big for the period. "
+            f"Try a) increasing the period, b) reducing the interval, c) or reducing the stochastic window."
+        )
+
+    columns = PriceColumns.from_bars(history.bars)
+    k, d = stochastic_oscillator(columns.high, columns.low, columns.close, window, smoothing)
+
+    return build_time_series_table(history.ticker, columns.dates[window - 1 :], {"k": k, "d": d}, decimals)
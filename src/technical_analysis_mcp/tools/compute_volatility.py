@@ -0,0 +1,90 @@
+"""Module for estimating the volatility from full price bars."""
+
+from technical_analysis_mcp.indicators import PriceColumns, range_volatilities
+from technical_analysis_mcp.models import (
+    Error,
+    Interval,
+    Period,
+    TimeSeriesTable,
+    build_time_series_table,
+)
+
+from .fetch_asset_price_history import PriceHistory, fetch_price_history
+from .indicator_series import validate_series_options
+
+_MIN_WINDOW = 2
+
+
+async def compute_volatility(
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    window: int = 20,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Estimate the volatility of a given ticker with the Parkinson, Garman-Klass and Yang-Zhang estimators.
+
+    Args:
+        ticker: The ticker symbol (e.g., "AAPL").
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+        window: The number of candles/samples of each estimate (default 20).
+        decimals: The number of decimal places of the values (default 6).
+
+    Returns:
+        A table with the estimate of each estimator.
+    """
+    if window < _MIN_WINDOW:
+        return Error(what=f"Volatility window must be at least {_MIN_WINDOW}, got: {window}")
+
+    error = validate_series_options(decimals, None)
+
+    if error is not None:
+        return error
+
+    history = await fetch_price_history(ticker, period, interval)
+
+    if isinstance(history, Error):
+        return history
+
+    return volatility_table(history, window, decimals)
+
+
+def volatility_table(
+    history: PriceHistory,
+    window: int,
+    decimals: int = 6,
+) -> TimeSeriesTable | Error:
+    """Estimate the volatility over a fetched history.
+
+    Args:
+        history: The price bars.
+        window: The number of candles/samples of each estimate.
+        decimals: The number of decimal places of the values.
+
+    Returns:
+        A table with the estimate of each estimator, from the first complete window.
+    """
+    if len(history.bars) < window:
+        return Error(
+            what=f"Insufficient data for volatility calculation. "
+            f"Need at least {window} candles/samples, but got {len(history.bars)} points. Reason: "
+            f"1) The period is too short for the interval, 2) or the interval is too big for the period. "
+            f"Try a) increasing the period, b) reducing the interval, c) or reducing the volatility window."
+        )
+
+    columns = PriceColumns.from_bars(history.bars)
+    parkinson, garman_klass, yang_zhang = range_volatilities(
+        columns.open,
+        columns.high,
+        columns.low,
+        columns.close,
+        window,
+    )
+
+    return build_time_series_table(
+        history.ticker,
+        columns.dates[window - 1 :],
+        {"parkinson": parkinson, "garman_klass": garman_klass, "yang_zhang": yang_zhang},
+        decimals,
+    )
@@ -0,0 +1,106 @@
+"""Module for computing the Williams %R."""
+
+from technical_analysis_mcp.cache import find_indicator_result, history_fingerprint, remember_indicator_result
+from technical_analysis_mcp.helpers import downsample_series
+from technical_analysis_mcp.indicators import PriceColumns, williams_r
+from technical_analysis_mcp.models import (
+    CompactTimeSeries,
+    Error,
+    Interval,
+    Period,
+    SeriesFormat,
+    TimeSeries,
+)
+
+from .fetch_asset_price_history import PriceHistory, fetch_price_history
+from .indicator_series import build_indicator_series, validate_lengths, validate_series_options
+
+
+async def compute_williams_r(  # noqa: PLR0913
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    candles: int = 14,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> TimeSeries | CompactTimeSeries | Error:
+    """Compute the Williams %R for a given ticker.
+
+    The highest highs and lowest lows of every window are found in linear
+    time, and the result is kept in memory, so identical requests over the
+    same bars are served without computing it again.
+
+    Args:
+        ticker: The ticker symbol (e.g., "AAPL").
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+        candles: The number of candles/samples to calculate Williams %R (default 14).
+        format: The layout of the series, a list of dated values or compact arrays.
+        decimals: The number of decimal places of the values in the compact layout (default 6).
+        max_points: The maximum number of values, selected to keep the shape of the series (default all).
+
+    Returns:
+        The indicator series.
+    """
+    error = validate_lengths("Williams %R period", candles, max_points) or validate_series_options(decimals, max_points)
+
+    if error is not None:
+        return error
+
+    history = await fetch_price_history(ticker, period, interval)
+
+    if isinstance(history, Error):
+        return history
+
+    return williams_r_series(history, candles, format, decimals, max_points)
+
+
+def williams_r_series(
+    history: PriceHistory,
+    candles: int,
+    format: SeriesFormat = "points",  # noqa: A002
+    decimals: int = 6,
+    max_points: int | None = None,
+) -> TimeSeries | CompactTimeSeries | Error:
+    """Compute the Williams %R over a fetched history.
+
+    Args:
+        history: The price bars.
+        candles: The number of candles/samples to calculate Williams %R.
+        format: The layout of the series, a list of dated values or compact arrays.
+        decimals: The number of decimal places of the values in the compact layout.
+        max_points: The maximum number of values, selected to keep the shape of the series, if any.
+
+    Returns:
+        The indicator series.
+    """
+    if len(history.bars) < candles:
+        return Error(
+            what=f"Insufficient data for Williams %R calculation. "
+            f"Need at least {candles} candles/samples, but got {len(history.bars)} points. Reason: "
+            f"1) The period is too short for the interval, 2) or the interval is too big for the period. "
+            f"Try a) increasing the period, b) reducing the interval, c) or reducing the number of Williams %R candles."
+        )
+
+    key = (
+        "williams_r",
+        history.ticker,
+        history.period,
+        history.interval,
+        str(candles),
+        format,
+        str(decimals),
+        str(max_points),
+        *history_fingerprint(history.bars),
+    )
+    result = find_indicator_result(key)
+
+    if result is None:
+        columns = PriceColumns.from_bars(history.bars)
+        williams = williams_r(columns.high, columns.low, columns.close, candles)
+        williams_dates, williams_values = downsample_series(columns.dates[candles - 1 :], williams, max_points)
+        result = build_indicator_series(history.ticker, williams_dates, williams_values, format, decimals)
+        remember_indicator_result(key, result)
+
+    return result
@@ -0,0 +1,229 @@
+"""Module for fetching the price history of several assets at once."""
+
+import sqlite3
+from datetime import UTC, datetime
+
+import pandas as pd
+
+from technical_analysis_mcp.cache import (
+    PriceStore,
+    StoredSeries,
+    find_error,
+    find_price_bars,
+    get_price_store,
+    period_covers,
+    remember_error,
+    remember_price_bars,
+)
+from technical_analysis_mcp.helpers import run_blocking
+from technical_analysis_mcp.models import (
+    AssetPriceHistories,
+    AssetPriceHistory,
+    Error,
+    Interval,
+    Period,
+)
+from technical_analysis_mcp.providers import get_provider
+
+from .fetch_asset_price_history import (
+    append_tail,
+    build_asset_price_history,
+    check_tail,
+    download_period,
+    slice_period,
+    tail_anchor,
+)
+
+
+def download_price_bars(symbols: list[str], period: Period, interval: Interval) -> dict[str, pd.DataFrame]:
+    """Load the price bars of several tickers, downloading those not stored locally in bulk.
+
+    Tickers whose stored bars cover the period only download their tail, like
+    `load_price_bars` does. The tails are downloaded together, from the earliest
+    stored bar they start at. The other tickers are downloaded together too, per
+    period to download so that a short period never replaces a longer stored
+    one, and kept in the local price store.
+
+    Args:
+        symbols: The normalized ticker symbols.
+        period: The time period to load.
+        interval: The interval between bars.
+
+    Returns:
+        The bars of each ticker indexed by timestamp, empty if the ticker has no data.
+
+    """
+    store = get_price_store()
+    series = {symbol: store.load(symbol, interval) for symbol in symbols}
+    loaded = _load_stored_price_bars(store, series, period, interval)
+    groups: dict[Period, list[str]] = {}
+
+    for symbol, bars in loaded.items():
+        if bars is None:
+            groups.setdefault(download_period(series[symbol], period), []).append(symbol)
+
+    now = datetime.now(UTC)
+    downloaded: dict[str, pd.DataFrame] = {}
+
+    for fetched, group in groups.items():
+        for symbol, bars in get_provider().download(group, fetched, interval).items():
+            if not bars.empty:
+                store.save(symbol, interval, fetched, bars)
+
+            downloaded[symbol] = (
+                bars if bars.empty or fetched == period else slice_period(bars, symbol, period, interval, now)
+            )
+
+    return {symbol: bars if bars is not None else downloaded[symbol] for symbol, bars in loaded.items()}
+
+
+def _load_stored_price_bars(
+    store: PriceStore,
+    series: dict[str, StoredSeries | None],
+    period: Period,
+    interval: Interval,
+) -> dict[str, pd.DataFrame | None]:
+    """Load the price bars of several tickers from the local store, downloading their tails in bulk.
+
+    Args:
+        store: The local price store.
+        series: The stored bars of each ticker, if any, keyed by normalized symbol.
+        period: The time period to load.
+        interval: The interval between bars.
+
+    Returns:
+        The bars of each ticker indexed by timestamp, or None if its stored bars
+        do not cover the period or are stale.
+
+    """
+    now = datetime.now(UTC)
+    loaded: dict[str, pd.DataFrame | None] = dict.fromkeys(series)
+    stored: dict[str, pd.DataFrame] = {}
+    anchors: dict[str, datetime] = {}
+
+    for symbol, bars in series.items():
+        if bars is not None and period_covers(bars.period, period):
+            anchor = tail_anchor(bars.bars, interval, now)
+
+            if anchor is not None:
+                stored[symbol], anchors[symbol] = bars.bars, anchor
+
+    if not anchors:
+        return loaded
+
+    tails = get_provider().download_since(list(anchors), min(anchors.values()), interval)
+
+    for symbol, anchor in anchors.items():
+        tail = check_tail(tails.get(symbol, pd.DataFrame()), stored[symbol], anchor)
+
+        if tail is not None:
+            loaded[symbol] = append_tail(store, symbol, period, interval, stored[symbol], tail, now)
+
+    return loaded
+
+
+async def fetch_asset_price_histories(
+    tickers: list[str],
+    period: Period,
+    interval: Interval,
+) -> AssetPriceHistories | Error:
+    """Fetch the asset price history of several ticker symbols.
+
+    Fresh bars are served from memory, sliced out of longer cached periods if
+    needed. Tickers stored locally only download the bars after the last stored
+    one, and the rest are downloaded together in a single bulk request, instead
+    of one request per ticker. Unknown tickers and empty histories are
+    remembered for a short time.
+
+    Args:
+        tickers: The ticker symbols, e.g., ["AAPL", "MSFT"].
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+
+    Returns:
+        The historical asset prices of each ticker, or an error for the tickers
+        without data. If the bulk download fails, an error is returned.
+
+    """
+    if not tickers:
+        return Error(what="At least one ticker is required.")
+
+    symbols = {ticker: ticker.strip().upper() for ticker in tickers}
+    errors: dict[str, Error] = {}
+    bars: dict[str, pd.DataFrame] = {}
+
+    for symbol in dict.fromkeys(symbols.values()):
+        error = find_error(symbol, period, interval)
+
+        if error is not None:
+            errors[symbol] = error
+
+    looked_up = [symbol for symbol in dict.fromkeys(symbols.values()) if symbol not in errors]
+    references = await run_blocking(_period_references, looked_up, interval)
+
+    for symbol, reference in references.items():
+        data = find_price_bars(symbol, period, interval, reference)
+
+        if data is not None:
+            bars[symbol] = data
+
+    missing = [symbol for symbol in looked_up if symbol not in bars]
+
+    if missing:
+        try:
+            downloaded = await run_blocking(download_price_bars, missing, period, interval)
+        except (ValueError, TypeError, KeyError, sqlite3.Error) as e:
+            return Error(what=f"Error fetching historical data for tickers {', '.join(missing)}: {e}")
+
+        now = datetime.now(UTC)
+
+        for symbol, data in downloaded.items():
+            if data.empty:
+                errors[symbol] = Error(what=f"No historical data found for ticker: {symbol}")
+                remember_error(errors[symbol], symbol, period, interval)
+            else:
+                remember_price_bars(symbol, period, interval, data, now)
+                bars[symbol] = data
+
+    histories = {
+        ticker: errors[symbol] if symbol in errors else _build_history(ticker, period, interval, bars[symbol])
+        for ticker, symbol in symbols.items()
+    }
+
+    return AssetPriceHistories(histories=histories)
+
+
+def _period_references(symbols: list[str], interval: Interval) -> dict[str, datetime]:
+    """Get the time the periods of several tickers are counted back from.
+
+    Args:
+        symbols: The normalized ticker symbols.
+        interval: The interval between bars.
+
+    Returns:
+        The reference time of each ticker.
+
+    """
+    now = datetime.now(UTC)
+    provider = get_provider()
+
+    return {symbol: provider.period_reference(symbol, interval, now) for symbol in symbols}
+
+
+def _build_history(ticker: str, period: Period, interval: Interval, data: pd.DataFrame) -> AssetPriceHistory | Error:
+    """Convert the price bars of one ticker, turning invalid bars into an error.
+
+    Args:
+        ticker: The ticker symbol.
+        period: The time period of the bars.
+        interval: The interval between bars.
+        data: The bars indexed by timestamp.
+
+    Returns:
+        The historical asset prices, or an error.
+
+    """
+    try:
+        return build_asset_price_history(ticker, period, interval, data)
+    except (ValueError, TypeError, KeyError) as e:
+        return Error(what=f"Error fetching historical data for ticker {ticker}: {e}")
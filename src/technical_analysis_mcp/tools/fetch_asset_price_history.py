@@ -1,55 +1,759 @@
 """Module for fetching asset price history."""
 
-from datetime import datetime
+import sqlite3
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any, NamedTuple
 
-import yfinance as yf
+import numpy as np
+import pandas as pd
+from pydantic import TypeAdapter
 
+from technical_analysis_mcp.cache import (
+    PriceStore,
+    SingleFlight,
+    StoredSeries,
+    downsample_bars,
+    find_error,
+    find_price_bars,
+    find_price_range,
+    get_price_store,
+    period_covers,
+    period_start_position,
+    range_positions,
+    remember_error,
+    remember_price_bars,
+)
+from technical_analysis_mcp.helpers import run_blocking, to_datetimes
 from technical_analysis_mcp.models import (
     AssetPriceHistory,
+    ColumnarAssetPriceHistory,
     Error,
     Interval,
     Period,
     Price,
 )
+from technical_analysis_mcp.providers import get_provider
+
+# How far back Yahoo Finance serves intraday bars. Tails older than this
+# cannot be fetched incrementally, so the whole period is downloaded again.
+_INTRADAY_LOOKBACK = {
+    "1m": timedelta(days=7),
+    "2m": timedelta(days=60),
+    "5m": timedelta(days=60),
+    "15m": timedelta(days=60),
+    "30m": timedelta(days=60),
+    "60m": timedelta(days=730),
+    "90m": timedelta(days=60),
+    "1h": timedelta(days=730),
+}
+
+_PRICE_FIELDS = ["Open", "High", "Low", "Close"]
+_ACTION_FIELDS = ["Dividends", "Stock Splits"]
+
+_PRICE_KEYS = ("date", "open", "high", "low", "close", "volume", "dividends", "stock_splits")
+_PRICES = TypeAdapter(list[Price])
+
+_IN_FLIGHT: SingleFlight[tuple[str, Period, Interval], pd.DataFrame] = SingleFlight()
+_RANGE_IN_FLIGHT: SingleFlight[tuple[str, datetime, datetime | None, Interval], pd.DataFrame] = SingleFlight()
+
+
+class PriceHistory(NamedTuple):
+    """The price bars of a ticker, kept in a data frame until a response is built."""
+
+    ticker: str
+    """The ticker symbol, as requested."""
+
+    period: Period
+    """The time period of the bars."""
+
+    interval: Interval
+    """The interval between bars."""
+
+    bars: pd.DataFrame
+    """The bars indexed by timestamp, with the columns of the upstream provider."""
+
+
+def tail_anchor(stored: pd.DataFrame, interval: Interval, now: datetime) -> datetime | None:
+    """Find the stored bar a download of the following bars starts at.
+
+    The last stored bar may have been incomplete, so the download starts at the
+    one before it, the last complete stored bar.
+
+    Args:
+        stored: The stored bars.
+        interval: The interval between bars.
+        now: The current time.
+
+    Returns:
+        The timestamp of the last complete stored bar, or None if the whole
+        period must be downloaded again.
+
+    """
+    min_stored_bars = 2
+
+    if len(stored) < min_stored_bars:
+        return None
+
+    anchor = stored.index[-2:].to_list()[0]
+    lookback = _INTRADAY_LOOKBACK.get(interval)
+
+    if lookback is not None and now - anchor >= lookback:
+        return None
+
+    return anchor
+
+
+def check_tail(tail: pd.DataFrame, stored: pd.DataFrame, anchor: datetime) -> pd.DataFrame | None:
+    """Check that downloaded bars continue the stored ones.
+
+    The last complete stored bar must come back unchanged. Otherwise, or if
+    there is a new dividend or split, the upstream provider has re-adjusted the
+    history and the stored bars are stale.
+
+    Args:
+        tail: The downloaded bars, possibly starting before the anchor, e.g. in a
+            bulk download for tickers stored up to different bars.
+        stored: The stored bars.
+        anchor: The timestamp of the last complete stored bar.
+
+    Returns:
+        The bars from the anchor onwards, or None if the whole period must be
+        downloaded again.
+
+    """
+    if tail.empty:
+        return None
+
+    tail = tail.loc[tail.index >= anchor]
+
+    if tail.empty or tail.index[0] != anchor:
+        return None
+
+    if not np.allclose(tail[_PRICE_FIELDS].iloc[0], stored[_PRICE_FIELDS].iloc[-2]):
+        return None
+
+    if tail[_ACTION_FIELDS].iloc[1:].to_numpy().any():
+        return None
+
+    return tail
+
+
+def fetch_tail(ticker: str, interval: Interval, stored: pd.DataFrame, now: datetime) -> pd.DataFrame | None:
+    """Fetch the bars following the stored ones.
+
+    Args:
+        ticker: The ticker symbol.
+        interval: The interval between bars.
+        stored: The stored bars.
+        now: The current time.
+
+    Returns:
+        The bars from the last complete stored bar onwards, or None if the whole
+        period must be downloaded again.
+
+    """
+    anchor = tail_anchor(stored, interval, now)
+
+    if anchor is None:
+        return None
+
+    return check_tail(get_provider().history_since(ticker, anchor, interval), stored, anchor)
+
+
+def load_stored_price_bars(
+    store: PriceStore,
+    ticker: str,
+    stored: StoredSeries | None,
+    period: Period,
+    interval: Interval,
+) -> pd.DataFrame | None:
+    """Load the price bars of a period from the local store, downloading only the tail.
+
+    Args:
+        store: The local price store.
+        ticker: The ticker symbol.
+        stored: The stored bars of the ticker, if any.
+        period: The time period to load.
+        interval: The interval between bars.
+
+    Returns:
+        The bars indexed by timestamp, or None if the stored bars do not cover
+        the period or are stale, in which case the whole period must be downloaded.
+
+    """
+    if stored is None or not period_covers(stored.period, period):
+        return None
+
+    now = datetime.now(UTC)
+    tail = fetch_tail(ticker, interval, stored.bars, now)
+
+    if tail is None:
+        return None
+
+    return append_tail(store, ticker.strip().upper(), period, interval, stored.bars, tail, now)
+
+
+def append_tail(  # noqa: PLR0913
+    store: PriceStore,
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    stored: pd.DataFrame,
+    tail: pd.DataFrame,
+    now: datetime,
+) -> pd.DataFrame:
+    """Store the bars following the stored ones, and slice the period out of all of them.
+
+    Args:
+        store: The local price store.
+        ticker: The normalized ticker symbol.
+        period: The time period to load.
+        interval: The interval between bars.
+        stored: The stored bars.
+        tail: The bars from the last complete stored bar onwards.
+        now: The current time.
+
+    Returns:
+        The bars of the period indexed by timestamp.
+
+    """
+    store.update(ticker, interval, tail)
+    bars = pd.concat([stored.iloc[:-2], tail.loc[:, stored.columns]])
+
+    return slice_period(bars, ticker, period, interval, now)
+
+
+def slice_period(bars: pd.DataFrame, ticker: str, period: Period, interval: Interval, now: datetime) -> pd.DataFrame:
+    """Slice the bars of a period out of the bars of a longer one.
+
+    Args:
+        bars: The bars indexed by timestamp, up to the present.
+        ticker: The ticker symbol.
+        period: The time period to keep.
+        interval: The interval between bars.
+        now: The current time.
+
+    Returns:
+        The bars of the period indexed by timestamp.
+
+    """
+    reference = get_provider().period_reference(ticker, interval, now)
+
+    return bars.iloc[period_start_position(pd.DatetimeIndex(bars.index), period, reference) :]
+
+
+def download_period(stored: StoredSeries | None, period: Period) -> Period:
+    """Choose the period to download when the stored bars cannot be completed.
+
+    A stored period longer than the requested one is downloaded again, so that
+    saving the download never shortens the stored series.
+
+    Args:
+        stored: The stored bars of the ticker, if any.
+        period: The requested time period.
+
+    Returns:
+        The time period to download.
+
+    """
+    if stored is not None and period_covers(stored.period, period):
+        return stored.period
+
+    return period
+
+
+def load_price_bars(ticker: str, period: Period, interval: Interval) -> pd.DataFrame:
+    """Load the price bars of a period, downloading only what is not stored locally.
+
+    Args:
+        ticker: The ticker symbol.
+        period: The time period to load.
+        interval: The interval between bars.
+
+    Returns:
+        The bars indexed by timestamp, empty if the ticker has no data.
+
+    """
+    store = get_price_store()
+    symbol = ticker.strip().upper()
+    stored = store.load(symbol, interval)
+    bars = load_stored_price_bars(store, ticker, stored, period, interval)
+
+    if bars is not None:
+        return bars
+
+    fetched = download_period(stored, period)
+    bars = get_provider().history(ticker, fetched, interval)
+
+    if bars.empty:
+        return bars
+
+    store.save(symbol, interval, fetched, bars)
+
+    return bars if fetched == period else slice_period(bars, symbol, period, interval, datetime.now(UTC))
+
+
+def build_asset_price_history(
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    data: pd.DataFrame,
+    next_cursor: str | None = None,
+) -> AssetPriceHistory | Error:
+    """Convert price bars into an asset price history.
+
+    Columns are converted in bulk, and every price is validated in a single
+    call instead of one model construction per bar.
+
+    Args:
+        ticker: The ticker symbol.
+        period: The time period of the bars.
+        interval: The interval between bars.
+        data: The bars indexed by timestamp.
+        next_cursor: The cursor to continue from the first bar not included, if any.
+
+    Returns:
+        The historical asset prices. If there are no bars, an error is returned.
+
+    Raises:
+        ValueError: If a bar has invalid values.
+        KeyError: If a price column is missing.
+
+    """
+    if data.empty:
+        return Error(what=f"No historical data found for ticker: {ticker}")
+
+    rows = zip(*_extract_columns(ticker, data), strict=True)
+    prices = _PRICES.validate_python([dict(zip(_PRICE_KEYS, row, strict=True)) for row in rows])
+
+    return AssetPriceHistory(ticker=ticker, period=period, interval=interval, prices=prices, next_cursor=next_cursor)
+
+
+def build_price_history(
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    data: pd.DataFrame,
+    next_cursor: str | None = None,  # noqa: ARG001
+) -> PriceHistory | Error:
+    """Keep price bars as they are, for computing indicators.
+
+    Args:
+        ticker: The ticker symbol.
+        period: The time period of the bars.
+        interval: The interval between bars.
+        data: The bars indexed by timestamp.
+        next_cursor: The cursor of the next page, unused since every bar is kept.
+
+    Returns:
+        The price history. If there are no bars, an error is returned.
+
+    """
+    if data.empty:
+        return Error(what=f"No historical data found for ticker: {ticker}")
+
+    return PriceHistory(ticker=ticker, period=period, interval=interval, bars=data)
+
+
+def build_columnar_asset_price_history(
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    data: pd.DataFrame,
+    next_cursor: str | None = None,
+) -> ColumnarAssetPriceHistory | Error:
+    """Convert price bars into an asset price history of parallel arrays.
+
+    Args:
+        ticker: The ticker symbol.
+        period: The time period of the bars.
+        interval: The interval between bars.
+        data: The bars indexed by timestamp.
+        next_cursor: The cursor to continue from the first bar not included, if any.
+
+    Returns:
+        The historical asset prices. If there are no bars, an error is returned.
+
+    Raises:
+        ValueError: If a bar has invalid values.
+        KeyError: If a price column is missing.
+
+    """
+    if data.empty:
+        return Error(what=f"No historical data found for ticker: {ticker}")
+
+    timestamps, open_, high, low, close, volume, dividends, stock_splits = _extract_columns(ticker, data)
+
+    return ColumnarAssetPriceHistory(
+        ticker=ticker,
+        period=period,
+        interval=interval,
+        timestamps=timestamps,
+        open=open_,
+        high=high,
+        low=low,
+        close=close,
+        volume=volume,
+        dividends=dividends,
+        stock_splits=stock_splits,
+        next_cursor=next_cursor,
+    )
+
+
+def _extract_columns(ticker: str, data: pd.DataFrame) -> list[list[Any]]:
+    """Convert the columns of price bars into lists of Python values.
+
+    Args:
+        ticker: The ticker symbol.
+        data: The bars indexed by timestamp.
+
+    Returns:
+        The timestamps, open, high, low and close prices, volume, dividends and
+        stock splits, in that order.
+
+    Raises:
+        ValueError: If a bar has no volume.
+        KeyError: If a price column is missing.
+
+    """
+    volumes = data["Volume"].to_numpy(dtype=np.float64)
+
+    if np.isnan(volumes).any():
+        message = f"Missing volume in historical data for ticker: {ticker}"
+        raise ValueError(message)
+
+    return [
+        to_datetimes(pd.DatetimeIndex(data.index)),
+        *(data[name].to_numpy(dtype=np.float64).tolist() for name in _PRICE_FIELDS),
+        volumes.astype(np.int64).tolist(),
+        *(data[name].to_numpy(dtype=np.float64).tolist() for name in _ACTION_FIELDS),
+    ]
+
+
+async def load_cached_price_bars(ticker: str, period: Period, interval: Interval) -> pd.DataFrame:
+    """Load the price bars of a period, from memory if they are still fresh.
+
+    Bars cached for a longer period are sliced, counting the period back from
+    the same time as the provider does, and bars cached at a finer interval are
+    aggregated, instead of loaded again. The reference time is looked up, and
+    concurrent requests for the same bars share a single load, in the I/O
+    thread pool.
+
+    Args:
+        ticker: The ticker symbol.
+        period: The time period to load.
+        interval: The interval between bars.
+
+    Returns:
+        The bars indexed by timestamp, empty if the ticker has no data.
+
+    """
+    symbol = ticker.strip().upper()
+    reference = await run_blocking(get_provider().period_reference, ticker, interval, datetime.now(UTC))
+    data = find_price_bars(symbol, period, interval, reference)
+
+    if data is not None:
+        return data
+
+    async def load() -> pd.DataFrame:
+        data = await run_blocking(load_price_bars, ticker, period, interval)
+
+        if not data.empty:
+            remember_price_bars(symbol, period, interval, data, datetime.now(UTC))
+
+        return data
+
+    return await _IN_FLIGHT.run((symbol, period, interval), load)
+
+
+async def load_price_range(ticker: str, start: datetime, end: datetime | None, interval: Interval) -> pd.DataFrame:
+    """Load the price bars of a time range, from memory if the cached bars cover it.
+
+    Otherwise only the range is requested from the provider. Concurrent
+    requests for the same range share a single load, which runs in the I/O
+    thread pool.
+
+    Args:
+        ticker: The ticker symbol.
+        start: The timestamp of the first bar, timezone-aware.
+        end: The timestamp the bars end before, timezone-aware, or None up to the latest bar.
+        interval: The interval between bars.
+
+    Returns:
+        The bars indexed by timestamp, empty if the ticker has no data in the range.
+
+    """
+    symbol = ticker.strip().upper()
+    data = find_price_range(symbol, interval, start, end)
+
+    if data is not None:
+        return data
+
+    provider = get_provider()
+
+    return await _RANGE_IN_FLIGHT.run(
+        (symbol, start, end, interval),
+        lambda: run_blocking(provider.history_between, ticker, start, end, interval),
+    )
+
+
+def select_page(
+    data: pd.DataFrame,
+    start: datetime | None,
+    end: datetime | None,
+    limit: int | None,
+) -> tuple[pd.DataFrame, str | None]:
+    """Select a page of price bars.
+
+    Args:
+        data: The sorted bars indexed by timezone-aware timestamps.
+        start: The timestamp of the first bar, timezone-aware, or None from the first bar.
+        end: The timestamp the bars end before, timezone-aware, or None up to the last bar.
+        limit: The maximum number of bars, or None for every bar of the range.
+
+    Returns:
+        The bars of the page, and the cursor of the first bar of the range after
+        them, or None if there are no more.
+
+    """
+    if data.empty or (start is None and end is None and limit is None):
+        return data, None
+
+    index = pd.DatetimeIndex(data.index)
+    first, last = range_positions(index, start, end)
+
+    if limit is None or last - first <= limit:
+        return data.iloc[first:last], None
+
+    return data.iloc[first : first + limit], to_datetimes(index[first + limit : first + limit + 1])[0].isoformat()
 
 
-async def fetch_asset_price_history(
+async def fetch_asset_price_history(  # noqa: PLR0913
     ticker: str,
     period: Period,
     interval: Interval,
+    max_points: int | None = None,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
 ) -> AssetPriceHistory | Error:
     """Fetch asset price history for a given ticker symbol.
 
+    Bars are kept in the local price store, so later requests only download
+    the bars after the last stored one, and in memory until they stop being
+    fresh, so repeated requests do not download anything. Concurrent identical
+    requests share a single download, and downloads run off the event loop.
+    Unknown tickers and empty histories are remembered for a short time.
+
+    Explicit time ranges are requested from the provider on their own, unless
+    the bars in memory cover them. Long histories can be paged through with a
+    limit, passing the cursor of each page to get the next one.
+
+    Args:
+        ticker: The ticker symbol of the stock to get historical prices for, e.g., "AAPL".
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+        max_points: The maximum number of bars, aggregated from consecutive bars (default all).
+        start: The timestamp of the first bar. If given, only this range is loaded instead of the period.
+        end: The timestamp the bars end before (default the latest bar).
+        limit: The maximum number of bars of a page (default all).
+        cursor: The cursor of a previous page to continue from.
+
+    Returns:
+        The historical asset prices. If no data is found, an error is returned.
+    """
+    return await _fetch_price_history(
+        ticker,
+        period,
+        interval,
+        build_asset_price_history,
+        max_points=max_points,
+        start=start,
+        end=end,
+        limit=limit,
+        cursor=cursor,
+    )
+
+
+async def fetch_columnar_asset_price_history(  # noqa: PLR0913
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    max_points: int | None = None,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> ColumnarAssetPriceHistory | Error:
+    """Fetch asset price history for a given ticker symbol as parallel arrays.
+
+    The bars are loaded like in `fetch_asset_price_history`.
+
     Args:
         ticker: The ticker symbol of the stock to get historical prices for, e.g., "AAPL".
         period: The time period for which to fetch historical data.
         interval: The interval between data points.
+        max_points: The maximum number of bars, aggregated from consecutive bars (default all).
+        start: The timestamp of the first bar. If given, only this range is loaded instead of the period.
+        end: The timestamp the bars end before (default the latest bar).
+        limit: The maximum number of bars of a page (default all).
+        cursor: The cursor of a previous page to continue from.
 
     Returns:
         The historical asset prices. If no data is found, an error is returned.
     """
+    return await _fetch_price_history(
+        ticker,
+        period,
+        interval,
+        build_columnar_asset_price_history,
+        max_points=max_points,
+        start=start,
+        end=end,
+        limit=limit,
+        cursor=cursor,
+    )
+
+
+async def fetch_price_history(ticker: str, period: Period, interval: Interval) -> PriceHistory | Error:
+    """Fetch the price bars of a ticker for computing indicators.
+
+    The bars are loaded like in `fetch_asset_price_history`, but kept in a data
+    frame instead of converted into models, so indicators read their columns
+    directly and only their own results are converted.
+
+    Args:
+        ticker: The ticker symbol of the stock to get historical prices for, e.g., "AAPL".
+        period: The time period for which to fetch historical data.
+        interval: The interval between data points.
+
+    Returns:
+        The price bars. If no data is found, an error is returned.
+    """
+    return await _fetch_price_history(
+        ticker,
+        period,
+        interval,
+        build_price_history,
+        max_points=None,
+        start=None,
+        end=None,
+        limit=None,
+        cursor=None,
+    )
+
+
+async def _fetch_price_history[T](  # noqa: PLR0913
+    ticker: str,
+    period: Period,
+    interval: Interval,
+    build: Callable[[str, Period, Interval, pd.DataFrame, str | None], T | Error],
+    *,
+    max_points: int | None,
+    start: datetime | None,
+    end: datetime | None,
+    limit: int | None,
+    cursor: str | None,
+) -> T | Error:
+    """Load the price bars of a period or time range and convert a page of them.
+
+    Args:
+        ticker: The ticker symbol.
+        period: The time period to load if there is no start.
+        interval: The interval between bars.
+        build: The conversion of the bars into the response.
+        max_points: The maximum number of bars, or None to keep them all.
+        start: The timestamp of the first bar, or None for the whole period.
+        end: The timestamp the bars end before, or None up to the latest bar.
+        limit: The maximum number of bars of a page, or None for every bar.
+        cursor: The cursor of a previous page to continue from, if any.
+
+    Returns:
+        The converted bars. If no data is found, an error is returned.
+    """
+    if max_points is not None and max_points <= 0:
+        return Error(what=f"Max points must be positive, got: {max_points}")
+
+    try:
+        first, end = _resolve_range(start, end, limit, cursor)
+    except ValueError as e:
+        return Error(what=str(e))
+
+    symbol = ticker.strip().upper()
+    whole_period = first is None and end is None and limit is None
+    error = find_error(symbol, period, interval) if whole_period else None
+
+    if error is not None:
+        return error
+
     try:
-        information = yf.Ticker(ticker)
-        data = information.history(period=period, interval=interval)
-        prices = []
-
-        if data.empty:
-            return Error(what=f"No historical data found for ticker: {ticker}")
-
-        for index, row in data.iterrows():
-            price = Price(
-                date=datetime.fromisoformat(str(index)),
-                open=float(row["Open"]),
-                high=float(row["High"]),
-                low=float(row["Low"]),
-                close=float(row["Close"]),
-                volume=int(row["Volume"]),
-                dividends=float(row["Dividends"]),
-                stock_splits=float(row["Stock Splits"]),
-            )
-
-            prices.append(price)
-
-        return AssetPriceHistory(ticker=ticker, period=period, interval=interval, prices=prices)
-    except (ValueError, TypeError, KeyError) as e:
+        if start is None or first is None:
+            data = await load_cached_price_bars(ticker, period, interval)
+        else:
+            data = await load_price_range(ticker, first, end, interval)
+
+        data, next_cursor = select_page(data, first, end, limit)
+        result = build(
+            ticker,
+            period,
+            interval,
+            data if max_points is None else downsample_bars(data, max_points),
+            next_cursor,
+        )
+    except (ValueError, TypeError, KeyError, sqlite3.Error) as e:
         return Error(what=f"Error fetching historical data for ticker {ticker}: {e}")
+
+    if isinstance(result, Error) and whole_period:
+        remember_error(result, symbol, period, interval)
+
+    return result
+
+
+def _resolve_range(
+    start: datetime | None,
+    end: datetime | None,
+    limit: int | None,
+    cursor: str | None,
+) -> tuple[datetime | None, datetime | None]:
+    """Resolve the time range of a page of bars.
+
+    Timestamps without a timezone are taken as UTC.
+
+    Args:
+        start: The timestamp of the first bar, if any.
+        end: The timestamp the bars end before, if any.
+        limit: The maximum number of bars of a page, if any.
+        cursor: The cursor of a previous page, which replaces the start, if any.
+
+    Returns:
+        The timezone-aware timestamp of the first bar and the one the bars end
+        before, each None if unbounded.
+
+    Raises:
+        ValueError: If the limit is not positive, the cursor is invalid, or the
+            range is empty.
+
+    """
+    if limit is not None and limit <= 0:
+        message = f"Limit must be positive, got: {limit}"
+        raise ValueError(message)
+
+    if cursor is not None:
+        try:
+            start = datetime.fromisoformat(cursor)
+        except ValueError:
+            message = f"Invalid cursor: {cursor}"
+            raise ValueError(message) from None
+
+    first = start if start is None or start.tzinfo is not None else start.replace(tzinfo=UTC)
+    end = end if end is None or end.tzinfo is not None else end.replace(tzinfo=UTC)
+
+    if first is not None and end is not None and first >= end:
+        message = f"The start {first.isoformat()} must be before the end {end.isoformat()}."
+        raise ValueError(message)
+
+    return first, end
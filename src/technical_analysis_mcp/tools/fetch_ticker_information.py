@@ -1,16 +1,37 @@
 """Ticker information tools."""
 
-import yfinance as yf
+import time
 
+from technical_analysis_mcp.cache import (
+    SingleFlight,
+    find_error,
+    get_market_information_cache,
+    get_static_information_cache,
+    remember_error,
+    split_information,
+)
+from technical_analysis_mcp.helpers import run_blocking
 from technical_analysis_mcp.models import (
     Error,
     TickerInformation,
     parse_yfinance_ticker_information,
 )
+from technical_analysis_mcp.providers import get_provider
+from technical_analysis_mcp.settings import get_settings
 
+# Information payloads can be missing for tickers that still have prices, so
+# their errors are remembered for this tool only, not for the ticker as a whole.
+_INFORMATION_SCOPE = "information"
 
-async def fetch_ticker_information(ticker: str) -> TickerInformation | Error:
-    """Fetch comprehensive ticker information.
+_IN_FLIGHT: SingleFlight[str, TickerInformation | Error] = SingleFlight()
+
+
+def download_ticker_information(ticker: str) -> TickerInformation | Error:
+    """Get the ticker information, downloading it from the data provider if not fresh in memory.
+
+    Static fields, e.g. names or sector, and market fields, e.g. price or volume,
+    expire separately. A single information payload is downloaded when either
+    expires, and it also tells whether the ticker exists.
 
     Args:
         ticker: The ticker symbol (e.g., 'AAPL', 'MSFT', 'GOOGL')
@@ -19,15 +40,54 @@ async def fetch_ticker_information(ticker: str) -> TickerInformation | Error:
         The ticker basic information in a structured format.
 
     """
+    settings = get_settings()
+    symbol = ticker.strip().upper()
+    static_cache = get_static_information_cache()
+    market_cache = get_market_information_cache()
+    static = static_cache.get(symbol)
+    market = market_cache.get(symbol)
+
     try:
-        information = yf.Ticker(ticker)
-        isin = information.get_isin()
+        if static is None or market is None:
+            info = get_provider().information(ticker)
+
+            if not info.get("symbol") or info.get("quoteType") == "NONE":
+                error = Error(what=f"Company ticker {ticker} not found.")
+                remember_error(error, symbol, _INFORMATION_SCOPE)
+                return error
+
+            downloaded_static, market = split_information(info)
+            now = time.time()
+            market_cache.put(symbol, market, now + settings.market_information_ttl)
 
-        if (isin is None) or (isin == "-"):
-            return Error(what=f"Company ticker {ticker} not found.")
+            if static is None:
+                static = downloaded_static
+                static_cache.put(symbol, static, now + settings.static_information_ttl)
 
-        result = parse_yfinance_ticker_information(information.info)
+        result = parse_yfinance_ticker_information(static | market)
     except (ValueError, TypeError) as e:
         return Error(what=f"Error: getting stock information for {ticker}: {e}")
 
     return result
+
+
+async def fetch_ticker_information(ticker: str) -> TickerInformation | Error:
+    """Fetch comprehensive ticker information.
+
+    The download runs in the I/O thread pool, and concurrent requests for the
+    same ticker share it. Unknown tickers are remembered for a short time.
+
+    Args:
+        ticker: The ticker symbol (e.g., 'AAPL', 'MSFT', 'GOOGL')
+
+    Returns:
+        The ticker basic information in a structured format.
+
+    """
+    symbol = ticker.strip().upper()
+    error = find_error(symbol, _INFORMATION_SCOPE)
+
+    if error is not None:
+        return error
+
+    return await _IN_FLIGHT.run(symbol, lambda: run_blocking(download_ticker_information, ticker))
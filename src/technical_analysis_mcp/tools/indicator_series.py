@@ -0,0 +1,87 @@
+"""Validation and layout shared by the indicator tools."""
+
+from datetime import datetime
+
+from technical_analysis_mcp.models import (
+    CompactTimeSeries,
+    DataPoint,
+    Error,
+    SeriesFormat,
+    TimeSeries,
+    build_compact_time_series,
+)
+
+# Doubles hold 15 to 17 significant digits, so more decimals only add noise.
+MAX_DECIMALS = 15
+
+
+def validate_lengths(name: str, lengths: int | list[int], max_points: int | None) -> Error | None:
+    """Validate the length of an indicator, or the lengths of a sweep.
+
+    Args:
+        name: The name of the length, e.g. "SMA window".
+        lengths: The length, or the lengths of a sweep.
+        max_points: The maximum number of values, which a sweep does not support.
+
+    Returns:
+        An error if any length is not positive, otherwise None.
+    """
+    if isinstance(lengths, int):
+        lengths = [lengths]
+    elif not lengths:
+        return Error(what=f"At least one {name} is required.")
+    elif max_points is not None:
+        return Error(what=f"Max points is not supported for a list of {name}s.")
+
+    for length in lengths:
+        if length <= 0:
+            return Error(what=f"{name} must be positive, got: {length}")
+
+    return None
+
+
+def validate_series_options(decimals: int, max_points: int | None) -> Error | None:
+    """Validate the options shared by the indicator series.
+
+    Args:
+        decimals: The number of decimal places of the values in the compact layout.
+        max_points: The maximum number of values, or None to keep them all.
+
+    Returns:
+        An error if any option is out of range, otherwise None.
+    """
+    if not 0 <= decimals <= MAX_DECIMALS:
+        return Error(what=f"Decimals must be between 0 and {MAX_DECIMALS}, got: {decimals}")
+
+    if max_points is not None and max_points <= 0:
+        return Error(what=f"Max points must be positive, got: {max_points}")
+
+    return None
+
+
+def build_indicator_series(
+    ticker: str,
+    dates: list[datetime],
+    values: list[float],
+    format: SeriesFormat,  # noqa: A002
+    decimals: int,
+) -> TimeSeries | CompactTimeSeries:
+    """Build the response of an indicator series in the requested layout.
+
+    Args:
+        ticker: The ticker symbol.
+        dates: The timezone-aware timestamps, in chronological order.
+        values: The values, one per timestamp.
+        format: The layout of the series, a list of dated values or compact arrays.
+        decimals: The number of decimal places of the values in the compact layout.
+
+    Returns:
+        The indicator series.
+    """
+    if format == "compact":
+        return build_compact_time_series(ticker, dates, values, decimals)
+
+    return TimeSeries(
+        ticker=ticker,
+        data_points=[DataPoint(date=date, value=value) for date, value in zip(dates, values, strict=True)],
+    )
@@ -0,0 +1,49 @@
+"""Test the in-memory cache of indicator states."""
+
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+from hamcrest import assert_that, equal_to, is_, not_, not_none
+
+from technical_analysis_mcp.cache import get_indicator_state_cache, history_fingerprint, stream_indicator
+from technical_analysis_mcp.indicators import start_sma
+
+
+def test_given_repeated_request_when_stream_indicator_then_continues_from_cached_state() -> None:
+    """Test that a refresh with new bars continues from the state kept in memory."""
+    timestamps = pd.date_range(datetime(2024, 3, 15, 13, 30, tzinfo=UTC), periods=10, freq="5min").asi8
+    prices = np.arange(10.0)
+    start_mock = Mock(side_effect=lambda values: start_sma(values, 3))
+    key = ("sma", "AAPL", "1d", "5m", "close", "3")
+
+    stream_indicator(key, timestamps[:6], prices[:6], start_mock)
+    values = stream_indicator(key, timestamps, prices, start_mock)
+
+    start_mock.assert_called_once()
+    assert_that(values.tolist(), equal_to([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]))
+    assert_that(get_indicator_state_cache().get(key), not_none())
+
+
+def test_given_changed_last_bar_when_history_fingerprint_then_changes() -> None:
+    """Test that the fingerprint tells apart histories whose last bar changed."""
+    index = pd.date_range(datetime(2024, 3, 15, 13, 30, tzinfo=UTC), periods=3, freq="5min", name="Date")
+    bars = pd.DataFrame(
+        {
+            "Open": [100.0] * 3,
+            "High": [100.0] * 3,
+            "Low": [100.0] * 3,
+            "Close": [100.0] * 3,
+            "Volume": [1000] * 3,
+            "Dividends": [0.0] * 3,
+            "Stock Splits": [0.0] * 3,
+        },
+        index=index,
+    )
+    same = bars.copy()
+    changed = bars.copy()
+    changed.loc[index[-1], "Close"] = 101.0
+
+    assert_that(history_fingerprint(same), equal_to(history_fingerprint(bars)))
+    assert_that(history_fingerprint(changed), is_(not_(equal_to(history_fingerprint(bars)))))
@@ -0,0 +1,27 @@
+"""Test the in-memory cache of requests known to fail."""
+
+from hamcrest import assert_that, equal_to, is_, none
+
+from technical_analysis_mcp.cache import find_error, get_negative_cache, remember_error
+from technical_analysis_mcp.models import Error
+
+
+def test_given_remembered_error_when_find_error_then_counts_one_hit_per_lookup() -> None:
+    """Test that every lookup of a remembered error counts as a single hit."""
+    error = Error(what="Company ticker UNKNOWN not found.")
+    remember_error(error, "UNKNOWN", "information")
+
+    for _ in range(10):
+        assert_that(find_error("UNKNOWN", "information"), equal_to(error))
+
+    assert_that(get_negative_cache().hits, equal_to(10))
+    assert_that(get_negative_cache().misses, equal_to(0))
+
+
+def test_given_scoped_error_when_find_error_with_other_scope_then_returns_none() -> None:
+    """Test that an error of a request does not apply to other requests for the same ticker."""
+    remember_error(Error(what="No historical data found for ticker: AAPL"), "AAPL", "1d", "1m")
+
+    assert_that(find_error("AAPL", "1d", "1m"), equal_to(Error(what="No historical data found for ticker: AAPL")))
+    assert_that(find_error("AAPL", "1mo", "1d"), is_(none()))
+    assert_that(find_error("AAPL"), is_(none()))
@@ -0,0 +1,88 @@
+"""Test the resolution of time periods over price bars."""
+
+from datetime import UTC, datetime
+
+import pandas as pd
+from hamcrest import assert_that, equal_to, is_
+
+from technical_analysis_mcp.cache import period_covers, period_start_position, range_positions
+
+NOW = datetime(2024, 3, 15, 18, 0, tzinfo=UTC)
+
+
+def _daily_index(start: str, end: str) -> pd.DatetimeIndex:
+    """Build an index of daily bars on business days."""
+    return pd.bdate_range(start, end, tz="America/New_York")
+
+
+def test_given_longer_period_when_period_covers_then_returns_true() -> None:
+    """Test that a longer period covers a shorter one."""
+    assert_that(period_covers("max", "1mo"), is_(True))
+    assert_that(period_covers("1y", "1y"), is_(True))
+    assert_that(period_covers("1y", "ytd"), is_(True))
+
+
+def test_given_shorter_or_incomparable_period_when_period_covers_then_returns_false() -> None:
+    """Test that a shorter or incomparable period does not cover another one."""
+    assert_that(period_covers("1mo", "1y"), is_(False))
+    assert_that(period_covers("6mo", "ytd"), is_(False))
+    assert_that(period_covers("ytd", "5d"), is_(False))
+
+
+def test_given_max_period_when_period_start_position_then_returns_zero() -> None:
+    """Test that the max period starts at the first bar."""
+    index = _daily_index("2024-01-01", "2024-03-15")
+
+    assert_that(period_start_position(index, "max", NOW), equal_to(0))
+
+
+def test_given_day_period_when_period_start_position_then_counts_sessions() -> None:
+    """Test that day periods count trading sessions, skipping weekends."""
+    index = _daily_index("2024-01-01", "2024-03-15")
+
+    position = period_start_position(index, "5d", NOW)
+
+    assert_that(index[position], equal_to(pd.Timestamp("2024-03-11", tz="America/New_York")))
+
+
+def test_given_intraday_bars_when_period_start_position_then_returns_first_bar_of_session() -> None:
+    """Test that a one day period starts at the first bar of the last session."""
+    index = pd.DatetimeIndex(
+        pd.date_range("2024-03-14 09:30", "2024-03-14 15:59", freq="1min", tz="America/New_York").union(
+            pd.date_range("2024-03-15 09:30", "2024-03-15 12:00", freq="1min", tz="America/New_York"),
+        ),
+    )
+
+    position = period_start_position(index, "1d", NOW)
+
+    assert_that(index[position], equal_to(pd.Timestamp("2024-03-15 09:30", tz="America/New_York")))
+
+
+def test_given_calendar_periods_when_period_start_position_then_returns_first_bar_after_offset() -> None:
+    """Test that month and year-to-date periods are calendar offsets."""
+    index = _daily_index("2023-06-01", "2024-03-15")
+
+    assert_that(
+        index[period_start_position(index, "1mo", NOW)], equal_to(pd.Timestamp("2024-02-15", tz="America/New_York"))
+    )
+    assert_that(
+        index[period_start_position(index, "ytd", NOW)], equal_to(pd.Timestamp("2024-01-01", tz="America/New_York"))
+    )
+
+
+def test_given_period_longer_than_bars_when_period_start_position_then_returns_zero() -> None:
+    """Test that a period longer than the bars starts at the first bar."""
+    index = _daily_index("2024-03-01", "2024-03-15")
+
+    assert_that(period_start_position(index, "1y", NOW), equal_to(0))
+
+
+def test_given_time_range_when_range_positions_then_returns_bars_from_start_before_end() -> None:
+    """Test that a range includes the bar at its start and excludes the one at its end."""
+    index = _daily_index("2024-03-01", "2024-03-15")
+
+    first, last = range_positions(index, index.to_list()[2], index.to_list()[5])
+
+    assert_that((first, last), equal_to((2, 5)))
+    assert_that(range_positions(index, None, None), equal_to((0, len(index))))
+    assert_that(range_positions(index, NOW, None), equal_to((len(index), len(index))))
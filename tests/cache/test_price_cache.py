@@ -0,0 +1,115 @@
+"""Test the in-memory cache of price bars."""
+
+from datetime import UTC, datetime, timedelta
+
+import pandas as pd
+from hamcrest import assert_that, equal_to, is_, none, not_none
+
+from technical_analysis_mcp.cache import (
+    find_price_bars,
+    find_price_range,
+    get_price_cache,
+    price_expiry,
+    remember_price_bars,
+)
+
+
+def test_given_minute_interval_when_price_expiry_then_expires_in_seconds() -> None:
+    """Test that minute bars expire after a few seconds."""
+    now = datetime(2024, 3, 15, 15, 0, tzinfo=UTC)
+
+    assert_that(price_expiry("1m", now), equal_to(now + timedelta(seconds=5)))
+
+
+def test_given_hour_interval_when_price_expiry_then_expires_in_minutes() -> None:
+    """Test that hourly bars expire after a few minutes."""
+    now = datetime(2024, 3, 15, 15, 0, tzinfo=UTC)
+
+    assert_that(price_expiry("1h", now), equal_to(now + timedelta(minutes=5)))
+
+
+def test_given_daily_interval_during_session_when_price_expiry_then_expires_at_session_close() -> None:
+    """Test that daily bars expire at the close of the current session."""
+    now = datetime(2024, 3, 14, 15, 0, tzinfo=UTC)
+
+    assert_that(price_expiry("1d", now), equal_to(datetime(2024, 3, 14, 21, 0, tzinfo=UTC)))
+
+
+def test_given_weekly_interval_after_friday_close_when_price_expiry_then_expires_at_monday_close() -> None:
+    """Test that bars fetched after the last close of the week expire on Monday."""
+    now = datetime(2024, 3, 15, 22, 0, tzinfo=UTC)
+
+    assert_that(price_expiry("1wk", now), equal_to(datetime(2024, 3, 18, 21, 0, tzinfo=UTC)))
+
+
+def test_given_cached_longer_period_when_find_price_bars_then_slices_shorter_period() -> None:
+    """Test that a shorter period is served from the bars of a longer one."""
+    now = datetime.now(UTC)
+    index = pd.bdate_range(end=now.date(), periods=300, tz="America/New_York", name="Date")
+    bars = pd.DataFrame({"Close": range(300)}, index=index)
+
+    remember_price_bars("AAPL", "5y", "1d", bars, now)
+    sliced = find_price_bars("AAPL", "5d", "1d", now)
+
+    assert_that(sliced, is_(not_none()))
+    assert_that(sliced.index.to_list() if sliced is not None else [], equal_to(index[-5:].to_list()))
+    assert_that(find_price_bars("AAPL", "max", "1d", now), is_(none()))
+    assert_that(find_price_bars("AAPL", "5d", "5m", now), is_(none()))
+
+
+def test_given_cached_daily_bars_when_find_weekly_price_bars_then_aggregates_daily_bars() -> None:
+    """Test that a coarser interval is aggregated from cached finer bars."""
+    now = datetime.now(UTC)
+    index = pd.bdate_range(end=now.date(), periods=300, tz="America/New_York", name="Date")
+    bars = pd.DataFrame(
+        {
+            "Open": 1.0,
+            "High": 1.0,
+            "Low": 1.0,
+            "Close": 1.0,
+            "Volume": [10] * 300,
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=index,
+    )
+
+    remember_price_bars("AAPL", "2y", "1d", bars, now)
+    weekly = find_price_bars("AAPL", "1y", "1wk", now)
+
+    assert_that(weekly, is_(not_none()))
+
+    if weekly is not None:
+        assert_that(weekly.index.to_list()[-2].weekday(), equal_to(0))
+        assert_that(weekly["Volume"].iloc[-2], equal_to(50))
+
+
+def test_given_fallback_lookup_when_find_price_bars_then_counts_single_hit_or_miss() -> None:
+    """Test that probing finer intervals counts as one lookup of the cache."""
+    now = datetime.now(UTC)
+    index = pd.bdate_range(end=now.date(), periods=30, tz="America/New_York", name="Date")
+    bars = pd.DataFrame(
+        {"Open": 1.0, "High": 1.0, "Low": 1.0, "Close": 1.0, "Volume": 10, "Dividends": 0.0, "Stock Splits": 0.0},
+        index=index,
+    )
+
+    remember_price_bars("AAPL", "1mo", "1d", bars, now)
+    find_price_bars("AAPL", "1mo", "1wk", now)
+    find_price_bars("MSFT", "1mo", "1wk", now)
+
+    assert_that((get_price_cache().hits, get_price_cache().misses), equal_to((1, 1)))
+
+
+def test_given_cached_bars_when_find_price_range_then_slices_covered_ranges_only() -> None:
+    """Test that a range is served from cached bars only if they reach back to its start."""
+    now = datetime.now(UTC)
+    index = pd.bdate_range(end=now.date(), periods=20, tz="America/New_York", name="Date")
+    bars = pd.DataFrame({"Close": range(20)}, index=index)
+
+    remember_price_bars("AAPL", "1mo", "1d", bars, now)
+    covered = find_price_range("AAPL", "1d", index.to_list()[10], index.to_list()[15])
+
+    assert_that(covered, is_(not_none()))
+    assert_that(covered["Close"].tolist() if covered is not None else [], equal_to([10, 11, 12, 13, 14]))
+    assert_that(find_price_range("AAPL", "1d", index.to_list()[0] - timedelta(days=7), None), is_(none()))
+    assert_that(find_price_range("AAPL", "5m", index.to_list()[10], None), is_(none()))
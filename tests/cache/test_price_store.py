@@ -0,0 +1,72 @@
+"""Test the persistent local store of price bars."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pandas as pd
+from hamcrest import assert_that, equal_to, is_, none
+
+from technical_analysis_mcp.cache import PRICE_COLUMNS, PriceStore
+
+
+def _business_days(start: str, count: int) -> pd.DatetimeIndex:
+    """Build the timestamps of consecutive business days in New York."""
+    return pd.bdate_range(start, periods=count, tz="America/New_York", name="Date")
+
+
+def test_given_unknown_ticker_when_load_then_returns_none(tmp_path: Path) -> None:
+    """Test loading a ticker that was never stored."""
+    store = PriceStore(tmp_path / "prices.sqlite3")
+
+    assert_that(store.load("AAPL", "1d"), is_(none()))
+
+
+def test_given_saved_bars_when_load_then_returns_same_bars(
+    tmp_path: Path, make_bars: Callable[..., pd.DataFrame]
+) -> None:
+    """Test that saved bars round-trip through the store, timezone included."""
+    store = PriceStore(tmp_path / "prices.sqlite3")
+    bars = make_bars(_business_days("2024-01-01", 3), [100.0, 101.0, 102.0])
+
+    store.save("AAPL", "1d", "1mo", bars)
+    stored = store.load("AAPL", "1d")
+
+    assert_that(stored is not None, is_(True))
+
+    if stored is not None:
+        assert_that(stored.period, equal_to("1mo"))
+        pd.testing.assert_frame_equal(stored.bars, bars[PRICE_COLUMNS], check_freq=False, check_dtype=False)
+
+
+def test_given_saved_bars_when_save_again_then_replaces_series(
+    tmp_path: Path, make_bars: Callable[..., pd.DataFrame]
+) -> None:
+    """Test that saving a period replaces every stored bar."""
+    store = PriceStore(tmp_path / "prices.sqlite3")
+
+    store.save("AAPL", "1d", "1y", make_bars(_business_days("2024-01-01", 3), [100.0, 101.0, 102.0]))
+    store.save("AAPL", "1d", "5d", make_bars(_business_days("2024-02-01", 1), [200.0]))
+    stored = store.load("AAPL", "1d")
+
+    assert_that(stored is not None, is_(True))
+
+    if stored is not None:
+        assert_that(stored.period, equal_to("5d"))
+        assert_that(stored.bars["Close"].tolist(), equal_to([200.0]))
+
+
+def test_given_saved_bars_when_update_then_replaces_tail(
+    tmp_path: Path, make_bars: Callable[..., pd.DataFrame]
+) -> None:
+    """Test that an update replaces the bars from its first timestamp onwards."""
+    store = PriceStore(tmp_path / "prices.sqlite3")
+    store.save("AAPL", "1d", "1mo", make_bars(_business_days("2024-01-01", 3), [100.0, 101.0, 102.0]))
+
+    store.update("AAPL", "1d", make_bars(_business_days("2024-01-02", 3), [101.0, 105.0, 106.0]))
+    stored = store.load("AAPL", "1d")
+
+    assert_that(stored is not None, is_(True))
+
+    if stored is not None:
+        assert_that(stored.period, equal_to("1mo"))
+        assert_that(stored.bars["Close"].tolist(), equal_to([100.0, 101.0, 105.0, 106.0]))
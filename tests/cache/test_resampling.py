@@ -0,0 +1,131 @@
+"""Test the aggregation of price bars into coarser intervals."""
+
+from collections.abc import Callable
+
+import pandas as pd
+import pytest
+from hamcrest import assert_that, calling, equal_to, is_, raises, same_instance
+
+from technical_analysis_mcp.cache import downsample_bars, resample_bars
+
+
+@pytest.fixture
+def rising_bars(make_bars: Callable[..., pd.DataFrame]) -> Callable[[pd.DatetimeIndex], pd.DataFrame]:
+    """Build bars whose prices grow by one per bar."""
+
+    def make(index: pd.DatetimeIndex) -> pd.DataFrame:
+        prices = [1.0 + i for i in range(len(index))]
+
+        return make_bars(
+            index,
+            [price + 0.25 for price in prices],
+            opens=prices,
+            highs=[price + 0.5 for price in prices],
+            lows=[price - 0.5 for price in prices],
+            volumes=[10] * len(index),
+        )
+
+    return make
+
+
+def test_given_daily_bars_when_resample_weekly_then_aggregates_calendar_weeks(
+    rising_bars: Callable[[pd.DatetimeIndex], pd.DataFrame],
+) -> None:
+    """Test that weekly bars span Monday to Friday and aggregate prices and volume."""
+    index = pd.bdate_range("2024-03-06", "2024-03-19", tz="America/New_York", name="Date")
+    bars = rising_bars(index)
+    bars.loc[index[4], "Dividends"] = 0.5
+    bars.loc[index[5], "Stock Splits"] = 2.0
+
+    weekly = resample_bars(bars, "1wk")
+
+    assert_that(weekly.index.to_list(), equal_to([index[0], index[3], index[8]]))
+    assert_that(weekly["Open"].tolist(), equal_to([1.0, 4.0, 9.0]))
+    assert_that(weekly["High"].tolist(), equal_to([3.5, 8.5, 10.5]))
+    assert_that(weekly["Low"].tolist(), equal_to([0.5, 3.5, 8.5]))
+    assert_that(weekly["Close"].tolist(), equal_to([3.25, 8.25, 10.25]))
+    assert_that(weekly["Volume"].tolist(), equal_to([30, 50, 20]))
+    assert_that(weekly["Dividends"].tolist(), equal_to([0.0, 0.5, 0.0]))
+    assert_that(weekly["Stock Splits"].tolist(), equal_to([0.0, 2.0, 0.0]))
+
+
+def test_given_five_minute_bars_when_resample_hourly_then_aligns_to_session_open(
+    rising_bars: Callable[[pd.DatetimeIndex], pd.DataFrame],
+) -> None:
+    """Test that hourly bars start at the first bar of each session."""
+    first = pd.date_range("2024-03-14 09:30", "2024-03-14 15:55", freq="5min", tz="America/New_York")
+    second = pd.date_range("2024-03-15 09:30", "2024-03-15 15:55", freq="5min", tz="America/New_York")
+    index = pd.DatetimeIndex(first.append(second))
+
+    hourly = resample_bars(rising_bars(index), "1h")
+
+    assert_that(len(hourly), equal_to(14))
+    assert_that(hourly.index[1], equal_to(pd.Timestamp("2024-03-14 10:30", tz="America/New_York")))
+    assert_that(hourly.index[7], equal_to(pd.Timestamp("2024-03-15 09:30", tz="America/New_York")))
+    assert_that(hourly["Volume"].tolist()[:7], equal_to([120] * 6 + [60]))
+
+
+def test_given_daily_bars_when_resample_monthly_then_aggregates_calendar_months(
+    rising_bars: Callable[[pd.DatetimeIndex], pd.DataFrame],
+) -> None:
+    """Test that monthly and quarterly bars follow calendar boundaries."""
+    index = pd.bdate_range("2024-01-01", "2024-04-30", tz="America/New_York", name="Date")
+
+    monthly = resample_bars(rising_bars(index), "1mo")
+    quarterly = resample_bars(rising_bars(index), "3mo")
+
+    assert_that([timestamp.month for timestamp in monthly.index], equal_to([1, 2, 3, 4]))
+    assert_that([timestamp.month for timestamp in quarterly.index], equal_to([1, 4]))
+
+
+def test_given_interval_without_sources_when_resample_then_raises_value_error(
+    rising_bars: Callable[[pd.DatetimeIndex], pd.DataFrame],
+) -> None:
+    """Test that intervals which cannot be aggregated are rejected."""
+    bars = rising_bars(pd.bdate_range("2024-03-11", periods=5, tz="America/New_York"))
+
+    assert_that(calling(resample_bars).with_args(bars, "1d"), raises(ValueError))
+
+
+def test_given_daily_bars_when_resample_then_keeps_total_volume(
+    rising_bars: Callable[[pd.DatetimeIndex], pd.DataFrame],
+) -> None:
+    """Test that aggregation neither drops nor duplicates bars."""
+    bars = rising_bars(pd.bdate_range("2023-01-02", "2024-03-15", tz="America/New_York"))
+    resampled = [
+        resample_bars(bars, "5d"),
+        resample_bars(bars, "1wk"),
+        resample_bars(bars, "1mo"),
+        resample_bars(bars, "3mo"),
+    ]
+
+    for frame in resampled:
+        assert_that(int(frame["Volume"].sum()), equal_to(int(bars["Volume"].sum())))
+
+
+def test_given_long_bars_when_downsample_bars_then_keeps_extremes_and_totals(
+    rising_bars: Callable[[pd.DatetimeIndex], pd.DataFrame],
+) -> None:
+    """Test that downsampled bars keep the highest high, lowest low and total volume."""
+    index = pd.bdate_range("2024-01-01", periods=100, tz="America/New_York", name="Date")
+    bars = rising_bars(index)
+    bars.loc[index[42], "High"] = 500.0
+
+    downsampled = downsample_bars(bars, 7)
+
+    assert_that(len(downsampled), equal_to(7))
+    assert_that(downsampled.index[0], equal_to(index[0]))
+    assert_that(downsampled["Open"].iloc[0], equal_to(1.0))
+    assert_that(downsampled["Close"].iloc[-1], equal_to(100.25))
+    assert_that(downsampled["High"].max(), equal_to(500.0))
+    assert_that(downsampled["Low"].min(), equal_to(0.5))
+    assert_that(downsampled["Volume"].sum(), equal_to(1000))
+
+
+def test_given_short_bars_when_downsample_bars_then_returns_same_bars(
+    rising_bars: Callable[[pd.DatetimeIndex], pd.DataFrame],
+) -> None:
+    """Test that bars not longer than the maximum are kept whole."""
+    bars = rising_bars(pd.bdate_range("2024-01-01", periods=5, tz="America/New_York", name="Date"))
+
+    assert_that(downsample_bars(bars, 5), is_(same_instance(bars)))
@@ -0,0 +1,57 @@
+"""Test the coalescing of concurrent identical requests."""
+
+import asyncio
+
+import pytest
+from hamcrest import assert_that, equal_to
+
+from technical_analysis_mcp.cache import SingleFlight
+
+
+class CountingCall:
+    """Call that counts how many times it started."""
+
+    def __init__(self) -> None:
+        """Start without calls."""
+        self.count = 0
+
+    async def __call__(self) -> int:
+        """Wait a little and return the number of calls so far."""
+        self.count += 1
+        await asyncio.sleep(0.01)
+        return self.count
+
+
+@pytest.mark.asyncio
+async def test_given_concurrent_calls_with_same_key_when_run_then_shares_one_call() -> None:
+    """Test that concurrent calls with the same key run once."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    call = CountingCall()
+
+    results = await asyncio.gather(*(flight.run("AAPL", call) for _ in range(3)))
+
+    assert_that(call.count, equal_to(1))
+    assert_that(results, equal_to([1, 1, 1]))
+
+
+@pytest.mark.asyncio
+async def test_given_concurrent_calls_with_different_keys_when_run_then_runs_each_call() -> None:
+    """Test that calls with different keys are not coalesced."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    call = CountingCall()
+
+    await asyncio.gather(flight.run("AAPL", call), flight.run("MSFT", call))
+
+    assert_that(call.count, equal_to(2))
+
+
+@pytest.mark.asyncio
+async def test_given_finished_call_when_run_again_then_starts_new_call() -> None:
+    """Test that a finished call is not reused."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    call = CountingCall()
+
+    await flight.run("AAPL", call)
+    result = await flight.run("AAPL", call)
+
+    assert_that(result, equal_to(2))
@@ -0,0 +1,92 @@
+"""Test the in-memory cache with expiring entries."""
+
+from hamcrest import assert_that, equal_to, is_, none
+
+from technical_analysis_mcp.cache import TtlCache
+
+
+class FakeClock:
+    """Clock whose time is set by the test."""
+
+    def __init__(self) -> None:
+        """Start the clock at time zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+
+def test_given_fresh_entry_when_get_then_returns_value() -> None:
+    """Test getting an entry before it expires."""
+    cache: TtlCache[str, int] = TtlCache(max_entries=2, clock=FakeClock())
+
+    cache.put("a", 1, expires_at=10.0)
+
+    assert_that(cache.get("a"), equal_to(1))
+
+
+def test_given_expired_entry_when_get_then_returns_none_and_evicts() -> None:
+    """Test that an expired entry is not returned."""
+    clock = FakeClock()
+    cache: TtlCache[str, int] = TtlCache(max_entries=2, clock=clock)
+    cache.put("a", 1, expires_at=10.0)
+
+    clock.now = 10.0
+
+    assert_that(cache.get("a"), is_(none()))
+    assert_that(len(cache), equal_to(0))
+
+
+def test_given_full_cache_when_put_then_evicts_least_recently_used() -> None:
+    """Test that the least recently used entry is evicted first."""
+    cache: TtlCache[str, int] = TtlCache(max_entries=2, clock=FakeClock())
+    cache.put("a", 1, expires_at=10.0)
+    cache.put("b", 2, expires_at=10.0)
+    cache.get("a")
+
+    cache.put("c", 3, expires_at=10.0)
+
+    assert_that(cache.get("a"), equal_to(1))
+    assert_that(cache.get("b"), is_(none()))
+    assert_that(cache.get("c"), equal_to(3))
+
+
+def test_given_entries_when_clear_then_cache_is_empty() -> None:
+    """Test removing every entry."""
+    cache: TtlCache[str, int] = TtlCache(max_entries=2, clock=FakeClock())
+    cache.put("a", 1, expires_at=10.0)
+
+    cache.clear()
+
+    assert_that(cache.get("a"), is_(none()))
+
+
+def test_given_lookups_when_get_then_counts_hits_and_misses() -> None:
+    """Test that fresh entries count as hits, and missing or expired ones as misses."""
+    clock = FakeClock()
+    cache: TtlCache[str, int] = TtlCache(max_entries=2, clock=clock)
+    cache.put("a", 1, expires_at=10.0)
+
+    cache.get("a")
+    cache.get("b")
+    clock.now = 10.0
+    cache.get("a")
+
+    assert_that((cache.hits, cache.misses), equal_to((1, 2)))
+
+    cache.clear()
+
+    assert_that((cache.hits, cache.misses), equal_to((0, 0)))
+
+
+def test_given_uncounted_lookups_when_record_then_counts_once() -> None:
+    """Test that uncounted gets leave the counts to a single recorded lookup."""
+    cache: TtlCache[str, int] = TtlCache(max_entries=2, clock=FakeClock())
+    cache.put("a", 1, expires_at=10.0)
+
+    cache.get("b", count=False)
+    value = cache.get("a", count=False)
+    cache.record(hit=value is not None)
+
+    assert_that((value, cache.hits, cache.misses), equal_to((1, 1, 0)))
@@ -0,0 +1,119 @@
+"""Shared test fixtures."""
+
+from collections.abc import Callable, Iterator, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from technical_analysis_mcp.cache import (
+    get_indicator_result_cache,
+    get_indicator_state_cache,
+    get_market_information_cache,
+    get_negative_cache,
+    get_price_cache,
+    get_price_store,
+    get_static_information_cache,
+)
+from technical_analysis_mcp.models import Interval, Period
+from technical_analysis_mcp.providers import get_provider
+from technical_analysis_mcp.settings import ENVIRONMENT_PREFIX, get_settings
+from technical_analysis_mcp.tools.fetch_asset_price_history import PriceHistory
+
+_FIRST_BAR = datetime(2024, 3, 11, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches() -> Iterator[None]:
+    """Clear the process-wide in-memory caches around each test."""
+    caches = [
+        get_price_cache(),
+        get_negative_cache(),
+        get_static_information_cache(),
+        get_market_information_cache(),
+        get_indicator_state_cache(),
+        get_indicator_result_cache(),
+    ]
+
+    for cache in caches:
+        cache.clear()
+
+    yield
+
+    for cache in caches:
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_data_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Point the data directory, and so the price store, at a temporary directory for each test."""
+    monkeypatch.setenv(ENVIRONMENT_PREFIX + "DATA_DIRECTORY", str(tmp_path / "data"))
+    singletons = [get_settings, get_price_store, get_provider]
+
+    for singleton in singletons:
+        singleton.cache_clear()
+
+    yield
+
+    for singleton in singletons:
+        singleton.cache_clear()
+
+
+def _make_bars(  # noqa: PLR0913
+    index: pd.DatetimeIndex,
+    closes: Sequence[float],
+    *,
+    opens: Sequence[float] | None = None,
+    highs: Sequence[float] | None = None,
+    lows: Sequence[float] | None = None,
+    volumes: Sequence[float] | None = None,
+) -> pd.DataFrame:
+    """Build bars with the columns of the upstream provider."""
+    return pd.DataFrame(
+        {
+            "Open": closes if opens is None else opens,
+            "High": closes if highs is None else highs,
+            "Low": closes if lows is None else lows,
+            "Close": closes,
+            "Volume": [1000] * len(closes) if volumes is None else volumes,
+            "Dividends": [0.0] * len(closes),
+            "Stock Splits": [0.0] * len(closes),
+        },
+        index=index,
+    )
+
+
+@pytest.fixture
+def make_bars() -> Callable[..., pd.DataFrame]:
+    """Build bars from their timestamps and closing prices.
+
+    The opening, highest and lowest prices default to the closing ones, and the
+    volume to 1000 per bar.
+    """
+    return _make_bars
+
+
+@pytest.fixture
+def make_price_history() -> Callable[..., PriceHistory]:
+    """Build the price history of consecutive bars from their closing prices.
+
+    The bars are daily from March 11, 2024 unless another start and frequency are
+    given, and take the same prices as `make_bars`.
+    """
+
+    def make(  # noqa: PLR0913
+        closes: Sequence[float],
+        *,
+        ticker: str = "AAPL",
+        period: Period = "1mo",
+        interval: Interval = "1d",
+        start: datetime = _FIRST_BAR,
+        frequency: str = "D",
+        **prices: Sequence[float],
+    ) -> PriceHistory:
+        index = pd.date_range(start, periods=len(closes), freq=frequency, name="Date")
+
+        return PriceHistory(ticker=ticker, period=period, interval=interval, bars=_make_bars(index, closes, **prices))
+
+    return make
@@ -0,0 +1,23 @@
+"""Test utilities for running blocking work off the event loop."""
+
+import threading
+
+import pytest
+from hamcrest import assert_that, equal_to, starts_with
+
+from technical_analysis_mcp.helpers import run_blocking
+from technical_analysis_mcp.helpers.concurrency import IO_THREAD_NAME_PREFIX
+
+
+def _current_thread_name(suffix: str) -> str:
+    """Get the name of the running thread followed by a suffix."""
+    return threading.current_thread().name + suffix
+
+
+@pytest.mark.asyncio
+async def test_given_blocking_function_when_run_blocking_then_runs_in_io_thread() -> None:
+    """Test that blocking functions run in the I/O thread pool."""
+    result = await run_blocking(_current_thread_name, suffix="!")
+
+    assert_that(result, starts_with(IO_THREAD_NAME_PREFIX))
+    assert_that(result[-1], equal_to("!"))
@@ -0,0 +1,34 @@
+"""Test the bulk conversion of data frame columns into Python values."""
+
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+from hamcrest import assert_that, contains_exactly, equal_to
+
+from technical_analysis_mcp.helpers import to_datetimes
+
+
+def test_given_timestamps_across_dst_when_to_datetimes_then_keeps_offset_of_each() -> None:
+    """Test that each datetime keeps the UTC offset its timestamp had."""
+    index = pd.DatetimeIndex(["2024-03-08 09:30", "2024-03-11 09:30"]).tz_localize("America/New_York")
+
+    datetimes = to_datetimes(index)
+
+    assert_that(
+        datetimes,
+        contains_exactly(
+            datetime(2024, 3, 8, 9, 30, tzinfo=timezone(timedelta(hours=-5))),
+            datetime(2024, 3, 11, 9, 30, tzinfo=timezone(timedelta(hours=-4))),
+        ),
+    )
+    assert_that(
+        [moment.isoformat() for moment in datetimes],
+        equal_to([str(timestamp).replace(" ", "T") for timestamp in index]),
+    )
+
+
+def test_given_naive_timestamps_when_to_datetimes_then_returns_naive_datetimes() -> None:
+    """Test converting timestamps without a timezone."""
+    index = pd.DatetimeIndex(["2024-03-08 09:30:00.000001"])
+
+    assert_that([moment.isoformat() for moment in to_datetimes(index)], contains_exactly("2024-03-08T09:30:00.000001"))
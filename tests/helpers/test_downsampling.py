@@ -0,0 +1,56 @@
+"""Test the reduction of long series to representative points."""
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+from hamcrest import assert_that, equal_to, greater_than, has_items, has_length
+
+from technical_analysis_mcp.helpers import downsample_series, lttb_indices
+
+
+def test_given_short_series_when_lttb_indices_then_keeps_every_point() -> None:
+    """Test that a series not longer than the maximum is kept whole."""
+    indices = lttb_indices([0, 1, 2], [5.0, 1.0, 3.0], 3)
+
+    assert_that(indices.tolist(), equal_to([0, 1, 2]))
+
+
+def test_given_long_series_when_lttb_indices_then_keeps_endpoints_and_extremes() -> None:
+    """Test that the first and last points and the spikes of a series are kept."""
+    values = np.sin(np.linspace(0, 20, 10_000))
+    values[2_500] = 5.0
+    values[7_500] = -5.0
+
+    indices = lttb_indices(np.arange(len(values)), values, 100)
+
+    assert_that(indices, has_length(100))
+    assert_that(int(indices[0]), equal_to(0))
+    assert_that(int(indices[-1]), equal_to(len(values) - 1))
+    assert_that(np.diff(indices).min(), greater_than(0))
+    assert_that(indices.tolist(), has_items(2_500, 7_500))
+
+
+def test_given_two_max_points_when_lttb_indices_then_keeps_endpoints() -> None:
+    """Test that fewer points than a triangle needs keeps the endpoints."""
+    indices = lttb_indices(np.arange(10), np.arange(10.0), 2)
+
+    assert_that(indices.tolist(), equal_to([0, 9]))
+
+
+def test_given_dated_series_when_downsample_series_then_keeps_matching_dates() -> None:
+    """Test that the kept values keep their timestamps."""
+    start = datetime(2024, 3, 15, tzinfo=UTC)
+    dates = [start + timedelta(days=i) for i in range(50)]
+    values = [float(i % 7) for i in range(50)]
+
+    kept_dates, kept_values = downsample_series(dates, values, 10)
+
+    assert_that(kept_dates, has_length(10))
+    assert_that(kept_values, equal_to([values[dates.index(date)] for date in kept_dates]))
+
+
+def test_given_no_max_points_when_downsample_series_then_keeps_every_point() -> None:
+    """Test that no maximum keeps the whole series."""
+    dates = [datetime(2024, 3, 15, tzinfo=UTC)]
+
+    assert_that(downsample_series(dates, [1.0], None), equal_to((dates, [1.0])))
@@ -0,0 +1 @@
+"""Indicators test module."""
@@ -0,0 +1,56 @@
+"""Test the Bollinger Bands."""
+
+import numpy as np
+from hamcrest import assert_that, close_to, contains_exactly, has_length, only_contains
+
+from technical_analysis_mcp.indicators import bollinger_bands
+
+
+def test_should_compute_bands_when_valid_data_given() -> None:
+    """Test the bands as the SMA plus or minus the population standard deviations of each window."""
+    middle, upper, lower, percent_b = bollinger_bands([1.0, 3.0, 5.0, 5.0], 2, 2.0)
+
+    assert_that(middle.tolist(), contains_exactly(close_to(2.0, 1e-9), close_to(4.0, 1e-9), close_to(5.0, 1e-9)))
+    assert_that(upper.tolist(), contains_exactly(close_to(4.0, 1e-9), close_to(6.0, 1e-9), close_to(5.0, 1e-9)))
+    assert_that(lower.tolist(), contains_exactly(close_to(0.0, 1e-9), close_to(2.0, 1e-9), close_to(5.0, 1e-9)))
+    assert_that(percent_b.tolist(), contains_exactly(close_to(0.75, 1e-9), close_to(0.75, 1e-9), close_to(0.5, 1e-9)))
+
+
+def test_should_match_windowed_standard_deviation_when_long_series_given() -> None:
+    """Test that the running sums match the standard deviation of every window to 1e-7 over a long drift."""
+    prices = 100.0 + np.cumsum(np.random.default_rng(1).normal(0.0, 1.0, 20_000))
+    windows = np.lib.stride_tricks.sliding_window_view(prices, 50)
+
+    middle, upper, _, _ = bollinger_bands(prices, 50, 2.0)
+
+    assert_that(float(np.max(np.abs(middle - windows.mean(axis=1)))), close_to(0.0, 1e-7))
+    assert_that(float(np.max(np.abs(upper - middle - 2.0 * windows.std(axis=1)))), close_to(0.0, 1e-7))
+
+
+def test_should_return_empty_bands_when_window_longer_than_series_given() -> None:
+    """Test that there are no bands when there are fewer values than the window."""
+    middle, _, _, _ = bollinger_bands([1.0, 2.0], 3, 2.0)
+
+    assert_that(middle, has_length(0))
+
+
+def test_should_return_flat_bands_when_series_flattens_after_drift() -> None:
+    """Test that windows of a single value after a large drift have no width and a %B of exactly 0.5."""
+    prices = np.concatenate([np.linspace(10.0, 5_000.0, 1_000), np.full(600, 5_000.0)])
+
+    middle, upper, lower, percent_b = bollinger_bands(prices, 20, 2.0)
+
+    assert_that((upper - lower)[-500:].tolist(), only_contains(0.0))
+    assert_that(middle[-500:].tolist(), only_contains(5_000.0))
+    assert_that(percent_b[-500:].tolist(), only_contains(0.5))
+
+
+def test_should_keep_precision_when_small_moves_follow_drift() -> None:
+    """Test the standard deviation of small moves after a large drift against every window sliced."""
+    moves = np.random.default_rng(2).normal(0.0, 0.01, 2_000)
+    prices = np.concatenate([np.linspace(10.0, 5_000.0, 1_000), 5_000.0 + moves])
+    windows = np.lib.stride_tricks.sliding_window_view(prices, 20)
+
+    middle, upper, _, _ = bollinger_bands(prices, 20, 2.0)
+
+    assert_that(float(np.max(np.abs(upper - middle - 2.0 * windows.std(axis=1)))), close_to(0.0, 1e-9))
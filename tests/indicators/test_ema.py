@@ -0,0 +1,38 @@
+"""Test the Exponential Moving Average."""
+
+import numpy as np
+from hamcrest import assert_that, close_to, contains_exactly, has_length
+
+from technical_analysis_mcp.indicators import exponential_moving_average
+
+
+def test_should_compute_ema_when_valid_data_given() -> None:
+    """Test seeding the EMA with the mean of the first window and weighing each new value by 2/(window+1)."""
+    result = exponential_moving_average([1.0, 2.0, 3.0, 4.0, 8.0], 3)
+
+    assert_that(
+        result.tolist(),
+        contains_exactly(
+            close_to(2.0, 1e-9),  # (1+2+3)/3
+            close_to(3.0, 1e-9),  # 2/2 + 4/2
+            close_to(5.5, 1e-9),  # 3/2 + 8/2
+        ),
+    )
+
+
+def test_should_match_recursive_ema_when_long_series_given() -> None:
+    """Test that the vectorized EMA matches the recursive definition to 1e-9."""
+    prices = 100.0 + np.cumsum(np.random.default_rng(3).normal(0.0, 1.0, 2_000))
+    expected = [float(prices[:26].mean())]
+
+    for price in prices[26:].tolist():
+        expected.append(expected[-1] + 2.0 / 27 * (price - expected[-1]))
+
+    result = exponential_moving_average(prices, 26)
+
+    assert_that(float(np.max(np.abs(result - expected))), close_to(0.0, 1e-9))
+
+
+def test_should_return_empty_ema_when_window_longer_than_series_given() -> None:
+    """Test that there is no EMA when there are fewer values than the window."""
+    assert_that(exponential_moving_average([1.0, 2.0], 3), has_length(0))
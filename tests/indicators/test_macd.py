@@ -0,0 +1,27 @@
+"""Test the Moving Average Convergence Divergence."""
+
+import numpy as np
+from hamcrest import assert_that, close_to, equal_to, has_length, is_
+
+from technical_analysis_mcp.indicators import exponential_moving_average, moving_average_convergence_divergence
+
+
+def test_should_compute_macd_from_emas_when_valid_data_given() -> None:
+    """Test that the line, signal line and histogram follow from the EMAs of the values."""
+    prices = 100.0 + np.cumsum(np.random.default_rng(9).normal(0.0, 1.0, 200))
+
+    line, signal, histogram = moving_average_convergence_divergence(prices, 12, 26, 9)
+
+    expected_line = exponential_moving_average(prices, 12)[14:] - exponential_moving_average(prices, 26)
+    assert_that(line, has_length(175))
+    assert_that(float(np.max(np.abs(line - expected_line))), close_to(0.0, 1e-12))
+    assert_that(bool(np.isnan(signal[:8]).all()), is_(True))
+    assert_that(float(np.max(np.abs(signal[8:] - exponential_moving_average(line, 9)))), close_to(0.0, 1e-12))
+    assert_that(float(np.max(np.abs(histogram[8:] - (line[8:] - signal[8:])))), close_to(0.0, 1e-12))
+
+
+def test_should_return_empty_macd_when_fewer_values_than_slow_window_given() -> None:
+    """Test that there is no MACD when there are fewer values than the slow window."""
+    line, signal, histogram = moving_average_convergence_divergence([1.0, 2.0, 3.0], 2, 4, 2)
+
+    assert_that([len(line), len(signal), len(histogram)], equal_to([0, 0, 0]))
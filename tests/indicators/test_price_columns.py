@@ -0,0 +1,57 @@
+"""Test the columnar view of price histories."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from hamcrest import assert_that, equal_to
+
+from technical_analysis_mcp.indicators import PriceColumns
+from technical_analysis_mcp.tools.fetch_asset_price_history import PriceHistory
+
+_START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def test_should_split_history_into_columns_when_history_given(make_price_history: Callable[..., PriceHistory]) -> None:
+    """Test that every field of the bars becomes a column."""
+    columns = PriceColumns.from_bars(
+        make_price_history(
+            [102.0, 104.0],
+            opens=[100.0, 102.0],
+            highs=[105.0, 107.0],
+            lows=[95.0, 97.0],
+            volumes=[1000.0, 1500.0],
+            start=_START,
+        ).bars
+    )
+
+    assert_that(columns.dates, equal_to([datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 2, tzinfo=UTC)]))
+    assert_that(columns.volume.tolist(), equal_to([1000.0, 1500.0]))
+
+
+def test_should_get_price_of_each_source_when_source_given(make_price_history: Callable[..., PriceHistory]) -> None:
+    """Test selecting the prices of the open, high, low and close sources."""
+    columns = PriceColumns.from_bars(
+        make_price_history(
+            [102.0, 104.0],
+            opens=[100.0, 102.0],
+            highs=[105.0, 107.0],
+            lows=[95.0, 97.0],
+            volumes=[1000.0, 1500.0],
+            start=_START,
+        ).bars
+    )
+
+    assert_that(columns.price("open").tolist(), equal_to([100.0, 102.0]))
+    assert_that(columns.price("high").tolist(), equal_to([105.0, 107.0]))
+    assert_that(columns.price("low").tolist(), equal_to([95.0, 97.0]))
+    assert_that(columns.price("close").tolist(), equal_to([102.0, 104.0]))
+
+
+def test_should_return_empty_columns_when_history_without_prices_given(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test that bars without rows have empty columns."""
+    columns = PriceColumns.from_bars(make_price_history([], start=_START).bars)
+
+    assert_that(columns.dates, equal_to([]))
+    assert_that(columns.close.tolist(), equal_to([]))
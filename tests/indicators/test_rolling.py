@@ -0,0 +1,52 @@
+"""Test the rolling window aggregates."""
+
+import numpy as np
+from hamcrest import assert_that, close_to, equal_to, has_length
+
+from technical_analysis_mcp.indicators import rolling_max, rolling_min, rolling_moments, rolling_sums
+
+
+def test_should_find_rolling_extrema_when_valid_data_given() -> None:
+    """Test the highest and lowest value of every window."""
+    values = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0]
+
+    assert_that(rolling_max(values, 3).tolist(), equal_to([4.0, 4.0, 5.0, 9.0, 9.0, 9.0]))
+    assert_that(rolling_min(values, 3).tolist(), equal_to([1.0, 1.0, 1.0, 1.0, 2.0, 2.0]))
+
+
+def test_should_match_naive_extrema_when_windows_span_blocks() -> None:
+    """Test the extrema against every window sliced, for windows that do and do not divide the length."""
+    values = np.random.default_rng(4).normal(0.0, 1.0, 1_003)
+
+    for window in (1, 2, 14, 50, 200, 1_003):
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+
+        assert_that(rolling_max(values, window).tolist(), equal_to(windows.max(axis=1).tolist()))
+        assert_that(rolling_min(values, window).tolist(), equal_to(windows.min(axis=1).tolist()))
+
+
+def test_should_return_empty_extrema_when_window_longer_than_series_given() -> None:
+    """Test that there are no extrema when there are fewer values than the window."""
+    assert_that(rolling_max([1.0, 2.0], 3), has_length(0))
+
+
+def test_should_match_naive_sums_when_windows_span_blocks() -> None:
+    """Test the running sums against every window sliced."""
+    values = np.random.default_rng(6).normal(0.0, 1.0, 1_003)
+
+    for window in (1, 20, 300):
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+
+        assert_that(float(np.max(np.abs(rolling_sums(values, window) - windows.sum(axis=1)))), close_to(0.0, 1e-9))
+
+
+def test_should_match_naive_moments_when_windows_span_blocks() -> None:
+    """Test the mean and variance of every window against every window sliced, aligned with the blocks or not."""
+    values = 1_000.0 + np.cumsum(np.random.default_rng(5).normal(0.0, 1.0, 1_003))
+
+    for window in (1, 2, 14, 50, 1_003):
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        means, variances = rolling_moments(values, window)
+
+        assert_that(float(np.max(np.abs(means - windows.mean(axis=1)))), close_to(0.0, 1e-9))
+        assert_that(float(np.max(np.abs(variances - windows.var(axis=1)))), close_to(0.0, 1e-9))
@@ -0,0 +1,104 @@
+"""Test the Relative Strength Index."""
+
+import numpy as np
+from hamcrest import assert_that, close_to, contains_exactly, equal_to, has_length
+
+from technical_analysis_mcp.indicators import gains_and_losses, relative_strength_index, wilder_averages
+
+
+def _reference_rsi(prices: list[float], period: int) -> list[float]:
+    """Compute the RSI step by step, with Wilder's smoothing."""
+    deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
+    gains = [max(delta, 0.0) for delta in deltas]
+    losses = [max(-delta, 0.0) for delta in deltas]
+    average_gain = sum(gains[:period]) / period
+    average_loss = sum(losses[:period]) / period
+    rsi = []
+
+    for i in range(period, len(deltas) + 1):
+        if i > period:
+            average_gain = (average_gain * (period - 1) + gains[i - 1]) / period
+            average_loss = (average_loss * (period - 1) + losses[i - 1]) / period
+
+        rsi.append(100.0 if average_loss == 0 else 100 - 100 / (1 + average_gain / average_loss))
+
+    return rsi
+
+
+def test_should_separate_gains_losses_when_prices_given() -> None:
+    """Test splitting price changes into gains and losses."""
+    gains, losses = gains_and_losses([100.0, 102.0, 105.0, 103.0, 107.0, 106.0])
+
+    assert_that(gains.tolist(), equal_to([2.0, 3.0, 0.0, 4.0, 0.0]))
+    assert_that(losses.tolist(), equal_to([0.0, 0.0, 2.0, 0.0, 1.0]))
+
+
+def test_should_return_no_changes_when_single_or_no_price_given() -> None:
+    """Test that fewer than two prices have no changes."""
+    assert_that(gains_and_losses([100.0])[0], has_length(0))
+    assert_that(gains_and_losses([])[1], has_length(0))
+
+
+def test_should_compute_average_gain_loss_when_period_2_given() -> None:
+    """Test Wilder's averages of gains and losses with period 2."""
+    gains = np.array([2.0, 3.0, 0.0, 4.0, 0.0])
+    losses = np.array([0.0, 0.0, 2.0, 0.0, 1.0])
+
+    average_gains, average_losses = wilder_averages(gains, losses, 2)
+
+    assert_that(
+        average_gains.tolist(),
+        contains_exactly(close_to(2.5, 0.001), close_to(1.25, 0.001), close_to(2.625, 0.001), close_to(1.3125, 0.001)),
+    )
+    assert_that(
+        average_losses.tolist(),
+        contains_exactly(close_to(0.0, 0.001), close_to(1.0, 0.001), close_to(0.5, 0.001), close_to(0.75, 0.001)),
+    )
+
+
+def test_should_compute_average_gain_loss_when_period_3_given() -> None:
+    """Test Wilder's averages of gains and losses with period 3."""
+    gains = np.array([2.0, 3.0, 1.0, 4.0])
+    losses = np.array([0.0, 0.0, 2.0, 1.0])
+
+    average_gains, average_losses = wilder_averages(gains, losses, 3)
+
+    assert_that(average_gains.tolist(), contains_exactly(close_to(2.0, 0.001), close_to(2.6667, 0.001)))
+    assert_that(average_losses[0], close_to(0.6667, 0.001))
+
+
+def test_should_compute_rsi_when_prices_given() -> None:
+    """Test the RSI of each price from the period on."""
+    rsi = relative_strength_index([100.0, 102.0, 105.0, 103.0, 107.0, 106.0], 2)
+
+    assert_that(
+        rsi.tolist(),
+        contains_exactly(
+            close_to(100.0, 0.001),
+            close_to(55.5556, 0.001),
+            close_to(84.0, 0.001),
+            close_to(63.6364, 0.001),
+        ),
+    )
+
+
+def test_should_compute_rsi_when_zero_average_loss_or_gain_given() -> None:
+    """Test that the RSI is 100 without losses, 0 without gains, and 100 without changes."""
+    assert_that(relative_strength_index([1.0, 2.0, 3.0, 4.0], 2).tolist(), equal_to([100.0, 100.0]))
+    assert_that(relative_strength_index([4.0, 3.0, 2.0, 1.0], 2).tolist(), equal_to([0.0, 0.0]))
+    assert_that(relative_strength_index([1.0, 1.0, 1.0, 1.0], 2).tolist(), equal_to([100.0, 100.0]))
+
+
+def test_should_return_empty_array_when_insufficient_data_given() -> None:
+    """Test that there is no RSI without more prices than the period."""
+    assert_that(relative_strength_index([1.0, 2.0], 2), has_length(0))
+
+
+def test_should_match_step_by_step_rsi_when_long_series_given() -> None:
+    """Test that the vectorized RSI matches the step by step computation to 1e-9."""
+    prices = (100.0 + np.cumsum(np.random.default_rng(11).normal(0.0, 1.0, 20_000))).tolist()
+
+    rsi = relative_strength_index(prices, 14)
+
+    assert_that(rsi, has_length(len(prices) - 14))
+    assert_that(float(np.max(np.abs(rsi - _reference_rsi(prices, 14)))), close_to(0.0, 1e-9))
@@ -0,0 +1,69 @@
+"""Test the Simple Moving Average."""
+
+import math
+
+import numpy as np
+from hamcrest import assert_that, close_to, contains_exactly, has_length
+
+from technical_analysis_mcp.indicators import simple_moving_average
+
+
+def test_should_compute_sma_when_valid_data_given() -> None:
+    """Test computing the SMA of every complete window."""
+    prices = [100.0, 102.0, 105.0, 103.0, 107.0, 110.0, 108.0]
+
+    result = simple_moving_average(prices, 3)
+
+    assert_that(
+        result.tolist(),
+        contains_exactly(
+            close_to(102.3333, 0.001),  # (100+102+105)/3
+            close_to(103.3333, 0.001),  # (102+105+103)/3
+            close_to(105.0, 0.001),  # (105+103+107)/3
+            close_to(106.6667, 0.001),  # (103+107+110)/3
+            close_to(108.3333, 0.001),  # (107+110+108)/3
+        ),
+    )
+
+
+def test_should_compute_sma_when_window_equals_length_given() -> None:
+    """Test computing the SMA when the window spans every value."""
+    result = simple_moving_average([100.0, 102.0, 105.0], 3)
+
+    assert_that(result.tolist(), contains_exactly(close_to(102.3333, 0.001)))
+
+
+def test_should_return_empty_array_when_insufficient_data_given() -> None:
+    """Test that fewer values than the window give no averages."""
+    assert_that(simple_moving_average([100.0, 102.0], 3), has_length(0))
+
+
+def test_should_return_empty_array_when_zero_or_negative_window_given() -> None:
+    """Test that a window below one gives no averages."""
+    prices = [100.0, 102.0, 105.0]
+
+    assert_that(simple_moving_average(prices, 0), has_length(0))
+    assert_that(simple_moving_average(prices, -5), has_length(0))
+
+
+def test_should_match_window_sums_when_long_series_given() -> None:
+    """Test that the running sums match summing every window to 1e-9."""
+    prices = 100.0 + np.cumsum(np.random.default_rng(7).normal(0.0, 1.0, 100_000))
+    window = 50
+
+    result = simple_moving_average(prices, window)
+    expected = [sum(prices[i - window + 1 : i + 1]) / window for i in range(window - 1, len(prices), 997)]
+
+    assert_that(result, has_length(len(prices) - window + 1))
+    assert_that(float(np.max(np.abs(result[::997] - expected))), close_to(0.0, 1e-9))
+
+
+def test_should_match_window_sums_when_long_series_with_wide_swings_given() -> None:
+    """Test that the error does not grow with the length of a series far from zero, to 1e-9."""
+    prices = 600.0 + np.cumsum(np.random.default_rng(3).normal(0.0, 5.0, 100_000))
+    window = 20
+
+    result = simple_moving_average(prices, window)
+    expected = [math.fsum(prices[i - window + 1 : i + 1]) / window for i in range(window - 1, len(prices))]
+
+    assert_that(float(np.max(np.abs(result - expected))), close_to(0.0, 1e-9))
@@ -0,0 +1,33 @@
+"""Test the exponential smoothing of series."""
+
+import numpy as np
+from hamcrest import assert_that, close_to, equal_to, has_length
+
+from technical_analysis_mcp.indicators import exponential_smoothing
+
+
+def test_given_values_when_exponential_smoothing_then_matches_recurrence() -> None:
+    """Test that the blocked solution matches the step by step recurrence to 1e-9."""
+    values = np.random.default_rng(3).normal(100.0, 5.0, 1_000)
+    alpha = 1.0 / 14
+    expected = []
+    smoothed = 50.0
+
+    for value in values:
+        smoothed = (1 - alpha) * smoothed + alpha * value
+        expected.append(smoothed)
+
+    result = exponential_smoothing(values, alpha, 50.0)
+
+    assert_that(result, has_length(len(values)))
+    assert_that(float(np.max(np.abs(result - expected))), close_to(0.0, 1e-9))
+
+
+def test_given_no_values_when_exponential_smoothing_then_returns_empty_array() -> None:
+    """Test that an empty series stays empty."""
+    assert_that(exponential_smoothing([], 0.5, 1.0), has_length(0))
+
+
+def test_given_single_value_when_exponential_smoothing_then_weighs_initial_value() -> None:
+    """Test the first step of the recurrence."""
+    assert_that(exponential_smoothing([3.0], 0.5, 1.0).tolist(), equal_to([2.0]))
@@ -0,0 +1,45 @@
+"""Test the stochastic oscillator, the Williams %R and the Donchian channels."""
+
+import numpy as np
+from hamcrest import assert_that, close_to, contains_exactly, equal_to, is_
+
+from technical_analysis_mcp.indicators import donchian_channels, stochastic_oscillator, williams_r
+
+_HIGH = np.array([10.0, 12.0, 11.0, 13.0, 12.0])
+_LOW = np.array([8.0, 9.0, 10.0, 11.0, 12.0])
+_CLOSE = np.array([9.0, 11.0, 10.5, 12.0, 12.0])
+
+
+def test_should_compute_stochastic_oscillator_when_bars_given() -> None:
+    """Test %K from the highest high and lowest low of each window, and %D as its average."""
+    k, d = stochastic_oscillator(_HIGH, _LOW, _CLOSE, 3, 2)
+
+    assert_that(k.tolist(), contains_exactly(close_to(62.5, 1e-9), close_to(75.0, 1e-9), close_to(200 / 3, 1e-9)))
+    assert_that(bool(np.isnan(d[0])), is_(True))
+    assert_that(d[1:].tolist(), contains_exactly(close_to(68.75, 1e-9), close_to(425 / 6, 1e-9)))
+
+
+def test_should_compute_williams_r_as_shifted_stochastic_when_bars_given() -> None:
+    """Test that the Williams %R is %K less 100."""
+    assert_that(
+        williams_r(_HIGH, _LOW, _CLOSE, 3).tolist(),
+        contains_exactly(close_to(-37.5, 1e-9), close_to(-25.0, 1e-9), close_to(-100 / 3, 1e-9)),
+    )
+
+
+def test_should_compute_stochastic_midpoint_when_window_has_no_range() -> None:
+    """Test that a window with no range is at 50."""
+    flat = np.full(3, 5.0)
+
+    k, _ = stochastic_oscillator(flat, flat, flat, 2, 1)
+
+    assert_that(k.tolist(), equal_to([50.0, 50.0]))
+
+
+def test_should_compute_donchian_channels_when_bars_given() -> None:
+    """Test the highest high, lowest low and their midpoint of each window."""
+    upper, middle, lower = donchian_channels(_HIGH, _LOW, 3)
+
+    assert_that(upper.tolist(), equal_to([12.0, 13.0, 13.0]))
+    assert_that(lower.tolist(), equal_to([8.0, 9.0, 10.0]))
+    assert_that(middle.tolist(), equal_to([10.0, 11.0, 11.5]))
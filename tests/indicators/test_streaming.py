@@ -0,0 +1,179 @@
+"""Test the indicator states updated one value at a time."""
+
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from hamcrest import assert_that, close_to, equal_to, has_length, none, not_none
+
+from technical_analysis_mcp.indicators import (
+    IndicatorState,
+    exponential_moving_average,
+    relative_strength_index,
+    simple_moving_average,
+    start_ema,
+    start_rsi,
+    start_sma,
+    stream_series,
+)
+
+
+def _make_prices(count: int) -> npt.NDArray[np.float64]:
+    """Build a random walk of prices."""
+    return 100.0 + np.cumsum(np.random.default_rng(5).normal(0.0, 1.0, count))
+
+
+def _make_timestamps(count: int) -> npt.NDArray[np.int64]:
+    """Build the timestamps of consecutive five minute bars, in nanoseconds since the epoch."""
+    start = datetime(2024, 3, 15, 13, 30, tzinfo=UTC)
+    return pd.date_range(start, periods=count, freq="5min").asi8
+
+
+def test_given_rsi_state_when_update_then_matches_whole_series() -> None:
+    """Test that updating the RSI state matches computing the whole series to 1e-9."""
+    prices = _make_prices(1_000)
+    started = start_rsi(prices[:500], 14)
+
+    assert_that(started, not_none())
+
+    if started is not None:
+        state, _ = started
+        updated = [state.update(price) for price in prices[500:].tolist()]
+
+        expected = relative_strength_index(prices, 14)[-500:]
+        assert_that(float(np.max(np.abs(np.asarray(updated) - expected))), close_to(0.0, 1e-9))
+
+
+def test_given_ema_state_when_update_then_matches_whole_series() -> None:
+    """Test that updating the EMA state matches computing the whole series to 1e-9."""
+    prices = _make_prices(1_000)
+    started = start_ema(prices[:500], 20)
+
+    assert_that(started, not_none())
+
+    if started is not None:
+        state, _ = started
+        updated = [state.update(price) for price in prices[500:].tolist()]
+
+        expected = exponential_moving_average(prices, 20)[-500:]
+        assert_that(float(np.max(np.abs(np.asarray(updated) - expected))), close_to(0.0, 1e-9))
+
+
+def test_given_sma_state_when_update_then_matches_whole_series() -> None:
+    """Test that updating the SMA ring buffer matches computing the whole series to 1e-9."""
+    prices = _make_prices(1_000)
+    started = start_sma(prices[:500], 20)
+
+    assert_that(started, not_none())
+
+    if started is not None:
+        state, _ = started
+        updated = [state.update(price) for price in prices[500:].tolist()]
+
+        expected = simple_moving_average(prices, 20)[-500:]
+        assert_that(float(np.max(np.abs(np.asarray(updated) - expected))), close_to(0.0, 1e-9))
+
+
+def test_given_too_few_prices_when_start_then_returns_none() -> None:
+    """Test that the indicators cannot start without enough prices."""
+    assert_that(start_rsi(np.array([1.0, 2.0]), 2), none())
+    assert_that(start_sma(np.array([1.0, 2.0]), 3), none())
+
+
+def test_given_new_bars_when_stream_series_then_adds_only_new_bars() -> None:
+    """Test that a refreshed series continues from the previous state, with a changed last bar."""
+    prices = _make_prices(300)
+    timestamps = _make_timestamps(300)
+    start = Mock(side_effect=lambda values: start_rsi(values, 14))
+
+    streamed, _ = stream_series(None, timestamps[:200], prices[:200], start)
+    refreshed = prices.copy()
+    refreshed[-1] += 1.0
+    streamed, values = stream_series(streamed, timestamps, refreshed, start)
+
+    start.assert_called_once()
+    assert_that(streamed, not_none())
+    assert_that(float(np.max(np.abs(values - relative_strength_index(refreshed, 14)))), close_to(0.0, 1e-9))
+
+
+def test_given_series_with_other_start_when_stream_series_then_starts_again() -> None:
+    """Test that a series starting before the bars of the state is computed from scratch."""
+    prices = _make_prices(300)
+    timestamps = _make_timestamps(300)
+    start = Mock(side_effect=lambda values: start_sma(values, 20))
+
+    streamed, _ = stream_series(None, timestamps[50:250], prices[50:250], start)
+    _, values = stream_series(streamed, timestamps, prices, start)
+
+    assert_that(start.call_count, equal_to(2))
+    assert_that(float(np.max(np.abs(values - simple_moving_average(prices, 20)))), close_to(0.0, 1e-9))
+
+
+def test_given_rolling_series_when_stream_series_then_drops_oldest_values_and_keeps_state() -> None:
+    """Test that a series whose oldest bars were dropped continues from the previous state."""
+    prices = _make_prices(300)
+    timestamps = _make_timestamps(300)
+    start = Mock(side_effect=lambda values: start_sma(values, 20))
+
+    streamed, _ = stream_series(None, timestamps[:200], prices[:200], start)
+    streamed, values = stream_series(streamed, timestamps[3:203], prices[3:203], start)
+
+    start.assert_called_once()
+    assert_that(streamed, not_none())
+    assert_that(values, has_length(181))
+    assert_that(float(np.max(np.abs(values - simple_moving_average(prices[3:203], 20)))), close_to(0.0, 1e-9))
+
+
+def test_given_rolling_series_when_stream_rsi_then_starts_again() -> None:
+    """Test that the RSI, seeded from the first bar, is computed from scratch when the oldest bars were dropped."""
+    prices = _make_prices(300)
+    timestamps = _make_timestamps(300)
+    start = Mock(side_effect=lambda values: start_rsi(values, 14))
+
+    streamed, _ = stream_series(None, timestamps[:200], prices[:200], start)
+    _, values = stream_series(streamed, timestamps[3:203], prices[3:203], start)
+
+    assert_that(start.call_count, equal_to(2))
+    assert_that(float(np.max(np.abs(values - relative_strength_index(prices[3:203], 14)))), close_to(0.0, 1e-9))
+
+
+def test_given_rolling_series_when_stream_ema_then_starts_again() -> None:
+    """Test that the EMA, seeded from the first bar, is computed from scratch when the oldest bars were dropped."""
+    prices = _make_prices(300)
+    timestamps = _make_timestamps(300)
+    start = Mock(side_effect=lambda values: start_ema(values, 10))
+
+    streamed, _ = stream_series(None, timestamps[:200], prices[:200], start)
+    _, values = stream_series(streamed, timestamps[3:203], prices[3:203], start)
+
+    assert_that(start.call_count, equal_to(2))
+    assert_that(float(np.max(np.abs(values - exponential_moving_average(prices[3:203], 10)))), close_to(0.0, 1e-9))
+
+
+def test_given_changed_last_added_bar_when_stream_series_then_starts_again() -> None:
+    """Test that a series re-adjusted up to the last bar added is computed from scratch."""
+    prices = _make_prices(300)
+    timestamps = _make_timestamps(300)
+    start = Mock(side_effect=lambda values: start_sma(values, 20))
+
+    streamed, _ = stream_series(None, timestamps[:200], prices[:200], start)
+    adjusted = prices * 0.5
+    _, values = stream_series(streamed, timestamps[3:], adjusted[3:], start)
+
+    assert_that(start.call_count, equal_to(2))
+    assert_that(float(np.max(np.abs(values - simple_moving_average(adjusted[3:], 20)))), close_to(0.0, 1e-9))
+
+
+def test_given_indicator_state_when_copy_then_updates_independently() -> None:
+    """Test that updating a copy of a state leaves the original unchanged."""
+    started = start_sma(np.array([1.0, 2.0, 3.0]), 3)
+
+    assert_that(started, not_none())
+
+    if started is not None:
+        state: IndicatorState = started[0]
+        state.copy().update(9.0)
+
+        assert_that(state.update(3.0), close_to(8.0 / 3.0, 1e-12))
@@ -0,0 +1,55 @@
+"""Test the indicators computed for many lengths at once."""
+
+import numpy as np
+from hamcrest import assert_that, equal_to, is_
+
+from technical_analysis_mcp.indicators import (
+    relative_strength_index,
+    relative_strength_indices,
+    simple_moving_average,
+    simple_moving_averages,
+)
+
+
+def test_given_several_windows_when_simple_moving_averages_then_rows_match_each_window() -> None:
+    """Test that every row is the SMA of its window, NaN before the window fills."""
+    prices = np.random.default_rng(7).normal(100.0, 5.0, 300)
+
+    table = simple_moving_averages(prices, [5, 20, 200])
+
+    assert_that(table.shape, equal_to((3, 300)))
+
+    for row, window in enumerate([5, 20, 200]):
+        assert_that(bool(np.isnan(table[row, : window - 1]).all()), is_(True))
+        assert_that(bool(np.allclose(table[row, window - 1 :], simple_moving_average(prices, window))), is_(True))
+
+
+def test_given_window_longer_than_series_when_simple_moving_averages_then_row_is_nan() -> None:
+    """Test that a window longer than the series has no values."""
+    table = simple_moving_averages([1.0, 2.0, 3.0], [2, 4])
+
+    assert_that(bool(np.isnan(table[1]).all()), is_(True))
+    assert_that(table[0, 1:].tolist(), equal_to([1.5, 2.5]))
+
+
+def test_given_long_series_when_simple_moving_averages_then_rows_match_sma_exactly() -> None:
+    """Test that the rows of a long series far from zero equal the SMA of each window."""
+    prices = 600.0 + np.cumsum(np.random.default_rng(3).normal(0.0, 5.0, 100_000))
+
+    table = simple_moving_averages(prices, [20, 50])
+
+    assert_that(table[0, 19:].tolist(), equal_to(simple_moving_average(prices, 20).tolist()))
+    assert_that(table[1, 49:].tolist(), equal_to(simple_moving_average(prices, 50).tolist()))
+
+
+def test_given_several_periods_when_relative_strength_indices_then_rows_match_each_period() -> None:
+    """Test that every row is the RSI of its period, NaN up to the period."""
+    prices = np.random.default_rng(11).normal(100.0, 5.0, 300)
+
+    table = relative_strength_indices(prices, [2, 14, 299, 300])
+
+    for row, period in enumerate([2, 14, 299]):
+        assert_that(bool(np.isnan(table[row, :period]).all()), is_(True))
+        assert_that(bool(np.allclose(table[row, period:], relative_strength_index(prices, period))), is_(True))
+
+    assert_that(bool(np.isnan(table[3]).all()), is_(True))
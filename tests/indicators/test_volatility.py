@@ -0,0 +1,84 @@
+"""Test the true range and the volatility estimators."""
+
+import math
+
+import numpy as np
+import numpy.typing as npt
+from hamcrest import assert_that, close_to, contains_exactly, equal_to, has_length, is_
+
+from technical_analysis_mcp.indicators import average_true_range, range_volatilities, true_range
+
+
+def _make_bars(count: int) -> tuple[npt.NDArray[np.float64], ...]:
+    """Build random bars with gaps between the close and the next open."""
+    rng = np.random.default_rng(2)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, count)))
+    open_ = np.concatenate(([100.0], close[:-1])) * np.exp(rng.normal(0.0, 0.003, count))
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0.0, 0.005, count)))
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0.0, 0.005, count)))
+
+    return open_, high, low, close
+
+
+def test_should_compute_true_range_including_gaps_when_bars_given() -> None:
+    """Test that the true range spans the previous close."""
+    high = np.array([11.0, 12.0, 10.0, 15.0])
+    low = np.array([9.0, 11.0, 8.0, 14.0])
+    close = np.array([10.0, 11.5, 9.0, 14.5])
+
+    assert_that(true_range(high, low, close).tolist(), equal_to([2.0, 3.5, 6.0]))
+
+
+def test_should_compute_wilder_average_of_true_ranges_when_bars_given() -> None:
+    """Test that the ATR starts at the mean of the first true ranges and then smooths them."""
+    high = np.array([11.0, 12.0, 10.0, 15.0])
+    low = np.array([9.0, 11.0, 8.0, 14.0])
+    close = np.array([10.0, 11.5, 9.0, 14.5])
+
+    result = average_true_range(high, low, close, 2)
+
+    assert_that(result.tolist(), contains_exactly(close_to(2.75, 1e-9), close_to(4.375, 1e-9)))
+    assert_that(average_true_range(high, low, close, 4), has_length(0))
+
+
+def test_should_match_windowed_estimators_when_bars_given() -> None:
+    """Test the estimators against their definitions over the last window to 1e-12."""
+    open_, high, low, close = _make_bars(300)
+    window = 20
+    last = slice(300 - window, 300)
+
+    parkinson, garman_klass, yang_zhang = range_volatilities(open_, high, low, close, window)
+
+    squared_ranges = np.log(high[last] / low[last]) ** 2
+    returns = np.log(close[last] / open_[last])
+    overnight = np.log(open_[last] / close[300 - window - 1 : 299])
+    rogers_satchell = np.log(high[last] / close[last]) * np.log(high[last] / open_[last]) + np.log(
+        low[last] / close[last]
+    ) * np.log(low[last] / open_[last])
+    weight = 0.34 / (1.34 + (window + 1) / (window - 1))
+
+    assert_that(float(parkinson[-1]), close_to(math.sqrt(squared_ranges.mean() / (4 * math.log(2))), 1e-12))
+    assert_that(
+        float(garman_klass[-1]),
+        close_to(math.sqrt((0.5 * squared_ranges - (2 * math.log(2) - 1) * returns**2).mean()), 1e-12),
+    )
+    assert_that(
+        float(yang_zhang[-1]),
+        close_to(
+            math.sqrt(
+                overnight.var(ddof=1) + weight * returns.var(ddof=1) + (1 - weight) * rogers_satchell.mean(),
+            ),
+            1e-12,
+        ),
+    )
+    assert_that(parkinson, has_length(281))
+    assert_that(bool(np.isnan(yang_zhang[0])), is_(True))
+
+
+def test_should_return_empty_estimates_when_window_below_two_given() -> None:
+    """Test that a single bar window has no estimate."""
+    open_, high, low, close = _make_bars(10)
+
+    parkinson, _, _ = range_volatilities(open_, high, low, close, 1)
+
+    assert_that(parkinson, has_length(0))
@@ -0,0 +1,35 @@
+"""Test the compact encoding of time series."""
+
+from datetime import UTC, datetime, timedelta
+
+from hamcrest import assert_that, equal_to, has_properties, is_, none
+
+from technical_analysis_mcp.models import build_compact_time_series
+
+
+def test_given_evenly_spaced_dates_when_build_compact_time_series_then_encodes_start_and_step() -> None:
+    """Test that evenly spaced timestamps are encoded as a start and a step."""
+    start = datetime(2024, 3, 15, 13, 30, tzinfo=UTC)
+    dates = [start + timedelta(minutes=5 * i) for i in range(3)]
+
+    series = build_compact_time_series("AAPL", dates, [1.23456, 2.0, 3.98765], 2)
+
+    assert_that(series, has_properties(start=int(start.timestamp()), step=300, timestamps=none(), decimals=2))
+    assert_that(series.values, equal_to([1.23, 2.0, 3.99]))
+
+
+def test_given_unevenly_spaced_dates_when_build_compact_time_series_then_encodes_timestamps() -> None:
+    """Test that unevenly spaced timestamps are encoded as an array of epoch seconds."""
+    dates = [datetime(2024, 3, day, tzinfo=UTC) for day in (14, 15, 18)]
+
+    series = build_compact_time_series("AAPL", dates, [1.0, 2.0, 3.0], 6)
+
+    assert_that(series.step, is_(none()))
+    assert_that(series.timestamps, equal_to([int(date.timestamp()) for date in dates]))
+
+
+def test_given_no_dates_when_build_compact_time_series_then_returns_empty_series() -> None:
+    """Test encoding an empty time series."""
+    series = build_compact_time_series("AAPL", [], [], 6)
+
+    assert_that(series, has_properties(start=none(), step=none(), timestamps=equal_to([]), values=equal_to([])))
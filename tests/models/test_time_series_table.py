@@ -0,0 +1,20 @@
+"""Test the compact encoding of time series tables."""
+
+import math
+from datetime import UTC, datetime, timedelta
+
+from hamcrest import assert_that, equal_to, has_properties, none
+
+from technical_analysis_mcp.models import build_time_series_table
+
+
+def test_given_columns_when_build_time_series_table_then_encodes_rounded_columns() -> None:
+    """Test that every column is rounded and missing values become nulls."""
+    start = datetime(2024, 3, 15, 13, 30, tzinfo=UTC)
+    dates = [start + timedelta(minutes=5 * i) for i in range(3)]
+
+    table = build_time_series_table("AAPL", dates, {"a": [1.23456, 2.0, 3.98765], "b": [math.nan, 1.0, 2.5]}, 2)
+
+    assert_that(table, has_properties(start=int(start.timestamp()), step=300, timestamps=none(), decimals=2))
+    assert_that(table.columns, equal_to(["a", "b"]))
+    assert_that(table.values, equal_to([[1.23, 2.0, 3.99], [None, 1.0, 2.5]]))
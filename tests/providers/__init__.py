@@ -0,0 +1 @@
+"""Providers test module."""
@@ -0,0 +1,36 @@
+"""Test the selection of the market data provider."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from hamcrest import assert_that, instance_of, is_
+
+from technical_analysis_mcp.providers import FileProvider, YahooFinanceProvider, get_provider
+from technical_analysis_mcp.settings import Settings
+
+
+def test_given_files_provider_setting_when_get_provider_then_returns_file_provider(tmp_path: Path) -> None:
+    """Test selecting the provider serving local files."""
+    get_provider.cache_clear()
+
+    with patch(
+        "technical_analysis_mcp.providers.factory.get_settings",
+        return_value=Settings(provider="files", provider_directory=tmp_path),
+    ):
+        provider = get_provider()
+
+    get_provider.cache_clear()
+
+    assert_that(provider, is_(instance_of(FileProvider)))
+
+
+def test_given_default_settings_when_get_provider_then_returns_yahoo_finance_provider() -> None:
+    """Test that Yahoo Finance is the default provider."""
+    get_provider.cache_clear()
+
+    with patch("technical_analysis_mcp.providers.factory.get_settings", return_value=Settings()):
+        provider = get_provider()
+
+    get_provider.cache_clear()
+
+    assert_that(provider, is_(instance_of(YahooFinanceProvider)))
@@ -0,0 +1,113 @@
+"""Test the provider serving a local directory of files."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from hamcrest import assert_that, contains_exactly, equal_to, has_entries, is_
+
+from technical_analysis_mcp.providers import FileProvider
+
+
+def _write_ticker(directory: Path) -> pd.DatetimeIndex:
+    """Write the daily bars and information of a ticker."""
+    index = pd.bdate_range("2024-01-01", periods=60, tz="America/New_York", name="Date")
+    closes = np.arange(100.0, 160.0)
+    ticker = directory / "AAPL"
+    ticker.mkdir()
+    pd.DataFrame(
+        {"Open": closes, "High": closes + 1, "Low": closes - 1, "Close": closes, "Volume": np.full(60, 1000)},
+        index=index,
+    ).to_csv(ticker / "1d.csv")
+    (ticker / "info.json").write_text(json.dumps({"symbol": "AAPL", "exchangeTimezoneName": "America/New_York"}))
+
+    return index
+
+
+def test_given_csv_file_when_history_then_returns_period_before_last_bar(tmp_path: Path) -> None:
+    """Test that a period is counted back from the last bar of the file."""
+    index = _write_ticker(tmp_path)
+
+    bars = FileProvider(tmp_path).history("aapl", "5d", "1d")
+
+    assert_that(bars.index.to_list(), equal_to(index[-5:].to_list()))
+    assert_that(bars["Dividends"].tolist(), equal_to([0.0] * 5))
+    assert_that(str(pd.DatetimeIndex(bars.index).tz), equal_to("America/New_York"))
+
+
+def test_given_npz_file_when_history_since_then_returns_bars_from_start(tmp_path: Path) -> None:
+    """Test reading the bars of a NPZ file from a point in time onwards."""
+    index = pd.date_range("2024-01-02 14:30", periods=10, freq="5min", tz="UTC")
+    closes = np.arange(10.0)
+    (tmp_path / "MSFT").mkdir()
+    np.savez(
+        tmp_path / "MSFT" / "5m.npz",
+        Date=index.asi8,
+        Open=closes,
+        High=closes,
+        Low=closes,
+        Close=closes,
+        Volume=np.zeros(10, dtype=np.int64),
+    )
+
+    bars = FileProvider(tmp_path).history_since("MSFT", index.to_list()[7], "5m")
+
+    assert_that(bars["Close"].tolist(), contains_exactly(7.0, 8.0, 9.0))
+
+
+def test_given_csv_file_when_history_between_then_returns_bars_of_range(tmp_path: Path) -> None:
+    """Test reading the bars from a start up to before an end."""
+    index = _write_ticker(tmp_path)
+
+    bars = FileProvider(tmp_path).history_between("AAPL", index.to_list()[10], index.to_list()[13], "1d")
+
+    assert_that(bars.index.to_list(), equal_to(index[10:13].to_list()))
+
+
+def test_given_missing_ticker_when_read_then_returns_no_data(tmp_path: Path) -> None:
+    """Test that unknown tickers, including path-like symbols, have no data."""
+    _write_ticker(tmp_path)
+    provider = FileProvider(tmp_path)
+
+    assert_that(provider.history("UNKNOWN", "1mo", "1d").empty, is_(True))
+    assert_that(provider.history("../AAPL", "1mo", "1d").empty, is_(True))
+    assert_that(provider.information("UNKNOWN"), equal_to({}))
+
+
+def test_given_several_tickers_when_download_then_returns_bars_of_each(tmp_path: Path) -> None:
+    """Test reading the bars of several tickers."""
+    index = _write_ticker(tmp_path)
+
+    downloaded = FileProvider(tmp_path).download(["AAPL", "UNKNOWN"], "1mo", "1d")
+
+    assert_that(downloaded["AAPL"].index.to_list(), equal_to(index[index >= "2024-02-22"].to_list()))
+    assert_that(downloaded["UNKNOWN"].empty, is_(True))
+    assert_that(FileProvider(tmp_path).information("AAPL"), has_entries(symbol="AAPL"))
+
+
+def test_given_several_tickers_when_download_since_then_returns_bars_of_each_from_start(tmp_path: Path) -> None:
+    """Test reading the bars of several tickers from a point in time onwards."""
+    index = _write_ticker(tmp_path)
+
+    downloaded = FileProvider(tmp_path).download_since(["AAPL", "UNKNOWN"], index.to_list()[55], "1d")
+
+    assert_that(downloaded["AAPL"].index.to_list(), equal_to(index[55:].to_list()))
+    assert_that(downloaded["UNKNOWN"].empty, is_(True))
+
+
+def test_given_files_read_when_history_again_then_does_not_read_files_again(tmp_path: Path) -> None:
+    """Test that the bars and information of a ticker are parsed once and kept in memory."""
+    index = _write_ticker(tmp_path)
+    provider = FileProvider(tmp_path)
+    first = provider.history("AAPL", "5d", "1d")
+
+    with patch("technical_analysis_mcp.providers.file_provider.pd.read_csv") as read_mock:
+        second = provider.history_between("AAPL", index.to_list()[0], None, "1d")
+        information = provider.information("AAPL")
+
+    read_mock.assert_not_called()
+    assert_that(second.index.to_list(), equal_to(index.to_list()))
+    assert_that(second.index[-5:].to_list(), equal_to(first.index.to_list()))
+    assert_that(information, has_entries(symbol="AAPL"))
@@ -1,7 +1,9 @@
 """Test MCP Server."""
 
 from typing import Any, cast
+from unittest.mock import patch
 
+import pandas as pd
 import pytest
 from fastmcp import Client
 from fastmcp.exceptions import ToolError
@@ -10,6 +12,7 @@ from hamcrest import (
     contains_inanyorder,
     equal_to,
     has_key,
+    has_length,
     is_,
     not_,
     not_none,
@@ -42,7 +45,23 @@ async def test_given_server_initialized_when_get_instructions_then_returns_non_e
 @pytest.mark.asyncio
 async def test_given_server_initialized_when_list_tools_then_returns_registered_tools() -> None:
     """Test that tools are properly registered with expected properties."""
-    expected_tools = ["get_ticker_information", "get_asset_price_history", "get_rsi", "get_sma"]
+    expected_tools = [
+        "get_ticker_information",
+        "get_asset_price_history",
+        "get_asset_price_histories",
+        "get_rsi",
+        "get_sma",
+        "get_ema",
+        "get_macd",
+        "get_bollinger_bands",
+        "get_atr",
+        "get_volatility",
+        "get_stochastic",
+        "get_williams_r",
+        "get_donchian_channels",
+        "get_indicators",
+        "get_cache_statistics",
+    ]
 
     async with Client(server) as client:
         tools = await client.list_tools()
@@ -168,6 +187,36 @@ async def test_given_invalid_ticker_when_call_get_asset_price_history_then_retur
         assert_that(result_data, has_key("what"))
 
 
+@pytest.mark.asyncio
+async def test_given_columnar_format_when_call_get_asset_price_history_then_returns_parallel_arrays() -> None:
+    """Test the get_asset_price_history tool with the columnar format."""
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=3, name="Date")
+    bars = pd.DataFrame(
+        {
+            "Open": [1.0, 2.0, 3.0],
+            "High": [1.0, 2.0, 3.0],
+            "Low": [1.0, 2.0, 3.0],
+            "Close": [1.0, 2.0, 3.0],
+            "Volume": [10, 20, 30],
+            "Dividends": [0.0, 0.0, 0.0],
+            "Stock Splits": [0.0, 0.0, 0.0],
+        },
+        index=index,
+    )
+
+    with patch("technical_analysis_mcp.tools.fetch_asset_price_history.load_price_bars", return_value=bars):
+        async with Client(server) as client:
+            params = {"ticker": "AAPL", "period": "5d", "interval": "1d", "format": "columnar"}
+            result = await client.call_tool("get_asset_price_history", params)
+
+    structured_content = cast("dict[str, Any]", result.structured_content)
+    result_data = structured_content["result"]
+    assert_that(result_data["close"], equal_to([1.0, 2.0, 3.0]))
+    assert_that(result_data["volume"], equal_to([10, 20, 30]))
+    assert_that(result_data["timestamps"], has_length(3))
+    assert_that(result_data, not_(has_key("prices")))
+
+
 @pytest.mark.asyncio
 async def test_given_valid_parameters_when_call_get_rsi_then_returns_rsi_data() -> None:
     """Test the get_rsi tool with valid parameters."""
@@ -0,0 +1,21 @@
+"""Test module for the collect_cache_statistics tool."""
+
+from hamcrest import assert_that, has_entries, has_properties, none
+
+from technical_analysis_mcp.cache import find_error, get_price_cache
+from technical_analysis_mcp.tools import collect_cache_statistics
+
+
+def test_given_lookups_when_collect_cache_statistics_then_reports_hit_rate() -> None:
+    """Test that each cache reports its size, hits, misses and hit rate."""
+    find_error("AAPL")
+
+    statistics = collect_cache_statistics()
+
+    assert_that(
+        statistics.caches,
+        has_entries(
+            errors=has_properties(entries=0, hits=0, misses=1, hit_rate=0.0),
+            prices=has_properties(max_entries=get_price_cache().max_entries, hit_rate=none()),
+        ),
+    )
@@ -0,0 +1,60 @@
+"""Test module for the compute_atr tool."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from hamcrest import assert_that, close_to, contains_exactly, equal_to, instance_of, is_
+
+from technical_analysis_mcp.models import Error, TimeSeries
+from technical_analysis_mcp.tools.compute_atr import compute_atr
+from technical_analysis_mcp.tools.fetch_asset_price_history import PriceHistory
+
+_START = datetime(2024, 3, 11, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_should_compute_atr_when_history_given(make_price_history: Callable[..., PriceHistory]) -> None:
+    """Test computing the ATR from the bar after the first complete period on."""
+    history = make_price_history(
+        [10.0, 11.5, 9.0, 14.5],
+        opens=[10.0, 11.0, 9.5, 14.0],
+        highs=[11.0, 12.0, 10.0, 15.0],
+        lows=[9.0, 11.0, 8.0, 14.0],
+        start=_START,
+    )
+
+    with patch("technical_analysis_mcp.tools.compute_atr.fetch_price_history", AsyncMock(return_value=history)):
+        result = await compute_atr("AAPL", "1mo", "1d", candles=2)
+
+    assert_that(result, is_(instance_of(TimeSeries)))
+    series = cast("TimeSeries", result)
+
+    assert_that(series.data_points[0].date, equal_to(_START + timedelta(days=2)))
+    assert_that(
+        [point.value for point in series.data_points], contains_exactly(close_to(2.75, 1e-9), close_to(4.375, 1e-9))
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_insufficient_data_for_atr_given(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test that a period not shorter than the history is reported."""
+    with patch(
+        "technical_analysis_mcp.tools.compute_atr.fetch_price_history",
+        AsyncMock(
+            return_value=make_price_history(
+                [10.0, 11.5, 9.0, 14.5],
+                opens=[10.0, 11.0, 9.5, 14.0],
+                highs=[11.0, 12.0, 10.0, 15.0],
+                lows=[9.0, 11.0, 8.0, 14.0],
+                start=_START,
+            )
+        ),
+    ):
+        result = await compute_atr("AAPL", "1mo", "1d", candles=4)
+
+    assert_that(result, is_(instance_of(Error)))
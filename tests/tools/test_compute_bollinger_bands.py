@@ -0,0 +1,55 @@
+"""Test module for the compute_bollinger_bands tool."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from hamcrest import assert_that, equal_to, instance_of, is_
+
+from technical_analysis_mcp.models import Error, TimeSeriesTable
+from technical_analysis_mcp.tools.compute_bollinger_bands import compute_bollinger_bands
+from technical_analysis_mcp.tools.fetch_asset_price_history import PriceHistory
+
+_START = datetime(2024, 3, 11, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_should_compute_bollinger_table_when_history_given(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test computing the bands and %B as one table from the first complete window."""
+    history = make_price_history([1.0, 3.0, 5.0, 5.0], start=_START)
+    fetch = AsyncMock(return_value=history)
+
+    with patch("technical_analysis_mcp.tools.compute_bollinger_bands.fetch_price_history", fetch):
+        result = await compute_bollinger_bands("AAPL", "close", "1mo", "1d", window=2)
+
+    assert_that(result, is_(instance_of(TimeSeriesTable)))
+    table = cast("TimeSeriesTable", result)
+
+    assert_that(table.start, equal_to(int((_START + timedelta(days=1)).timestamp())))
+    assert_that(table.columns, equal_to(["middle", "upper", "lower", "percent_b"]))
+    assert_that(table.values, equal_to([[2.0, 4.0, 5.0], [4.0, 6.0, 5.0], [0.0, 2.0, 5.0], [0.75, 0.75, 0.5]]))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_non_positive_deviations_given() -> None:
+    """Test that a number of deviations below zero is rejected."""
+    result = await compute_bollinger_bands("AAPL", "close", "1mo", "1d", deviations=-1.0)
+
+    assert_that(result, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_insufficient_data_for_bollinger_given(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test that a window longer than the history is reported."""
+    fetch = AsyncMock(return_value=make_price_history([1.0, 2.0], start=_START))
+
+    with patch("technical_analysis_mcp.tools.compute_bollinger_bands.fetch_price_history", fetch):
+        result = await compute_bollinger_bands("AAPL", "close", "1mo", "1d", window=3)
+
+    assert_that(result, is_(instance_of(Error)))
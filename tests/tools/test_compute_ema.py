@@ -0,0 +1,54 @@
+"""Test module for the compute_ema tool."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from hamcrest import assert_that, close_to, contains_exactly, equal_to, instance_of, is_
+
+from technical_analysis_mcp.models import Error, TimeSeries
+from technical_analysis_mcp.tools.compute_ema import compute_ema
+from technical_analysis_mcp.tools.fetch_asset_price_history import PriceHistory
+
+_START = datetime(2024, 3, 11, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_should_compute_ema_of_source_when_history_given(make_price_history: Callable[..., PriceHistory]) -> None:
+    """Test computing the EMA from the window on."""
+    history = make_price_history([1.0, 2.0, 3.0, 4.0, 8.0], start=_START)
+
+    with patch("technical_analysis_mcp.tools.compute_ema.fetch_price_history", AsyncMock(return_value=history)):
+        result = await compute_ema("AAPL", "close", "1mo", "1d", window=3)
+
+    assert_that(result, is_(instance_of(TimeSeries)))
+    series = cast("TimeSeries", result)
+
+    assert_that(series.data_points[0].date, equal_to(_START + timedelta(days=2)))
+    assert_that(
+        [point.value for point in series.data_points],
+        contains_exactly(close_to(2.0, 1e-9), close_to(3.0, 1e-9), close_to(5.5, 1e-9)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_insufficient_data_for_ema_given(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test that a window longer than the history is reported."""
+    history = make_price_history([1.0, 2.0], start=_START)
+
+    with patch("technical_analysis_mcp.tools.compute_ema.fetch_price_history", AsyncMock(return_value=history)):
+        result = await compute_ema("AAPL", "close", "1mo", "1d", window=3)
+
+    assert_that(result, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_non_positive_ema_window_given() -> None:
+    """Test that a window below one is rejected."""
+    result = await compute_ema("AAPL", "close", "1mo", "1d", window=0)
+
+    assert_that(cast("Error", result).what, equal_to("EMA window must be positive, got: 0"))
@@ -0,0 +1,94 @@
+"""Test module for the compute_indicators tool."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from hamcrest import assert_that, close_to, contains_exactly, equal_to, has_length, instance_of, is_
+
+from technical_analysis_mcp.models import (
+    Error,
+    IndicatorResults,
+    IndicatorSpec,
+    TimeSeries,
+)
+from technical_analysis_mcp.tools.compute_indicators import compute_indicators
+from technical_analysis_mcp.tools.fetch_asset_price_history import PriceHistory
+
+_START = datetime(2024, 3, 11, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_given_several_specs_when_computing_indicators_then_history_is_fetched_once(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test computing several indicators over a single fetched history."""
+    history = make_price_history(
+        [1.0, 2.0, 3.0, 2.0, 4.0],
+        ticker="TEST",
+        highs=[close + 1.0 for close in [1.0, 2.0, 3.0, 2.0, 4.0]],
+        lows=[close - 1.0 for close in [1.0, 2.0, 3.0, 2.0, 4.0]],
+    )
+    fetch = AsyncMock(return_value=history)
+    specs = [
+        IndicatorSpec(indicator="rsi", length=2),
+        IndicatorSpec(indicator="sma", length=2),
+        IndicatorSpec(indicator="sma", length=3, source="high"),
+    ]
+
+    with patch("technical_analysis_mcp.tools.compute_indicators.fetch_price_history", fetch):
+        result = await compute_indicators("TEST", "1mo", "1d", specs)
+
+    fetch.assert_awaited_once_with("TEST", "1mo", "1d")
+    assert_that(result, is_(instance_of(IndicatorResults)))
+    results = cast("IndicatorResults", result).results
+
+    assert_that([item.spec for item in results], contains_exactly(*specs))
+    assert_that(
+        [point.value for point in cast("TimeSeries", results[1].series).data_points],
+        contains_exactly(close_to(1.5, 1e-9), close_to(2.5, 1e-9), close_to(2.5, 1e-9), close_to(3.0, 1e-9)),
+    )
+    assert_that(
+        [point.value for point in cast("TimeSeries", results[2].series).data_points],
+        contains_exactly(close_to(3.0, 1e-9), close_to(3.333333, 1e-6), close_to(4.0, 1e-9)),
+    )
+    assert_that(cast("TimeSeries", results[0].series).data_points, has_length(3))
+
+
+@pytest.mark.asyncio
+async def test_given_spec_longer_than_history_when_computing_indicators_then_only_it_fails(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test reporting insufficient data for one indicator without failing the others."""
+    fetch = AsyncMock(
+        return_value=make_price_history(
+            [1.0, 2.0, 3.0],
+            ticker="TEST",
+            highs=[close + 1.0 for close in [1.0, 2.0, 3.0]],
+            lows=[close - 1.0 for close in [1.0, 2.0, 3.0]],
+        )
+    )
+    specs = [IndicatorSpec(indicator="sma", length=2), IndicatorSpec(indicator="sma", length=200)]
+
+    with patch("technical_analysis_mcp.tools.compute_indicators.fetch_price_history", fetch):
+        result = await compute_indicators("TEST", "1mo", "1d", specs)
+
+    results = cast("IndicatorResults", result).results
+
+    assert_that(results[0].series, is_(instance_of(TimeSeries)))
+    assert_that(results[1].series, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_given_no_specs_when_computing_indicators_then_error_is_returned() -> None:
+    """Test rejecting an empty list of indicators without fetching."""
+    fetch = AsyncMock()
+
+    with patch("technical_analysis_mcp.tools.compute_indicators.fetch_price_history", fetch):
+        result = await compute_indicators("TEST", "1mo", "1d", [])
+
+    fetch.assert_not_awaited()
+    assert_that(result, is_(instance_of(Error)))
+    assert_that(cast("Error", result).what, equal_to("At least one indicator is required."))
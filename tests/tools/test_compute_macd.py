@@ -0,0 +1,58 @@
+"""Test module for the compute_macd tool."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from hamcrest import assert_that, equal_to, has_length, instance_of, is_, none
+
+from technical_analysis_mcp.models import Error, TimeSeriesTable
+from technical_analysis_mcp.tools.compute_macd import compute_macd
+from technical_analysis_mcp.tools.fetch_asset_price_history import PriceHistory
+
+_START = datetime(2024, 3, 11, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_should_compute_macd_table_when_history_given(make_price_history: Callable[..., PriceHistory]) -> None:
+    """Test computing the MACD line, signal line and histogram from the slow window on."""
+    history = make_price_history([100.0 + i for i in range(40)], period="1y", start=_START)
+
+    with patch("technical_analysis_mcp.tools.compute_macd.fetch_price_history", AsyncMock(return_value=history)):
+        result = await compute_macd("AAPL", "close", "1y", "1d")
+
+    assert_that(result, is_(instance_of(TimeSeriesTable)))
+    table = cast("TimeSeriesTable", result)
+
+    assert_that(table.start, equal_to(int((_START + timedelta(days=25)).timestamp())))
+    assert_that(table.columns, equal_to(["macd", "signal", "histogram"]))
+    macd, signal, histogram = table.values
+    assert_that(macd, has_length(15))
+    assert_that(signal[7], is_(none()))
+    # A linear trend has a constant MACD, so its signal line matches it.
+    assert_that(macd[-1], equal_to(7.0))
+    assert_that(histogram[-1], equal_to(0.0))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_fast_window_not_shorter_than_slow_given() -> None:
+    """Test that a fast window not shorter than the slow one is rejected."""
+    result = await compute_macd("AAPL", "close", "1y", "1d", fast=26, slow=12)
+
+    assert_that(result, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_insufficient_data_for_macd_given(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test that a slow window longer than the history is reported."""
+    with patch(
+        "technical_analysis_mcp.tools.compute_macd.fetch_price_history",
+        AsyncMock(return_value=make_price_history([100.0 + i for i in range(20)], period="1y", start=_START)),
+    ):
+        result = await compute_macd("AAPL", "close", "1y", "1d")
+
+    assert_that(result, is_(instance_of(Error)))
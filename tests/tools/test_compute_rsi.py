@@ -1,13 +1,16 @@
 """Test module for the compute_rsi tool."""
 
-from datetime import UTC, datetime
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from typing import cast
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from hamcrest import (
     all_of,
     assert_that,
     close_to,
+    contains_exactly,
     equal_to,
     greater_than,
     greater_than_or_equal_to,
@@ -17,268 +20,11 @@ from hamcrest import (
     less_than_or_equal_to,
 )
 
-from technical_analysis_mcp.models import Price, TimeSeries
-from technical_analysis_mcp.tools.compute_rsi import (
-    compute_average_gain_loss,
-    compute_price_deltas,
-    compute_rsi,
-    compute_rsi_values,
-    extract_price_data,
-    separate_gains_losses,
-)
-
-
-def test_should_extract_price_data_when_close_source_given() -> None:
-    """Test extracting price data with close source."""
-    prices = [
-        Price(
-            date=datetime(2024, 1, 1, tzinfo=UTC),
-            open=100.0,
-            high=105.0,
-            low=95.0,
-            close=102.0,
-            volume=1000,
-            dividends=0.0,
-            stock_splits=0.0,
-        ),
-        Price(
-            date=datetime(2024, 1, 2, tzinfo=UTC),
-            open=102.0,
-            high=107.0,
-            low=97.0,
-            close=105.0,
-            volume=1500,
-            dividends=0.0,
-            stock_splits=0.0,
-        ),
-    ]
-
-    result = extract_price_data(prices, "close")
-
-    assert_that(result, has_length(2))
-    assert_that(result[0][0], equal_to(prices[0].date))
-    assert_that(result[0][1], equal_to(102.0))
-    assert_that(result[1][0], equal_to(prices[1].date))
-    assert_that(result[1][1], equal_to(105.0))
-
-
-def test_should_extract_price_data_when_open_source_given() -> None:
-    """Test extracting price data with open source."""
-    prices = [
-        Price(
-            date=datetime(2024, 1, 1, tzinfo=UTC),
-            open=100.0,
-            high=105.0,
-            low=95.0,
-            close=102.0,
-            volume=1000,
-            dividends=0.0,
-            stock_splits=0.0,
-        ),
-    ]
-
-    result = extract_price_data(prices, "open")
-
-    assert_that(result, has_length(1))
-    assert_that(result[0][1], equal_to(100.0))
-
-
-def test_should_extract_price_data_when_high_source_given() -> None:
-    """Test extracting price data with high source."""
-    prices = [
-        Price(
-            date=datetime(2024, 1, 1, tzinfo=UTC),
-            open=100.0,
-            high=105.0,
-            low=95.0,
-            close=102.0,
-            volume=1000,
-            dividends=0.0,
-            stock_splits=0.0,
-        ),
-    ]
-
-    result = extract_price_data(prices, "high")
-
-    assert_that(result, has_length(1))
-    assert_that(result[0][1], equal_to(105.0))
-
-
-def test_should_extract_price_data_when_low_source_given() -> None:
-    """Test extracting price data with low source."""
-    prices = [
-        Price(
-            date=datetime(2024, 1, 1, tzinfo=UTC),
-            open=100.0,
-            high=105.0,
-            low=95.0,
-            close=102.0,
-            volume=1000,
-            dividends=0.0,
-            stock_splits=0.0,
-        ),
-    ]
-
-    result = extract_price_data(prices, "low")
-
-    assert_that(result, has_length(1))
-    assert_that(result[0][1], equal_to(95.0))
-
-
-def test_should_compute_price_deltas_when_prices_given() -> None:
-    """Test calculating price deltas."""
-    prices = [100.0, 102.0, 105.0, 103.0, 107.0]
-
-    result = compute_price_deltas(prices)
-
-    assert_that(result, has_length(5))
-    assert_that(result[0], equal_to(0.0))  # First delta is 0
-    assert_that(result[1], equal_to(2.0))  # 102 - 100
-    assert_that(result[2], equal_to(3.0))  # 105 - 102
-    assert_that(result[3], equal_to(-2.0))  # 103 - 105
-    assert_that(result[4], equal_to(4.0))  # 107 - 103
-
-
-def test_should_compute_price_deltas_when_single_price_given() -> None:
-    """Test calculating price deltas with single price."""
-    prices = [100.0]
-
-    result = compute_price_deltas(prices)
-
-    assert_that(result, has_length(1))
-    assert_that(result[0], equal_to(0.0))
-
-
-def test_should_compute_price_deltas_when_empty_list_given() -> None:
-    """Test calculating price deltas with empty list."""
-    prices: list[float] = []
-
-    result = compute_price_deltas(prices)
-
-    assert_that(result, has_length(0))
-
-
-def test_should_separate_gains_losses_when_deltas_given() -> None:
-    """Test separating gains and losses."""
-    deltas = [0.0, 2.0, 3.0, -2.0, 4.0, -1.0]
-
-    gains, losses = separate_gains_losses(deltas)
-
-    assert_that(gains, has_length(6))
-    assert_that(losses, has_length(6))
-    assert_that(gains, equal_to([0.0, 2.0, 3.0, 0.0, 4.0, 0.0]))
-    assert_that(losses, equal_to([0.0, 0.0, 0.0, 2.0, 0.0, 1.0]))
-
-
-def test_should_separate_gains_losses_when_all_positive_given() -> None:
-    """Test separating gains and losses with all positive deltas."""
-    deltas = [0.0, 1.0, 2.0, 3.0]
-
-    gains, losses = separate_gains_losses(deltas)
-
-    assert_that(gains, equal_to([0.0, 1.0, 2.0, 3.0]))
-    assert_that(losses, equal_to([0.0, 0.0, 0.0, 0.0]))
-
-
-def test_should_separate_gains_losses_when_all_negative_given() -> None:
-    """Test separating gains and losses with all negative deltas."""
-    deltas = [0.0, -1.0, -2.0, -3.0]
-
-    gains, losses = separate_gains_losses(deltas)
-
-    assert_that(gains, equal_to([0.0, 0.0, 0.0, 0.0]))
-    assert_that(losses, equal_to([0.0, 1.0, 2.0, 3.0]))
-
+from technical_analysis_mcp.models import Error, TimeSeries, TimeSeriesTable
+from technical_analysis_mcp.tools.compute_rsi import compute_rsi
+from technical_analysis_mcp.tools.fetch_asset_price_history import PriceHistory
 
-def test_should_compute_average_gain_loss_when_period_2_given() -> None:
-    """Test calculating average gain and loss with period 2."""
-    gains = [0.0, 2.0, 3.0, 0.0, 4.0, 0.0]
-    losses = [0.0, 0.0, 0.0, 2.0, 0.0, 1.0]
-    period = 2
-
-    avg_gains, avg_losses = compute_average_gain_loss(gains, losses, period)
-
-    assert_that(avg_gains, has_length(6))
-    assert_that(avg_losses, has_length(6))
-
-    assert_that(avg_gains[0], equal_to(0.0))
-    assert_that(avg_gains[1], equal_to(0.0))
-    assert_that(avg_losses[0], equal_to(0.0))
-    assert_that(avg_losses[1], equal_to(0.0))
-    assert_that(avg_gains[2], close_to(2.5, 0.001))
-    assert_that(avg_gains[3], close_to(1.25, 0.001))
-    assert_that(avg_gains[4], close_to(2.625, 0.001))
-    assert_that(avg_gains[5], close_to(1.3125, 0.001))
-    assert_that(avg_losses[2], equal_to(0.0))
-    assert_that(avg_losses[3], close_to(1.0, 0.001))
-    assert_that(avg_losses[4], close_to(0.5, 0.001))
-    assert_that(avg_losses[5], close_to(0.75, 0.001))
-
-
-def test_should_compute_average_gain_loss_when_period_3_given() -> None:
-    """Test calculating average gain and loss with period 3."""
-    gains = [0.0, 2.0, 3.0, 1.0, 4.0]
-    losses = [0.0, 0.0, 0.0, 2.0, 1.0]
-    period = 3
-
-    avg_gains, avg_losses = compute_average_gain_loss(gains, losses, period)
-
-    assert_that(avg_gains[3], close_to(2.0, 0.001))
-    assert_that(avg_gains[4], close_to(2.6667, 0.001))
-    assert_that(avg_losses[3], close_to(0.6667, 0.001))
-
-
-def test_should_compute_rsi_values_when_averages_given() -> None:
-    """Test calculating RSI values from average gains and losses."""
-    avg_gains = [0.0, 0.0, 0.0, 1.25, 2.625, 1.3125]
-    avg_losses = [0.0, 0.0, 0.0, 1.0, 0.5, 0.75]
-    period = 2
-
-    rsi_values = compute_rsi_values(avg_gains, avg_losses, period)
-
-    assert_that(rsi_values, has_length(6))
-    assert_that(rsi_values[0], equal_to(0.0))
-    assert_that(rsi_values[1], equal_to(0.0))
-    assert_that(rsi_values[2], close_to(100.0, 0.001))
-    assert_that(rsi_values[3], close_to(55.5556, 0.001))
-    assert_that(rsi_values[4], close_to(84.0, 0.001))
-    assert_that(rsi_values[5], close_to(63.6364, 0.001))
-
-
-def test_should_compute_rsi_values_when_zero_average_loss_given() -> None:
-    """Test calculating RSI when average loss is zero."""
-    avg_gains = [0.0, 0.0, 0.0, 2.5, 1.25]
-    avg_losses = [0.0, 0.0, 0.0, 0.0, 0.0]
-    period = 2
-
-    rsi_values = compute_rsi_values(avg_gains, avg_losses, period)
-
-    assert_that(rsi_values[3], close_to(100.0, 0.001))
-    assert_that(rsi_values[4], close_to(100.0, 0.001))
-
-
-def test_should_compute_rsi_values_when_zero_average_gain_given() -> None:
-    """Test calculating RSI when average gain is zero."""
-    avg_gains = [0.0, 0.0, 0.0, 0.0, 0.0]
-    avg_losses = [0.0, 0.0, 0.0, 2.0, 1.0]
-    period = 2
-
-    rsi_values = compute_rsi_values(avg_gains, avg_losses, period)
-
-    assert_that(rsi_values[3], close_to(0.0, 0.001))
-    assert_that(rsi_values[4], close_to(0.0, 0.001))
-
-
-def test_should_compute_rsi_values_when_both_averages_zero_given() -> None:
-    """Test calculating RSI when both averages are zero."""
-    avg_gains = [0.0, 0.0, 0.0, 0.0, 0.0]
-    avg_losses = [0.0, 0.0, 0.0, 0.0, 0.0]
-    period = 2
-
-    rsi_values = compute_rsi_values(avg_gains, avg_losses, period)
-
-    assert_that(rsi_values[3], close_to(100.0, 0.001))
-    assert_that(rsi_values[4], close_to(100.0, 0.001))
+_START = datetime(2024, 3, 11, tzinfo=UTC)
 
 
 @pytest.mark.asyncio
@@ -300,3 +46,62 @@ async def test_should_compute_rsi_when_valid_ticker_given() -> None:
 
     for data_point in time_series.data_points:
         assert_that(data_point.value, all_of(greater_than_or_equal_to(0), less_than_or_equal_to(100)))
+
+
+@pytest.mark.asyncio
+async def test_should_compute_rsi_of_source_when_history_given(make_price_history: Callable[..., PriceHistory]) -> None:
+    """Test computing RSI from the prices of the requested source."""
+    closes = [100.0, 102.0, 105.0, 103.0, 107.0, 106.0]
+    history = make_price_history(
+        closes,
+        period="5d",
+        highs=[close + 10.0 for close in closes],
+        lows=[close - 10.0 for close in closes],
+        start=_START,
+    )
+
+    with patch("technical_analysis_mcp.tools.compute_rsi.fetch_price_history", AsyncMock(return_value=history)):
+        result = await compute_rsi("AAPL", "close", "5d", "1d", candles=2)
+
+    assert_that(result, is_(instance_of(TimeSeries)))
+
+    if isinstance(result, TimeSeries):
+        assert_that(
+            [point.date for point in result.data_points], equal_to([_START + timedelta(days=i) for i in range(2, 6)])
+        )
+        assert_that(
+            [point.value for point in result.data_points],
+            contains_exactly(
+                close_to(100.0, 0.001),
+                close_to(55.5556, 0.001),
+                close_to(84.0, 0.001),
+                close_to(63.6364, 0.001),
+            ),
+        )
+
+
+@pytest.mark.asyncio
+async def test_given_list_of_candles_when_compute_rsi_then_returns_table_of_every_period(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test that a list of periods is swept into a table with a column per period."""
+    history = make_price_history([100.0, 102.0, 105.0, 103.0, 107.0, 106.0], period="5d")
+
+    with patch("technical_analysis_mcp.tools.compute_rsi.fetch_price_history", AsyncMock(return_value=history)):
+        result = await compute_rsi("AAPL", "close", "5d", "1d", candles=[2, 3], decimals=4)
+
+    assert_that(result, is_(instance_of(TimeSeriesTable)))
+    table = cast("TimeSeriesTable", result)
+
+    assert_that(table.columns, equal_to(["rsi_2", "rsi_3"]))
+    rsi_2, rsi_3 = table.values
+    assert_that(rsi_2, equal_to([100.0, 55.5556, 84.0, 63.6364]))
+    assert_that(rsi_3[0], is_(None))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_empty_list_of_candles_given() -> None:
+    """Test that an empty list of periods is rejected."""
+    result = await compute_rsi("AAPL", "close", "1mo", "1d", candles=[])
+
+    assert_that(result, is_(instance_of(Error)))
@@ -1,167 +1,34 @@
 """Test module for the compute_sma tool."""
 
-from datetime import UTC, datetime
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from typing import cast
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from hamcrest import (
     assert_that,
-    close_to,
     equal_to,
     greater_than,
     has_length,
     instance_of,
     is_,
+    same_instance,
 )
 
-from technical_analysis_mcp.models import Error, Price, TimeSeries
+from technical_analysis_mcp.cache import stream_indicator
+from technical_analysis_mcp.models import (
+    CompactTimeSeries,
+    Error,
+    TimeSeries,
+    TimeSeriesTable,
+)
 from technical_analysis_mcp.tools.compute_sma import (
     compute_sma,
-    compute_sma_values,
-    extract_price_data,
 )
+from technical_analysis_mcp.tools.fetch_asset_price_history import PriceHistory
 
-
-def test_should_extract_price_data_when_close_source_given() -> None:
-    """Test extracting price data with close source."""
-    prices = [
-        Price(
-            date=datetime(2024, 1, 1, tzinfo=UTC),
-            open=100.0,
-            high=105.0,
-            low=95.0,
-            close=102.0,
-            volume=1000,
-            dividends=0.0,
-            stock_splits=0.0,
-        ),
-        Price(
-            date=datetime(2024, 1, 2, tzinfo=UTC),
-            open=102.0,
-            high=107.0,
-            low=97.0,
-            close=105.0,
-            volume=1500,
-            dividends=0.0,
-            stock_splits=0.0,
-        ),
-    ]
-
-    result = extract_price_data(prices, "close")
-
-    assert_that(result, has_length(2))
-    assert_that(result[0][1], equal_to(102.0))
-    assert_that(result[1][1], equal_to(105.0))
-
-
-def test_should_extract_price_data_when_open_source_given() -> None:
-    """Test extracting price data with open source."""
-    prices = [
-        Price(
-            date=datetime(2024, 1, 1, tzinfo=UTC),
-            open=100.0,
-            high=105.0,
-            low=95.0,
-            close=102.0,
-            volume=1000,
-            dividends=0.0,
-            stock_splits=0.0,
-        ),
-    ]
-
-    result = extract_price_data(prices, "open")
-
-    assert_that(result, has_length(1))
-    assert_that(result[0][1], equal_to(100.0))
-
-
-def test_should_extract_price_data_when_high_source_given() -> None:
-    """Test extracting price data with high source."""
-    prices = [
-        Price(
-            date=datetime(2024, 1, 1, tzinfo=UTC),
-            open=100.0,
-            high=105.0,
-            low=95.0,
-            close=102.0,
-            volume=1000,
-            dividends=0.0,
-            stock_splits=0.0,
-        ),
-    ]
-
-    result = extract_price_data(prices, "high")
-
-    assert_that(result, has_length(1))
-    assert_that(result[0][1], equal_to(105.0))
-
-
-def test_should_extract_price_data_when_low_source_given() -> None:
-    """Test extracting price data with low source."""
-    prices = [
-        Price(
-            date=datetime(2024, 1, 1, tzinfo=UTC),
-            open=100.0,
-            high=105.0,
-            low=95.0,
-            close=102.0,
-            volume=1000,
-            dividends=0.0,
-            stock_splits=0.0,
-        ),
-    ]
-
-    result = extract_price_data(prices, "low")
-
-    assert_that(result, has_length(1))
-    assert_that(result[0][1], equal_to(95.0))
-
-
-def test_should_compute_sma_values_when_valid_data_given() -> None:
-    """Test computing SMA values with valid data."""
-    prices = [100.0, 102.0, 105.0, 103.0, 107.0, 110.0, 108.0]
-    period = 3
-
-    result = compute_sma_values(prices, period)
-
-    assert_that(result, has_length(5))  # 7-3+1 = 5
-    assert_that(result[0], close_to(102.3333, 0.001))  # (100+102+105)/3
-    assert_that(result[1], close_to(103.3333, 0.001))  # (102+105+103)/3
-    assert_that(result[2], close_to(105.0, 0.001))  # (105+103+107)/3
-    assert_that(result[3], close_to(106.6667, 0.001))  # (103+107+110)/3
-    assert_that(result[4], close_to(108.3333, 0.001))  # (107+110+108)/3
-
-
-def test_should_compute_sma_values_when_period_equals_length_given() -> None:
-    """Test computing SMA values when period equals data length."""
-    prices = [100.0, 102.0, 105.0]
-    period = 3
-
-    result = compute_sma_values(prices, period)
-
-    assert_that(result, has_length(1))
-    assert_that(result[0], close_to(102.3333, 0.001))
-
-
-def test_should_return_empty_list_when_insufficient_data_given() -> None:
-    """Test computing SMA values with insufficient data."""
-    prices = [100.0, 102.0]
-    period = 3
-
-    result = compute_sma_values(prices, period)
-
-    assert_that(result, has_length(0))
-
-
-def test_should_return_empty_list_when_zero_or_negative_period_given() -> None:
-    """Test computing SMA values with zero or negative period."""
-    prices = [100.0, 102.0, 105.0]
-
-    result_zero = compute_sma_values(prices, 0)
-    assert_that(result_zero, has_length(0))
-
-    result_negative = compute_sma_values(prices, -5)
-    assert_that(result_negative, has_length(0))
+_START = datetime(2024, 3, 15, 13, 30, tzinfo=UTC)
 
 
 @pytest.mark.asyncio
@@ -271,3 +138,120 @@ async def test_should_compute_sma_with_different_windows_given() -> None:
     # Window 20 should have fewer data points than window 10
     # (assuming we have at least 20 days of data)
     assert_that(len(time_series_20.data_points), equal_to(len(time_series_10.data_points) - 10))
+
+
+@pytest.mark.asyncio
+async def test_should_compute_compact_sma_when_compact_format_given(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test computing SMA in the compact layout."""
+    history = make_price_history([1.0, 2.0, 4.0, 8.0], period="1d", interval="5m", start=_START, frequency="5min")
+
+    with patch("technical_analysis_mcp.tools.compute_sma.fetch_price_history", AsyncMock(return_value=history)):
+        result = await compute_sma("AAPL", "close", "1d", "5m", window=3, format="compact", decimals=3)
+
+    assert_that(result, is_(instance_of(CompactTimeSeries)))
+
+    if isinstance(result, CompactTimeSeries):
+        assert_that(result.start, equal_to(int((_START + timedelta(minutes=10)).timestamp())))
+        assert_that(result.step, equal_to(300))
+        assert_that(result.values, equal_to([2.333, 4.667]))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_invalid_decimals_given() -> None:
+    """Test that a number of decimals out of range is rejected."""
+    result = await compute_sma("AAPL", "close", "1mo", "1d", decimals=-1)
+
+    assert_that(result, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_should_downsample_sma_when_max_points_given(make_price_history: Callable[..., PriceHistory]) -> None:
+    """Test that a long SMA series is reduced to at most the requested number of values."""
+    history = make_price_history(
+        [float(i % 17) for i in range(500)], period="5d", interval="5m", start=_START, frequency="5min"
+    )
+
+    with patch("technical_analysis_mcp.tools.compute_sma.fetch_price_history", AsyncMock(return_value=history)):
+        result = await compute_sma("AAPL", "close", "5d", "5m", window=3, max_points=40)
+
+    assert_that(result, is_(instance_of(TimeSeries)))
+
+    if isinstance(result, TimeSeries):
+        assert_that(result.data_points, has_length(40))
+        assert_that(result.data_points[0].date, equal_to(_START + timedelta(minutes=10)))
+        assert_that(result.data_points[-1].date, equal_to(_START + timedelta(minutes=5 * 499)))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_non_positive_max_points_given() -> None:
+    """Test that a maximum number of values below one is rejected."""
+    result = await compute_sma("AAPL", "close", "1mo", "1d", max_points=0)
+
+    assert_that(result, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_should_serve_identical_request_from_memory_when_bars_unchanged(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test that an identical request over the same bars returns the remembered result."""
+    history = make_price_history([1.0, 2.0, 4.0, 8.0], period="1d", interval="5m", start=_START, frequency="5min")
+
+    with (
+        patch("technical_analysis_mcp.tools.compute_sma.fetch_price_history", AsyncMock(return_value=history)),
+        patch("technical_analysis_mcp.tools.compute_sma.stream_indicator", wraps=stream_indicator) as stream_mock,
+    ):
+        first = await compute_sma("AAPL", "close", "1d", "5m", window=3)
+        second = await compute_sma("AAPL", "close", "1d", "5m", window=3)
+        compact = await compute_sma("AAPL", "close", "1d", "5m", window=3, format="compact")
+
+    assert_that(second, is_(same_instance(first)))
+    assert_that(compact, is_(instance_of(CompactTimeSeries)))
+    assert_that(stream_mock.call_count, equal_to(2))
+
+
+@pytest.mark.asyncio
+async def test_given_list_of_windows_when_compute_sma_then_returns_table_of_every_window(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test that a list of windows is swept into a table with a column per window."""
+    history = make_price_history([1.0, 2.0, 4.0, 8.0], period="1d", interval="5m", start=_START, frequency="5min")
+    fetch = AsyncMock(return_value=history)
+
+    with patch("technical_analysis_mcp.tools.compute_sma.fetch_price_history", fetch):
+        result = await compute_sma("AAPL", "close", "1d", "5m", window=[3, 2, 3, 5], decimals=2)
+
+    fetch.assert_awaited_once()
+    assert_that(result, is_(instance_of(TimeSeriesTable)))
+    table = cast("TimeSeriesTable", result)
+
+    assert_that(table.start, equal_to(int((_START + timedelta(minutes=5)).timestamp())))
+    assert_that(table.columns, equal_to(["sma_3", "sma_2", "sma_5"]))
+    assert_that(table.values, equal_to([[None, 2.33, 4.67], [1.5, 3.0, 6.0], [None, None, None]]))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_empty_list_of_windows_given() -> None:
+    """Test that an empty list of windows is rejected."""
+    result = await compute_sma("AAPL", "close", "1mo", "1d", window=[])
+
+    assert_that(result, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_list_of_windows_with_non_positive_window_given() -> None:
+    """Test that a list of windows with a window below one is rejected."""
+    result = await compute_sma("AAPL", "close", "1mo", "1d", window=[20, 0])
+
+    assert_that(result, is_(instance_of(Error)))
+    assert_that(cast("Error", result).what, equal_to("SMA window must be positive, got: 0"))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_list_of_windows_with_max_points_given() -> None:
+    """Test that a sweep rejects a maximum number of values."""
+    result = await compute_sma("AAPL", "close", "1mo", "1d", window=[5, 20], max_points=10)
+
+    assert_that(result, is_(instance_of(Error)))
@@ -0,0 +1,115 @@
+"""Test module for the stochastic oscillator, Williams %R and Donchian channels tools."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from hamcrest import assert_that, close_to, contains_exactly, equal_to, instance_of, is_
+
+from technical_analysis_mcp.models import Error, TimeSeries, TimeSeriesTable
+from technical_analysis_mcp.tools.compute_donchian_channels import compute_donchian_channels
+from technical_analysis_mcp.tools.compute_stochastic import compute_stochastic
+from technical_analysis_mcp.tools.compute_williams_r import compute_williams_r
+from technical_analysis_mcp.tools.fetch_asset_price_history import PriceHistory
+
+_START = datetime(2024, 3, 11, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_should_compute_stochastic_table_when_history_given(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test computing %K and %D as one table from the first complete window."""
+    history = make_price_history(
+        [9.0, 11.0, 10.5, 12.0, 12.0],
+        highs=[10.0, 12.0, 11.0, 13.0, 12.0],
+        lows=[8.0, 9.0, 10.0, 11.0, 12.0],
+        start=_START,
+    )
+    fetch = AsyncMock(return_value=history)
+
+    with patch("technical_analysis_mcp.tools.compute_stochastic.fetch_price_history", fetch):
+        result = await compute_stochastic("AAPL", "1mo", "1d", window=3, smoothing=2)
+
+    assert_that(result, is_(instance_of(TimeSeriesTable)))
+    table = cast("TimeSeriesTable", result)
+
+    assert_that(table.start, equal_to(int((_START + timedelta(days=2)).timestamp())))
+    assert_that(table.columns, equal_to(["k", "d"]))
+    assert_that(table.values, equal_to([[62.5, 75.0, 66.666667], [None, 68.75, 70.833333]]))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_non_positive_stochastic_smoothing_given() -> None:
+    """Test that a smoothing below one is rejected."""
+    result = await compute_stochastic("AAPL", "1mo", "1d", smoothing=0)
+
+    assert_that(result, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_should_compute_williams_r_when_history_given(make_price_history: Callable[..., PriceHistory]) -> None:
+    """Test computing the Williams %R from the first complete window."""
+    fetch = AsyncMock(
+        return_value=make_price_history(
+            [9.0, 11.0, 10.5, 12.0, 12.0],
+            highs=[10.0, 12.0, 11.0, 13.0, 12.0],
+            lows=[8.0, 9.0, 10.0, 11.0, 12.0],
+            start=_START,
+        )
+    )
+
+    with patch("technical_analysis_mcp.tools.compute_williams_r.fetch_price_history", fetch):
+        result = await compute_williams_r("AAPL", "1mo", "1d", candles=3)
+
+    assert_that(result, is_(instance_of(TimeSeries)))
+    assert_that(
+        [point.value for point in cast("TimeSeries", result).data_points],
+        contains_exactly(close_to(-37.5, 1e-9), close_to(-25.0, 1e-9), close_to(-100 / 3, 1e-9)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_insufficient_data_for_williams_r_given(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test that a window longer than the history is reported."""
+    fetch = AsyncMock(
+        return_value=make_price_history(
+            [9.0, 11.0, 10.5, 12.0, 12.0],
+            highs=[10.0, 12.0, 11.0, 13.0, 12.0],
+            lows=[8.0, 9.0, 10.0, 11.0, 12.0],
+            start=_START,
+        )
+    )
+
+    with patch("technical_analysis_mcp.tools.compute_williams_r.fetch_price_history", fetch):
+        result = await compute_williams_r("AAPL", "1mo", "1d", candles=6)
+
+    assert_that(result, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_should_compute_donchian_table_when_history_given(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test computing the upper, middle and lower channels as one table."""
+    fetch = AsyncMock(
+        return_value=make_price_history(
+            [9.0, 11.0, 10.5, 12.0, 12.0],
+            highs=[10.0, 12.0, 11.0, 13.0, 12.0],
+            lows=[8.0, 9.0, 10.0, 11.0, 12.0],
+            start=_START,
+        )
+    )
+
+    with patch("technical_analysis_mcp.tools.compute_donchian_channels.fetch_price_history", fetch):
+        result = await compute_donchian_channels("AAPL", "1mo", "1d", window=3)
+
+    assert_that(result, is_(instance_of(TimeSeriesTable)))
+    assert_that(
+        cast("TimeSeriesTable", result).values,
+        equal_to([[12.0, 13.0, 13.0], [10.0, 11.0, 11.5], [8.0, 9.0, 10.0]]),
+    )
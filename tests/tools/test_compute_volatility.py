@@ -0,0 +1,50 @@
+"""Test module for the compute_volatility tool."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from hamcrest import assert_that, equal_to, has_length, instance_of, is_, none, not_none
+
+from technical_analysis_mcp.models import Error, TimeSeriesTable
+from technical_analysis_mcp.tools.compute_volatility import compute_volatility
+from technical_analysis_mcp.tools.fetch_asset_price_history import PriceHistory
+
+
+@pytest.mark.asyncio
+async def test_should_compute_volatility_table_when_history_given(
+    make_price_history: Callable[..., PriceHistory],
+) -> None:
+    """Test estimating the volatility with every estimator from the first complete window."""
+    start = datetime(2024, 3, 11, tzinfo=UTC)
+    history = make_price_history(
+        [101.0 + i for i in range(10)],
+        opens=[100.0 + i for i in range(10)],
+        highs=[102.0 + i + i % 3 for i in range(10)],
+        lows=[98.0 + i - i % 2 for i in range(10)],
+        start=start,
+    )
+    fetch = AsyncMock(return_value=history)
+
+    with patch("technical_analysis_mcp.tools.compute_volatility.fetch_price_history", fetch):
+        result = await compute_volatility("AAPL", "1mo", "1d", window=5)
+
+    assert_that(result, is_(instance_of(TimeSeriesTable)))
+    table = cast("TimeSeriesTable", result)
+
+    assert_that(table.start, equal_to(int((start + timedelta(days=4)).timestamp())))
+    assert_that(table.columns, equal_to(["parkinson", "garman_klass", "yang_zhang"]))
+    parkinson, _, yang_zhang = table.values
+    assert_that(parkinson, has_length(6))
+    assert_that(yang_zhang[0], is_(none()))
+    assert_that(yang_zhang[1], is_(not_none()))
+
+
+@pytest.mark.asyncio
+async def test_should_return_error_when_volatility_window_below_two_given() -> None:
+    """Test that a window of a single bar is rejected."""
+    result = await compute_volatility("AAPL", "1mo", "1d", window=1)
+
+    assert_that(result, is_(instance_of(Error)))
@@ -0,0 +1,158 @@
+"""Test module for the fetch_asset_price_histories tool."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import cast
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from hamcrest import (
+    assert_that,
+    contains_exactly,
+    equal_to,
+    has_entries,
+    has_length,
+    has_properties,
+    instance_of,
+    is_,
+)
+
+from technical_analysis_mcp.cache import PriceStore, StoredSeries, get_price_cache
+from technical_analysis_mcp.models import AssetPriceHistories, AssetPriceHistory, Error
+from technical_analysis_mcp.tools import fetch_asset_price_histories
+
+
+@pytest.mark.asyncio
+async def test_given_empty_tickers_when_fetch_asset_price_histories_then_returns_error() -> None:
+    """Test fetching the price histories of no tickers."""
+    result = await fetch_asset_price_histories([], "1mo", "1d")
+
+    assert_that(result, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_given_several_tickers_when_fetch_asset_price_histories_then_downloads_missing_in_bulk(
+    tmp_path: Path, make_bars: Callable[..., pd.DataFrame]
+) -> None:
+    """Test that cached tickers are served from memory and the rest downloaded together."""
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=3, name="Date")
+    get_price_cache().put(("MSFT", "1d"), StoredSeries("1y", make_bars(index, [300.0] * 3)), expires_at=float("inf"))
+    download = pd.concat(
+        {
+            "AAPL": make_bars(index, [100.0, 101.0, 102.0]),
+            "INVALID_TICKER": make_bars(index, [float("nan")] * 3),
+        },
+        axis=1,
+    )
+
+    with (
+        patch(
+            "technical_analysis_mcp.tools.fetch_asset_price_histories.get_price_store",
+            return_value=PriceStore(tmp_path / "prices.sqlite3"),
+        ),
+        patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.download", return_value=download) as mock,
+    ):
+        result = await fetch_asset_price_histories(["AAPL", "msft", "INVALID_TICKER"], "5d", "1d")
+
+    assert_that(mock.call_args.args[0], contains_exactly("AAPL", "INVALID_TICKER"))
+    assert_that(result, is_(instance_of(AssetPriceHistories)))
+
+    if isinstance(result, AssetPriceHistories):
+        assert_that(result.histories["AAPL"], is_(instance_of(AssetPriceHistory)))
+        assert_that(result.histories["msft"], is_(instance_of(AssetPriceHistory)))
+        assert_that(result.histories["INVALID_TICKER"], is_(instance_of(Error)))
+
+        history = result.histories["AAPL"]
+
+        if isinstance(history, AssetPriceHistory):
+            assert_that(history.prices, has_length(3))
+            assert_that(history.prices[-1].close, equal_to(102.0))
+
+
+@pytest.mark.asyncio
+async def test_given_stored_longer_period_when_fetch_asset_price_histories_then_keeps_stored_bars(
+    tmp_path: Path, make_bars: Callable[..., pd.DataFrame]
+) -> None:
+    """Test that a bulk request of a short period only downloads the tail of a longer stored period."""
+    store = PriceStore(tmp_path / "prices.sqlite3")
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=300, name="Date")
+    closes = [100.0] * 300
+    store.save("AAPL", "1d", "max", make_bars(index, closes))
+    tails = pd.concat({"AAPL": make_bars(index[-2:], closes[-2:])}, axis=1)
+
+    with (
+        patch("technical_analysis_mcp.tools.fetch_asset_price_histories.get_price_store", return_value=store),
+        patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.download", return_value=tails) as mock,
+    ):
+        result = await fetch_asset_price_histories(["AAPL"], "5d", "1d")
+
+    stored = store.load("AAPL", "1d")
+
+    mock.assert_called_once()
+    assert_that(mock.call_args.kwargs, has_entries(start=index[-2]))
+    assert_that(result, is_(instance_of(AssetPriceHistories)))
+    assert_that(stored, has_properties(period="max", bars=has_length(300)))
+
+    if isinstance(result, AssetPriceHistories):
+        assert_that(result.histories["AAPL"], has_properties(prices=has_length(5)))
+
+
+@pytest.mark.asyncio
+async def test_given_several_stored_tickers_when_fetch_asset_price_histories_then_downloads_tails_in_bulk(
+    tmp_path: Path, make_bars: Callable[..., pd.DataFrame]
+) -> None:
+    """Test that the tails of stored tickers are downloaded together, from the earliest stored bar."""
+    store = PriceStore(tmp_path / "prices.sqlite3")
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=30, name="Date")
+    store.save("AAPL", "1d", "1mo", make_bars(index[:-3], [100.0] * 27))
+    store.save("MSFT", "1d", "1mo", make_bars(index[:-1], [300.0] * 29))
+    tails = pd.concat(
+        {
+            "AAPL": make_bars(index[-5:], [100.0, 101.0, 102.0, 103.0, 104.0]),
+            "MSFT": make_bars(index[-5:], [300.0] * 5),
+        },
+        axis=1,
+    )
+
+    with (
+        patch("technical_analysis_mcp.tools.fetch_asset_price_histories.get_price_store", return_value=store),
+        patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.download", return_value=tails) as mock,
+    ):
+        result = await fetch_asset_price_histories(["AAPL", "MSFT"], "5d", "1d")
+
+    mock.assert_called_once()
+    assert_that(mock.call_args.args[0], contains_exactly("AAPL", "MSFT"))
+    assert_that(mock.call_args.kwargs, has_entries(start=index[-5]))
+    assert_that(store.load("AAPL", "1d"), has_properties(bars=has_length(30)))
+
+    if isinstance(result, AssetPriceHistories):
+        assert_that(result.histories["AAPL"], has_properties(prices=has_length(5)))
+        assert_that(result.histories["MSFT"], has_properties(prices=has_length(5)))
+        assert_that(cast("AssetPriceHistory", result.histories["AAPL"]).prices[-1].close, equal_to(104.0))
+
+
+@pytest.mark.asyncio
+async def test_given_readjusted_longer_period_when_fetch_asset_price_histories_then_downloads_stored_period(
+    tmp_path: Path, make_bars: Callable[..., pd.DataFrame]
+) -> None:
+    """Test that a stale longer stored period is downloaded again instead of the short requested one."""
+    store = PriceStore(tmp_path / "prices.sqlite3")
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=60, name="Date")
+    store.save("AAPL", "1d", "3mo", make_bars(index, [100.0] * 60))
+    tails = pd.concat({"AAPL": make_bars(index[-2:], [99.0, 99.0])}, axis=1)
+    history = pd.concat({"AAPL": make_bars(index, [99.0] * 60)}, axis=1)
+
+    with (
+        patch("technical_analysis_mcp.tools.fetch_asset_price_histories.get_price_store", return_value=store),
+        patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.download") as mock,
+    ):
+        mock.side_effect = [tails, history]
+        result = await fetch_asset_price_histories(["AAPL"], "5d", "1d")
+
+    assert_that(mock.call_args.kwargs, has_entries(period="3mo"))
+    assert_that(store.load("AAPL", "1d"), has_properties(period="3mo", bars=has_length(60)))
+    assert_that(result, is_(instance_of(AssetPriceHistories)))
+
+    if isinstance(result, AssetPriceHistories):
+        assert_that(result.histories["AAPL"], has_properties(prices=has_length(5)))
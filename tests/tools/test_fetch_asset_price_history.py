@@ -1,17 +1,32 @@
 """Test module for the fetch_asset_price_history tool."""
 
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
 import pytest
 from hamcrest import (
     assert_that,
+    calling,
     empty,
+    equal_to,
+    has_length,
     has_properties,
     instance_of,
     is_,
+    none,
     not_,
+    raises,
 )
 
-from technical_analysis_mcp.models import AssetPriceHistory, Error
+from technical_analysis_mcp.cache import PriceStore, get_price_cache
+from technical_analysis_mcp.models import AssetPriceHistory, Error, Interval
+from technical_analysis_mcp.providers import FileProvider
 from technical_analysis_mcp.tools import fetch_asset_price_history
+from technical_analysis_mcp.tools.fetch_asset_price_history import build_asset_price_history, load_price_bars
 
 
 @pytest.mark.asyncio
@@ -76,3 +91,292 @@ async def test_given_edge_case_interval_when_fetch_asset_price_history_then_retu
     if isinstance(result, AssetPriceHistory):
         assert_that(result, has_properties(ticker=ticker, period=period, interval=interval))
         assert_that(result.prices, is_(not_(empty())))
+
+
+def test_given_stored_bars_when_load_price_bars_then_downloads_only_tail(
+    tmp_path: Path, make_bars: Callable[..., pd.DataFrame]
+) -> None:
+    """Test that stored bars are completed with a download of the tail only."""
+    store = PriceStore(tmp_path / "prices.sqlite3")
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=40, name="Date")
+    closes = [100.0 + i for i in range(40)]
+    store.save("AAPL", "1d", "3mo", make_bars(index[:-1], closes[:-1]))
+    tail = make_bars(index[-3:], [closes[-3], 200.0, 201.0])
+
+    with (
+        patch("technical_analysis_mcp.tools.fetch_asset_price_history.get_price_store", return_value=store),
+        patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.Ticker") as ticker_mock,
+    ):
+        ticker_mock.return_value.history.return_value = tail
+        bars = load_price_bars("AAPL", "3mo", "1d")
+
+    ticker_mock.return_value.history.assert_called_once_with(start=index[-3], interval="1d")
+    assert_that(bars["Close"].tolist()[-3:], equal_to([closes[-3], 200.0, 201.0]))
+    assert_that(bars.index[0], equal_to(index[0]))
+
+
+def test_given_readjusted_history_when_load_price_bars_then_downloads_whole_period(
+    tmp_path: Path, make_bars: Callable[..., pd.DataFrame]
+) -> None:
+    """Test that a changed overlapping bar triggers a download of the whole period."""
+    store = PriceStore(tmp_path / "prices.sqlite3")
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=10, name="Date")
+    store.save("AAPL", "1d", "1mo", make_bars(index, [100.0] * 10))
+    tail = make_bars(index[-2:], [99.0, 99.0])
+    history = make_bars(index, [99.0] * 10)
+
+    with (
+        patch("technical_analysis_mcp.tools.fetch_asset_price_history.get_price_store", return_value=store),
+        patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.Ticker") as ticker_mock,
+    ):
+        ticker_mock.return_value.history.side_effect = [tail, history]
+        bars = load_price_bars("AAPL", "1mo", "1d")
+
+    ticker_mock.return_value.history.assert_called_with(period="1mo", interval="1d")
+    assert_that(bars["Close"].tolist(), equal_to([99.0] * 10))
+
+
+def test_given_readjusted_longer_period_when_load_price_bars_then_downloads_stored_period(
+    tmp_path: Path, make_bars: Callable[..., pd.DataFrame]
+) -> None:
+    """Test that a stale longer stored period is downloaded again instead of the short requested one."""
+    store = PriceStore(tmp_path / "prices.sqlite3")
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=60, name="Date")
+    store.save("AAPL", "1d", "3mo", make_bars(index, [100.0] * 60))
+    tail = make_bars(index[-2:], [99.0, 99.0])
+    history = make_bars(index, [99.0] * 60)
+
+    with (
+        patch("technical_analysis_mcp.tools.fetch_asset_price_history.get_price_store", return_value=store),
+        patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.Ticker") as ticker_mock,
+    ):
+        ticker_mock.return_value.history.side_effect = [tail, history]
+        bars = load_price_bars("AAPL", "5d", "1d")
+
+    ticker_mock.return_value.history.assert_called_with(period="3mo", interval="1d")
+    assert_that(bars, has_length(5))
+    assert_that(store.load("AAPL", "1d"), has_properties(period="3mo", bars=has_length(60)))
+
+
+@pytest.mark.asyncio
+async def test_given_repeated_request_when_fetch_asset_price_history_then_serves_from_memory(
+    make_bars: Callable[..., pd.DataFrame],
+) -> None:
+    """Test that a repeated request does not load the bars again."""
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=5, name="Date")
+
+    with patch(
+        "technical_analysis_mcp.tools.fetch_asset_price_history.load_price_bars",
+        return_value=make_bars(index, [100.0] * 5),
+    ) as load_mock:
+        first = await fetch_asset_price_history("AAPL", "5d", "1d")
+        second = await fetch_asset_price_history("aapl", "5d", "1d")
+
+    load_mock.assert_called_once()
+    assert_that(first, is_(instance_of(AssetPriceHistory)))
+    assert_that(second, is_(instance_of(AssetPriceHistory)))
+
+
+@pytest.mark.asyncio
+async def test_given_cached_bars_when_fetch_asset_price_history_then_gets_reference_off_event_loop(
+    make_bars: Callable[..., pd.DataFrame],
+) -> None:
+    """Test that the provider is asked for the period reference in the I/O thread pool."""
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=5, name="Date")
+    threads: list[threading.Thread] = []
+
+    def period_reference(ticker: str, interval: Interval, now: datetime) -> datetime:  # noqa: ARG001
+        threads.append(threading.current_thread())
+        return now
+
+    with (
+        patch(
+            "technical_analysis_mcp.tools.fetch_asset_price_history.load_price_bars",
+            return_value=make_bars(index, [100.0] * 5),
+        ),
+        patch("technical_analysis_mcp.providers.YahooFinanceProvider.period_reference", side_effect=period_reference),
+    ):
+        await fetch_asset_price_history("AAPL", "5d", "1d")
+        await fetch_asset_price_history("AAPL", "5d", "1d")
+
+    assert_that(threads, has_length(2))
+    assert_that(threading.main_thread() in threads, is_(False))
+
+
+@pytest.mark.asyncio
+async def test_given_cached_longer_period_when_fetch_asset_price_history_then_does_not_load(
+    make_bars: Callable[..., pd.DataFrame],
+) -> None:
+    """Test that a shorter period is sliced out of the cached bars of a longer one."""
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=300, name="Date")
+
+    with patch(
+        "technical_analysis_mcp.tools.fetch_asset_price_history.load_price_bars",
+        return_value=make_bars(index, [100.0] * 300),
+    ) as load_mock:
+        await fetch_asset_price_history("AAPL", "max", "1d")
+        result = await fetch_asset_price_history("AAPL", "5d", "1d")
+
+    load_mock.assert_called_once()
+    assert_that(result, is_(instance_of(AssetPriceHistory)))
+
+    if isinstance(result, AssetPriceHistory):
+        assert_that(result.prices, has_length(5))
+
+
+@pytest.mark.asyncio
+async def test_given_max_points_when_fetch_asset_price_history_then_aggregates_bars(
+    make_bars: Callable[..., pd.DataFrame],
+) -> None:
+    """Test that a long history is aggregated into at most the requested number of bars."""
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=300, name="Date")
+
+    with patch(
+        "technical_analysis_mcp.tools.fetch_asset_price_history.load_price_bars",
+        return_value=make_bars(index, [100.0 + i for i in range(300)]),
+    ):
+        result = await fetch_asset_price_history("AAPL", "2y", "1d", max_points=50)
+
+    assert_that(result, is_(instance_of(AssetPriceHistory)))
+
+    if isinstance(result, AssetPriceHistory):
+        assert_that(result.prices, has_length(50))
+        assert_that(result.prices[-1].close, equal_to(399.0))
+        assert_that(sum(price.volume for price in result.prices), equal_to(300_000))
+
+
+@pytest.mark.asyncio
+async def test_given_non_positive_max_points_when_fetch_asset_price_history_then_returns_error() -> None:
+    """Test that a maximum number of bars below one is rejected."""
+    result = await fetch_asset_price_history("AAPL", "1mo", "1d", max_points=0)
+
+    assert_that(result, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_given_limit_when_fetch_asset_price_history_then_pages_with_cursor(
+    make_bars: Callable[..., pd.DataFrame],
+) -> None:
+    """Test that a limited request returns a cursor to the following page."""
+    index = pd.bdate_range(end=pd.Timestamp.now(tz="America/New_York").normalize(), periods=5, name="Date")
+
+    with patch(
+        "technical_analysis_mcp.tools.fetch_asset_price_history.load_price_bars",
+        return_value=make_bars(index, [100.0, 101.0, 102.0, 103.0, 104.0]),
+    ):
+        first = await fetch_asset_price_history("AAPL", "5d", "1d", limit=3)
+        cursor = first.next_cursor if isinstance(first, AssetPriceHistory) else None
+        second = await fetch_asset_price_history("AAPL", "5d", "1d", limit=3, cursor=cursor)
+
+    assert_that(first, is_(instance_of(AssetPriceHistory)))
+    assert_that(second, is_(instance_of(AssetPriceHistory)))
+
+    if isinstance(first, AssetPriceHistory) and isinstance(second, AssetPriceHistory):
+        assert_that([price.close for price in first.prices], equal_to([100.0, 101.0, 102.0]))
+        assert_that([price.close for price in second.prices], equal_to([103.0, 104.0]))
+        assert_that(second.next_cursor, is_(none()))
+
+
+@pytest.mark.asyncio
+async def test_given_start_and_end_when_fetch_asset_price_history_then_downloads_only_range(
+    make_bars: Callable[..., pd.DataFrame],
+) -> None:
+    """Test that an explicit range is requested from the provider instead of the period."""
+    index = pd.bdate_range("2024-03-04", periods=5, tz="America/New_York", name="Date")
+    start, end = index.to_list()[1], index.to_list()[4]
+
+    with patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.Ticker") as ticker_mock:
+        ticker_mock.return_value.history.return_value = make_bars(index[1:], [101.0, 102.0, 103.0, 104.0])
+        result = await fetch_asset_price_history("AAPL", "max", "1d", start=start, end=end)
+
+    ticker_mock.return_value.history.assert_called_once_with(start=start, end=end, interval="1d")
+    assert_that(result, is_(instance_of(AssetPriceHistory)))
+
+    if isinstance(result, AssetPriceHistory):
+        assert_that([price.close for price in result.prices], equal_to([101.0, 102.0, 103.0]))
+
+
+@pytest.mark.asyncio
+async def test_given_invalid_range_when_fetch_asset_price_history_then_returns_error() -> None:
+    """Test that empty ranges, invalid cursors and limits below one are rejected."""
+    start = datetime(2024, 3, 15, tzinfo=UTC)
+
+    empty_range = await fetch_asset_price_history("AAPL", "1mo", "1d", start=start, end=start)
+    invalid_cursor = await fetch_asset_price_history("AAPL", "1mo", "1d", cursor="not a cursor")
+    invalid_limit = await fetch_asset_price_history("AAPL", "1mo", "1d", limit=0)
+
+    assert_that(empty_range, is_(instance_of(Error)))
+    assert_that(invalid_cursor, is_(instance_of(Error)))
+    assert_that(invalid_limit, is_(instance_of(Error)))
+
+
+@pytest.mark.asyncio
+async def test_given_repeated_request_without_data_when_fetch_asset_price_history_then_does_not_load_again() -> None:
+    """Test that an empty history is remembered instead of being downloaded again."""
+    with patch(
+        "technical_analysis_mcp.tools.fetch_asset_price_history.load_price_bars",
+        return_value=pd.DataFrame(),
+    ) as load_mock:
+        first = await fetch_asset_price_history("UNKNOWN", "5d", "1d")
+        second = await fetch_asset_price_history("unknown", "5d", "1d")
+
+    load_mock.assert_called_once()
+    assert_that(first, is_(instance_of(Error)))
+    assert_that(second, equal_to(first))
+
+
+@pytest.mark.asyncio
+async def test_given_file_provider_when_same_period_fetched_twice_then_returns_same_bars(
+    tmp_path: Path, make_bars: Callable[..., pd.DataFrame]
+) -> None:
+    """Test that periods served from the store or memory start where the file provider starts them."""
+    index = pd.bdate_range(end="2023-06-30", periods=390, tz="America/New_York", name="Date")
+    (tmp_path / "files" / "AAPL").mkdir(parents=True)
+    make_bars(index, [100.0 + i for i in range(390)]).to_csv(tmp_path / "files" / "AAPL" / "1d.csv")
+    provider = FileProvider(tmp_path / "files")
+
+    with (
+        patch("technical_analysis_mcp.tools.fetch_asset_price_history.get_provider", return_value=provider),
+        patch(
+            "technical_analysis_mcp.tools.fetch_asset_price_history.get_price_store",
+            return_value=PriceStore(tmp_path / "prices.sqlite3"),
+        ),
+    ):
+        first = await fetch_asset_price_history("AAPL", "1mo", "1d")
+        get_price_cache().clear()
+        second = await fetch_asset_price_history("AAPL", "1mo", "1d")
+        whole = await fetch_asset_price_history("AAPL", "max", "1d")
+        sliced = await fetch_asset_price_history("AAPL", "6mo", "1d")
+
+    assert_that(first, has_properties(prices=has_length(len(provider.history("AAPL", "1mo", "1d")))))
+    assert_that(second, equal_to(first))
+    assert_that(whole, has_properties(prices=has_length(390)))
+    assert_that(sliced, has_properties(prices=has_length(len(provider.history("AAPL", "6mo", "1d")))))
+
+
+def test_given_bars_when_build_asset_price_history_then_converts_every_column(
+    make_bars: Callable[..., pd.DataFrame],
+) -> None:
+    """Test the column-wise conversion of bars into prices."""
+    index = pd.DatetimeIndex(["2024-03-08", "2024-03-11"], name="Date").tz_localize("America/New_York")
+    bars = make_bars(index, [100.0, 101.5])
+    bars["Stock Splits"] = [0.0, 4.0]
+
+    result = build_asset_price_history("AAPL", "5d", "1d", bars)
+
+    assert_that(result, is_(instance_of(AssetPriceHistory)))
+
+    if isinstance(result, AssetPriceHistory):
+        assert_that(result.prices[1].date.isoformat(), equal_to("2024-03-11T00:00:00-04:00"))
+        assert_that(result.prices[1], has_properties(close=101.5, volume=1000, stock_splits=4.0))
+
+
+def test_given_bars_without_volume_when_build_asset_price_history_then_raises_value_error(
+    make_bars: Callable[..., pd.DataFrame],
+) -> None:
+    """Test that a missing volume is rejected."""
+    index = pd.bdate_range("2024-03-11", periods=2, tz="America/New_York", name="Date")
+    bars = make_bars(index, [100.0, 101.0])
+    bars["Volume"] = [1000.0, float("nan")]
+
+    assert_that(calling(build_asset_price_history).with_args("AAPL", "5d", "1d", bars), raises(ValueError))
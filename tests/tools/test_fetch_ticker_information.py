@@ -1,17 +1,36 @@
 """Test fetch_ticker_information function."""
 
+from typing import Any
+from unittest.mock import patch
+
 import pytest
 from hamcrest import (
     assert_that,
     empty,
+    equal_to,
     has_properties,
     instance_of,
     is_,
+    none,
     not_,
 )
 
+from technical_analysis_mcp.cache import (
+    find_error,
+    get_market_information_cache,
+)
 from technical_analysis_mcp.models import Error, TickerInformation
 from technical_analysis_mcp.tools import fetch_ticker_information
+from technical_analysis_mcp.tools.fetch_ticker_information import download_ticker_information
+
+INFO: dict[str, Any] = {
+    "symbol": "MSFT",
+    "shortName": "Microsoft Corporation",
+    "sector": "Technology",
+    "industry": "Software - Infrastructure",
+    "regularMarketPrice": 400.0,
+    "sharesOutstanding": 7_430_000_000,
+}
 
 
 @pytest.mark.asyncio
@@ -33,3 +52,60 @@ async def test_given_invalid_ticker_when_fetch_ticker_information_then_returns_e
     if isinstance(result, Error):
         assert_that(result.what, is_(str))
         assert_that(result.what, is_(not_(empty())))
+
+
+def test_given_unknown_ticker_when_download_ticker_information_then_returns_error_without_isin_lookup() -> None:
+    """Test that the validity of a ticker is decided from the information payload alone."""
+    with patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.Ticker") as ticker_mock:
+        ticker_mock.return_value.info = {"trailingPegRatio": None}
+        result = download_ticker_information("UNKNOWN")
+
+    assert_that(result, is_(instance_of(Error)))
+    ticker_mock.return_value.get_isin.assert_not_called()
+
+
+def test_given_cached_information_when_download_ticker_information_then_does_not_download() -> None:
+    """Test that fresh ticker information is served from memory."""
+    with patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.Ticker") as ticker_mock:
+        ticker_mock.return_value.info = INFO
+        download_ticker_information("MSFT")
+        result = download_ticker_information("msft")
+
+    ticker_mock.assert_called_once()
+    assert_that(result, has_properties(symbol="MSFT", market_price=400.0))
+
+
+def test_given_expired_market_information_when_download_ticker_information_then_refreshes_market_fields() -> None:
+    """Test that market fields are refreshed while static fields are kept."""
+    with patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.Ticker") as ticker_mock:
+        ticker_mock.return_value.info = INFO
+        download_ticker_information("MSFT")
+        get_market_information_cache().clear()
+        ticker_mock.return_value.info = INFO | {"regularMarketPrice": 410.0, "sector": "Changed"}
+        result = download_ticker_information("MSFT")
+
+    assert_that(ticker_mock.call_count, equal_to(2))
+    assert_that(result, has_properties(sector="Technology", market_price=410.0))
+
+
+@pytest.mark.asyncio
+async def test_given_unknown_ticker_when_fetch_ticker_information_twice_then_downloads_once() -> None:
+    """Test that an unknown ticker is remembered instead of being downloaded again."""
+    with patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.Ticker") as ticker_mock:
+        ticker_mock.return_value.info = {"trailingPegRatio": None}
+        first = await fetch_ticker_information("UNKNOWN")
+        second = await fetch_ticker_information("unknown")
+
+    ticker_mock.assert_called_once()
+    assert_that(first, is_(instance_of(Error)))
+    assert_that(second, equal_to(first))
+
+
+@pytest.mark.asyncio
+async def test_given_unknown_ticker_information_when_find_price_error_then_returns_none() -> None:
+    """Test that a missing information payload does not block the price requests of the ticker."""
+    with patch("technical_analysis_mcp.providers.yahoo_finance_provider.yf.Ticker") as ticker_mock:
+        ticker_mock.return_value.info = {"trailingPegRatio": None}
+        await fetch_ticker_information("AAPL")
+
+    assert_that(find_error("AAPL", "1mo", "1d"), is_(none()))